@@ -7,6 +7,7 @@ import os
 import sys
 from datetime import datetime, date
 import psycopg2
+from psycopg2.extras import execute_values
 
 
 # DB 연결 설정
@@ -18,6 +19,9 @@ DB_CONFIG = {
     'password': os.environ['DB_PASSWORD']
 }
 
+# 감성 분석 결과 일괄 업데이트 단위
+UPDATE_BATCH_SIZE = 1000
+
 
 def get_db_connection():
     """DB 연결"""
@@ -104,17 +108,25 @@ def get_mentions_with_context(conn):
         return cur.fetchall()
 
 
-def update_mention_sentiment(conn, mention_id, sentiment, score, is_recommended):
-    """멘션 감성 분석 결과 업데이트"""
+def update_mentions_sentiment(conn, rows):
+    """
+    멘션 감성 분석 결과 일괄 업데이트 (UPDATE 1회 + 커밋 1회)
+
+    rows: [(mention_id, sentiment, score, is_recommended), ...]
+    """
+    if not rows:
+        return
+
     with conn.cursor() as cur:
-        cur.execute("""
-            UPDATE teacher_mentions
-            SET sentiment = %s,
-                sentiment_score = %s,
-                is_recommended = %s,
+        execute_values(cur, """
+            UPDATE teacher_mentions AS tm
+            SET sentiment = v.sentiment,
+                sentiment_score = v.score,
+                is_recommended = v.is_recommended,
                 analyzed_at = NOW()
-            WHERE id = %s
-        """, (sentiment, score, is_recommended, mention_id))
+            FROM (VALUES %s) AS v(id, sentiment, score, is_recommended)
+            WHERE tm.id = v.id
+        """, rows, template="(%s, %s, %s::double precision, %s::boolean)", page_size=len(rows))
     conn.commit()
 
 
@@ -209,6 +221,7 @@ def main():
 
         results = {'POSITIVE': 0, 'NEGATIVE': 0, 'NEUTRAL': 0}
         sample_results = []
+        pending_updates = []
 
         for mention_id, teacher_id, context, title, content, teacher_name in mentions:
             # 분석할 텍스트 준비 (컨텍스트 + 제목 + 본문)
@@ -220,8 +233,11 @@ def main():
             # 추천 여부 판단
             is_recommended = any(kw in analysis_text for kw in ['추천', '강추', '들어라', '필수'])
 
-            # DB 업데이트
-            update_mention_sentiment(conn, mention_id, sentiment, score, is_recommended)
+            # DB 업데이트 (배치 단위)
+            pending_updates.append((mention_id, sentiment, score, is_recommended))
+            if len(pending_updates) >= UPDATE_BATCH_SIZE:
+                update_mentions_sentiment(conn, pending_updates)
+                pending_updates = []
 
             results[sentiment] += 1
 
@@ -236,6 +252,8 @@ def main():
                     'context': (context or '')[:50]
                 })
 
+        update_mentions_sentiment(conn, pending_updates)
+
         print(f"    긍정: {results['POSITIVE']}건")
         print(f"    부정: {results['NEGATIVE']}건")
         print(f"    중립: {results['NEUTRAL']}건")
@@ -9,11 +9,15 @@ setup(
     description="TeacherHub AI Crawler - 강사 평판 분석 시스템",
     author="bluevlad",
     packages=find_packages(),
+    package_data={"src.benchmark": ["fixtures/*/*"]},
     python_requires=">=3.10",
     install_requires=[
         "playwright>=1.40.0",
         "beautifulsoup4>=4.12.0",
+        "httpx>=0.27.0",
+        "cryptography>=42.0.0",
         "lxml>=4.9.0",
+        "numpy>=1.24.0",
         "sqlalchemy>=2.0.0",
         "psycopg2-binary>=2.9.0",
         "apscheduler>=3.10.0",
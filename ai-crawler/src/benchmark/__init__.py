@@ -0,0 +1,8 @@
+"""
+TeacherHub Crawl Benchmark Package
+"""
+from .stub_site import StubSite
+from .crawl_benchmark import CrawlBenchmark
+from .parse_benchmark import ParseBenchmark
+
+__all__ = ['StubSite', 'CrawlBenchmark', 'ParseBenchmark']
@@ -0,0 +1,401 @@
+"""
+Crawl Benchmark
+로컬 스텁 사이트 대상 크롤러 처리량/지연/자원 사용량 측정
+"""
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import time
+from contextlib import aclosing
+from datetime import datetime
+from importlib import metadata
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from ..crawlers import BaseCrawler, BrowserPool, DCInsideCrawler, NaverCafeCrawler
+from ..crawlers.resource_policy import ResourcePolicy
+from .stub_site import StubSite
+
+logger = logging.getLogger(__name__)
+
+_CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def _child_process_usage() -> Optional[Dict[int, tuple]]:
+    """
+    현재 프로세스의 하위 프로세스(Playwright 드라이버, Chromium)별 (누적 CPU 초, RSS MB)
+
+    Linux /proc 기준이며, 지원하지 않는 환경에서는 None 반환
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    parents: Dict[int, int] = {}
+    usage: Dict[int, tuple] = {}
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # comm 에 공백이 있을 수 있어 마지막 ')' 이후만 분리
+                fields = f.read().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        pid = int(entry)
+        parents[pid] = int(fields[1])
+        cpu_sec = (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+        rss_mb = int(fields[21]) * _PAGE_SIZE / (1024 * 1024)
+        usage[pid] = (cpu_sec, rss_mb)
+
+    children: Dict[int, List[int]] = {}
+    for pid, ppid in parents.items():
+        children.setdefault(ppid, []).append(pid)
+
+    descendants = {}
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        descendants[pid] = usage[pid]
+        stack.extend(children.get(pid, []))
+
+    return descendants
+
+
+class _ResourceSampler:
+    """브라우저(하위 프로세스) CPU/메모리 주기 샘플링"""
+
+    def __init__(self, interval_sec: float):
+        self.interval_sec = interval_sec
+        self._baseline: Dict[int, float] = {}
+        self._cpu: Dict[int, float] = {}
+        self._rss_samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def _sample(self):
+        usage = _child_process_usage()
+        if usage is None:
+            return
+        for pid, (cpu_sec, _) in usage.items():
+            self._cpu[pid] = cpu_sec
+        self._rss_samples.append(sum(rss for _, rss in usage.values()))
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            self._sample()
+
+    def start(self):
+        usage = _child_process_usage() or {}
+        self._baseline = {pid: cpu_sec for pid, (cpu_sec, _) in usage.items()}
+        self._task = asyncio.ensure_future(self._loop())
+
+    async def stop(self) -> Dict[str, Optional[float]]:
+        """샘플링 종료 후 {'browser_cpu_sec', 'browser_rss_peak_mb', 'browser_rss_avg_mb'} 반환"""
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._sample()
+
+        if not self._rss_samples:
+            return {'browser_cpu_sec': None, 'browser_rss_peak_mb': None, 'browser_rss_avg_mb': None}
+
+        # 측정 중 종료된 프로세스는 마지막 샘플까지만 반영됨
+        cpu_sec = sum(cpu - self._baseline.get(pid, 0.0) for pid, cpu in self._cpu.items())
+        return {
+            'browser_cpu_sec': round(cpu_sec, 3),
+            'browser_rss_peak_mb': round(max(self._rss_samples), 1),
+            'browser_rss_avg_mb': round(sum(self._rss_samples) / len(self._rss_samples), 1)
+        }
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """백분위수 (nearest-rank)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return round(ordered[rank - 1], 1)
+
+
+class CrawlBenchmark:
+    """
+    크롤러 벤치마크
+
+    StubSite 를 대상으로 실제 크롤러의 stream() 을 끝까지 실행하고, 게시글 상세
+    크롤링(_crawl_detail / _crawl_detail_http / _crawl_detail_api) 1건 단위 지연, 페이지 처리량,
+    브라우저 프로세스 CPU/메모리를 측정한다. 결과 JSON 을 릴리스 간 compare() 로
+    비교하면 safe_goto, 상세 크롤링, 파싱 경로의 성능/결과 회귀가 드러난다.
+    """
+
+    TARGETS = ('dcinside_http', 'dcinside_browser', 'naver_cafe_api', 'naver_cafe_browser')
+
+    # 브라우저를 쓰지 않는 대상
+    HTTP_TARGETS = ('dcinside_http', 'naver_cafe_api')
+
+    # 자원 사용량 샘플링 간격
+    SAMPLE_INTERVAL_SEC = 0.2
+
+    # 결과 저장 기본 디렉터리
+    RESULTS_DIR = os.getenv("BENCH_RESULTS_DIR", "benchmark_results")
+
+    # 비교 지표 -> 값이 클수록 좋은지 여부
+    COMPARED_METRICS = {
+        'pages_per_sec': True,
+        'articles_per_sec': True,
+        'latency_p50_ms': False,
+        'latency_p95_ms': False,
+        'crawler_cpu_sec': False,
+        'browser_cpu_sec': False,
+        'browser_rss_peak_mb': False,
+    }
+
+    # 파싱 결과 지표 (값이 달라지면 변화율과 관계없이 회귀)
+    EXACT_METRICS = ('articles', 'comments')
+
+    def __init__(
+        self,
+        site: StubSite,
+        limit: int = 50,
+        keyword: str = None,
+        rate: float = None,
+        concurrency: int = None,
+        block_resources: bool = None
+    ):
+        """
+        Args:
+            site: 실행 중인 스텁 사이트
+            limit: 대상별 최대 게시글 수
+            keyword: 검색 키워드 (None 이면 최신글 경로)
+            rate: 호스트당 초당 요청 수 (None 이면 크롤러 기본값)
+            concurrency: 상세 페이지 동시 탭/요청 수 (None 이면 크롤러 기본값)
+            block_resources: 브라우저 리소스 차단 사용 여부 (None 이면 환경변수 설정)
+        """
+        self.site = site
+        self.limit = limit
+        self.keyword = keyword
+        self.rate = rate
+        self.concurrency = concurrency
+        self.block_resources = block_resources
+
+    def _build_crawler(self, target: str) -> BaseCrawler:
+        """대상 이름으로 스텁 사이트를 향한 크롤러 생성"""
+        if target == 'dcinside_http':
+            crawler = DCInsideCrawler('gongmuwon', 'bench_dcinside', fetch_mode='http', host=self.site.url)
+        elif target == 'dcinside_browser':
+            crawler = DCInsideCrawler('gongmuwon', 'bench_dcinside', fetch_mode='browser', host=self.site.url)
+        elif target == 'naver_cafe_api':
+            crawler = NaverCafeCrawler(
+                'gongstar', 'bench_naver_cafe', host=self.site.url, fetch_mode='api', api_host=self.site.url
+            )
+        elif target == 'naver_cafe_browser':
+            crawler = NaverCafeCrawler('gongstar', 'bench_naver_cafe', host=self.site.url, fetch_mode='browser')
+        else:
+            raise ValueError(f"Unknown benchmark target: {target}")
+
+        if self.rate:
+            crawler.HOST_RATE_PER_SEC = self.rate
+            crawler.HOST_BURST = max(1, int(self.rate))
+        if self.concurrency:
+            crawler.DETAIL_CONCURRENCY = self.concurrency
+        crawler.resource_policy = ResourcePolicy(enabled=self.block_resources)
+
+        return crawler
+
+    @staticmethod
+    def _timed(fn: Callable[..., Awaitable[Any]], latencies: List[float]) -> Callable[..., Awaitable[Any]]:
+        """비동기 함수 실행 시간(ms)을 latencies 에 기록하는 래퍼"""
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+        return wrapper
+
+    async def run_target(self, target: str) -> Dict[str, Any]:
+        """대상 1개 실행 및 지표 반환"""
+        crawler = self._build_crawler(target)
+
+        # 상세 1건 지연 (브라우저/HTTP 상세 경로 모두)
+        latencies: List[float] = []
+        crawler._crawl_detail = self._timed(crawler._crawl_detail, latencies)
+        if isinstance(crawler, DCInsideCrawler):
+            crawler._crawl_detail_http = self._timed(crawler._crawl_detail_http, latencies)
+        if isinstance(crawler, NaverCafeCrawler):
+            crawler._crawl_detail_api = self._timed(crawler._crawl_detail_api, latencies)
+
+        if target not in self.HTTP_TARGETS:
+            # 브라우저 기동 시간은 측정에서 제외
+            pool = BrowserPool.shared()
+            await pool.release_context(await pool.acquire_context(headless=True))
+
+        self.site.reset_stats()
+        sampler = _ResourceSampler(self.SAMPLE_INTERVAL_SEC)
+        sampler.start()
+
+        articles = comments = 0
+        first_article_sec = None
+        started = time.perf_counter()
+        cpu_started = time.thread_time()  # 이벤트 루프 스레드만 (스텁 서버 스레드 제외)
+
+        try:
+            async with aclosing(crawler.stream(keyword=self.keyword, limit=self.limit)) as posts:
+                async for post in posts:
+                    articles += 1
+                    comments += len(post.get('comments') or [])
+                    if first_article_sec is None:
+                        first_article_sec = time.perf_counter() - started
+        finally:
+            elapsed = time.perf_counter() - started
+            crawler_cpu_sec = time.thread_time() - cpu_started
+            resources = await sampler.stop()
+
+        served = self.site.snapshot()
+
+        return {
+            'articles': articles,
+            'comments': comments,
+            'elapsed_sec': round(elapsed, 3),
+            'first_article_sec': round(first_article_sec, 3) if first_article_sec is not None else None,
+            'pages': served['pages'],
+            'assets': served['assets'],
+            'bytes_served': served['bytes'],
+            'requests_blocked': crawler.resource_stats.blocked,
+            'errors_injected': served['errors_injected'],
+            'pages_per_sec': round(served['pages'] / elapsed, 2) if elapsed else None,
+            'articles_per_sec': round(articles / elapsed, 2) if elapsed else None,
+            'latency_p50_ms': _percentile(latencies, 50),
+            'latency_p95_ms': _percentile(latencies, 95),
+            'latency_max_ms': round(max(latencies), 1) if latencies else None,
+            'crawler_cpu_sec': round(crawler_cpu_sec, 3),
+            'wait_sec': round(crawler.timer.wait_sec, 3),
+            'work_sec': round(crawler.timer.work_sec, 3),
+            **resources
+        }
+
+    async def run(self, targets: Iterable[str] = None) -> Dict[str, Any]:
+        """
+        대상별 순차 실행
+
+        실패한 대상은 {'error': 메시지} 로 기록하고 다음 대상으로 진행한다.
+
+        Returns:
+            {'created_at', 'environment', 'config', 'results': {대상: 지표}}
+        """
+        results = {}
+        for target in targets or self.TARGETS:
+            logger.info(f"Benchmarking {target}...")
+            try:
+                results[target] = await self.run_target(target)
+            except Exception as e:
+                logger.error(f"Benchmark {target} failed: {e}")
+                results[target] = {'error': str(e)}
+
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'environment': self._environment(),
+            'config': {
+                'limit': self.limit,
+                'keyword': self.keyword,
+                'rate': self.rate,
+                'concurrency': self.concurrency,
+                'block_resources': ResourcePolicy(enabled=self.block_resources).enabled,
+                'latency_ms': self.site.latency_ms,
+                'jitter_ms': self.site.jitter_ms,
+                'error_rate': self.site.error_rate,
+                'error_status': self.site.error_status
+            },
+            'results': results
+        }
+
+    @staticmethod
+    def _environment() -> Dict[str, Optional[str]]:
+        """실행 환경 (결과 비교 시 참고)"""
+        try:
+            playwright_version = metadata.version('playwright')
+        except metadata.PackageNotFoundError:
+            playwright_version = None
+
+        return {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'playwright': playwright_version
+        }
+
+    @classmethod
+    def save(cls, result: Dict[str, Any], path: str = None) -> str:
+        """결과 JSON 저장 (기본: RESULTS_DIR/crawl_<시각>.json), 저장 경로 반환"""
+        if path is None:
+            path = os.path.join(cls.RESULTS_DIR, f"crawl_{datetime.now():%Y%m%d_%H%M%S}.json")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+        return path
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        """저장된 결과 JSON 로드"""
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    @classmethod
+    def compare(
+        cls,
+        baseline: Dict[str, Any],
+        current: Dict[str, Any],
+        threshold: float = 0.2
+    ) -> List[Dict[str, Any]]:
+        """
+        기준 결과 대비 회귀 목록
+
+        Args:
+            baseline: 기준(이전 릴리스) 결과
+            current: 현재 결과
+            threshold: 허용 변화율 (0.2 = 20% 악화까지 허용)
+
+        Returns:
+            [{'target', 'metric', 'baseline', 'current', 'change'}, ...]
+        """
+        regressions = []
+
+        for target, metrics in current.get('results', {}).items():
+            base = baseline.get('results', {}).get(target)
+            if not base or 'error' in base:
+                continue
+
+            if 'error' in metrics:
+                regressions.append({
+                    'target': target, 'metric': 'error',
+                    'baseline': None, 'current': metrics['error'], 'change': None
+                })
+                continue
+
+            for metric in cls.EXACT_METRICS:
+                if metrics.get(metric) != base.get(metric):
+                    regressions.append({
+                        'target': target, 'metric': metric,
+                        'baseline': base.get(metric), 'current': metrics.get(metric), 'change': None
+                    })
+
+            for metric, higher_is_better in cls.COMPARED_METRICS.items():
+                old, new = base.get(metric), metrics.get(metric)
+                if not old or new is None:
+                    continue
+
+                change = (new - old) / old
+                if (change < -threshold) if higher_is_better else (change > threshold):
+                    regressions.append({
+                        'target': target, 'metric': metric,
+                        'baseline': old, 'current': new, 'change': round(change, 3)
+                    })
+
+        return regressions
@@ -0,0 +1,112 @@
+"""
+Parse Benchmark
+저장된 목록/상세 페이지 기준 HTML 파서 엔진·부분 파싱별 시간/메모리 측정
+"""
+import gc
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..crawlers import DCInsideCrawler, NaverCafeCrawler
+from ..crawlers.html_parser import ENGINES, HAS_LXML, HtmlParser
+from .stub_site import FIXTURES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ParseBenchmark:
+    """
+    HTML 파싱 마이크로 벤치마크
+
+    크롤러가 실제로 파싱하는 목록/상세 페이지(fixtures 또는 실제 페이지 저장본)를 엔진
+    (lxml / html.parser) × 범위(문서 전체 / 크롤러 targets 부분 트리) 조합으로 파싱해
+    페이지당 시간(중앙값)과 메모리(tracemalloc 최대치)를 잰다. 메모리는 파이썬 객체
+    (BeautifulSoup 트리) 기준이며, lxml 내부 C 버퍼는 파싱 직후 해제되므로 포함하지 않는다.
+    """
+
+    # 페이지 이름 -> (fixture 파일, 크롤러가 쓰는 targets)
+    PAGES: Dict[str, Tuple[str, Sequence[str]]] = {
+        'dcinside_list': ('dcinside/list.html', DCInsideCrawler.LIST_TARGETS),
+        'dcinside_view': ('dcinside/view.html', DCInsideCrawler.DETAIL_TARGETS),
+        'naver_cafe_list': ('naver_cafe/list.html', NaverCafeCrawler.LIST_TARGETS),
+        'naver_cafe_article': ('naver_cafe/article.html', NaverCafeCrawler.DETAIL_TARGETS),
+    }
+
+    SCOPES = ('full', 'subtree')
+
+    def __init__(self, repeat: int = 20, fixtures_dir: str = None):
+        """
+        Args:
+            repeat: 조합별 반복 파싱 횟수 (시간 중앙값 계산용)
+            fixtures_dir: fixture 디렉터리 (기본: 패키지 내 fixtures)
+        """
+        self.repeat = max(1, repeat)
+        self.fixtures_dir = fixtures_dir or FIXTURES_DIR
+
+    @staticmethod
+    def engines() -> List[str]:
+        """설치된 엔진 목록"""
+        return [engine for engine in ENGINES if engine != 'lxml' or HAS_LXML]
+
+    def _read(self, name: str) -> str:
+        with open(os.path.join(self.fixtures_dir, name), encoding='utf-8') as f:
+            return f.read()
+
+    def _measure(self, parser: HtmlParser, markup: str, targets: Optional[Sequence[str]]) -> Dict[str, Any]:
+        """파싱 1조합 측정"""
+        times = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            parser.parse(markup, targets)
+            times.append((time.perf_counter() - started) * 1000)
+
+        # 메모리는 시간 측정과 분리 (tracemalloc 이 파싱을 느리게 함)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            soup = parser.parse(markup, targets)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'parse_ms': round(statistics.median(times), 3),
+            'peak_kb': round(peak / 1024, 1),
+            'nodes': sum(1 for _ in soup.descendants)
+        }
+
+    def run(self, pages: Iterable[str] = None) -> Dict[str, Any]:
+        """
+        페이지별 전 조합 실행
+
+        Returns:
+            {'created_at', 'config', 'results': {페이지: {'bytes', '<엔진>/<범위>': 지표}}}
+        """
+        results = {}
+        for page in pages or self.PAGES:
+            fixture, targets = self.PAGES[page]
+            markup = self._read(fixture)
+            metrics: Dict[str, Any] = {'bytes': len(markup.encode('utf-8'))}
+
+            for engine in self.engines():
+                parser = HtmlParser(engine)
+                for scope in self.SCOPES:
+                    metrics[f"{engine}/{scope}"] = self._measure(
+                        parser, markup, targets if scope == 'subtree' else None
+                    )
+
+            results[page] = metrics
+
+        return {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'config': {
+                'repeat': self.repeat,
+                'engines': self.engines(),
+                'fixtures_dir': self.fixtures_dir
+            },
+            'results': results
+        }
@@ -0,0 +1,235 @@
+"""
+Stub Site
+고정 HTML 을 응답하는 로컬 HTTP 서버 (크롤러 벤치마크용 DCInside / 네이버 카페 대역)
+"""
+import logging
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class StubSite:
+    """
+    크롤러 벤치마크용 로컬 사이트
+
+    목록/상세 경로에 fixtures 디렉터리의 고정 HTML 을 응답한다. 상세 페이지는
+    게시글 번호와 무관하게 같은 문서를 돌려준다. 네이버 카페 JSON API(목록/게시글/댓글)도
+    저장된 JSON 으로 응답한다. 응답마다 지연(latency_ms ± jitter_ms)을
+    넣고, 상세/댓글 요청 중 error_rate 비율만큼 오류를 주입한다(error_status=0 이면
+    응답 없이 연결 종료). 목록 페이지에는 오류를 넣지 않아 실행마다 처리량이 비교 가능하다.
+    CSS/이미지 등 정적 리소스는 작은 더미 본문으로 응답한다.
+    """
+
+    # 경로 -> (fixture 파일, Content-Type, 오류 주입 대상 여부)
+    ROUTES: Dict[str, Tuple[str, str, bool]] = {
+        '/board/lists/': ('dcinside/list.html', 'text/html; charset=UTF-8', False),
+        '/mgallery/board/lists/': ('dcinside/list.html', 'text/html; charset=UTF-8', False),
+        '/mini/board/lists/': ('dcinside/list.html', 'text/html; charset=UTF-8', False),
+        '/board/view/': ('dcinside/view.html', 'text/html; charset=UTF-8', True),
+        '/mgallery/board/view/': ('dcinside/view.html', 'text/html; charset=UTF-8', True),
+        '/mini/board/view/': ('dcinside/view.html', 'text/html; charset=UTF-8', True),
+        '/board/comment/': ('dcinside/comments.json', 'application/json; charset=UTF-8', True),
+        '/ArticleList.nhn': ('naver_cafe/list.html', 'text/html; charset=UTF-8', False),
+        '/ArticleSearchList.nhn': ('naver_cafe/list.html', 'text/html; charset=UTF-8', False),
+        '/ArticleRead.nhn': ('naver_cafe/article.html', 'text/html; charset=UTF-8', True),
+        '/cafe-web/cafe2/CafeGateInfo.json': ('naver_cafe/api_cafe_info.json', 'application/json; charset=UTF-8', False),
+        '/cafe-web/cafe2/ArticleListV2dot1.json': ('naver_cafe/api_article_list.json', 'application/json; charset=UTF-8', False),
+        '/cafe-web/cafe-mobile/CafeMobileWebArticleSearchListV4': (
+            'naver_cafe/api_search_list.json', 'application/json; charset=UTF-8', False
+        ),
+    }
+
+    # 경로 패턴 -> (fixture 파일, Content-Type, 오류 주입 대상 여부) (ROUTES 에 없을 때 순서대로 검사)
+    PATTERN_ROUTES: List[Tuple[Pattern, Tuple[str, str, bool]]] = [
+        (re.compile(r'^/cafe-web/cafe-articleapi/v2\.1/cafes/\d+/articles/\d+$'),
+         ('naver_cafe/api_article.json', 'application/json; charset=UTF-8', True)),
+        (re.compile(r'^/cafe-web/cafe-articleapi/v2\.1/cafes/\d+/articles/\d+/comments/pages/\d+$'),
+         ('naver_cafe/api_comments.json', 'application/json; charset=UTF-8', True)),
+    ]
+
+    # 정적 리소스 확장자 -> (Content-Type, 더미 본문 크기)
+    ASSET_TYPES = {
+        '.css': ('text/css', 4 * 1024),
+        '.js': ('application/javascript', 16 * 1024),
+        '.png': ('image/png', 48 * 1024),
+        '.jpg': ('image/jpeg', 64 * 1024),
+        '.gif': ('image/gif', 8 * 1024),
+        '.woff2': ('font/woff2', 32 * 1024),
+    }
+
+    def __init__(
+        self,
+        latency_ms: int = 0,
+        jitter_ms: int = 0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        seed: int = 0,
+        fixtures_dir: str = None
+    ):
+        """
+        Args:
+            latency_ms: 응답 지연 (ms)
+            jitter_ms: 지연 편차 (±ms, 균등 분포)
+            error_rate: 상세/댓글 요청 오류 주입 비율 (0~1)
+            error_status: 주입할 HTTP 상태 코드 (0이면 연결 종료)
+            seed: 지연/오류 난수 시드 (실행 간 재현용)
+            fixtures_dir: fixture 디렉터리 (기본: 패키지 내 fixtures, 실제 페이지 저장본으로 교체 가능)
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fixtures_dir = fixtures_dir or FIXTURES_DIR
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, bytes] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        """서버 기본 URL (http://127.0.0.1:<port>)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """백그라운드 스레드에서 서버 시작 (빈 포트 자동 선택), 기본 URL 반환"""
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-site', daemon=True)
+        self._thread.start()
+        logger.info(f"Stub site listening on {self.url}")
+        return self.url
+
+    def stop(self):
+        """서버 종료"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def reset_stats(self):
+        """요청 통계 초기화"""
+        with self._lock:
+            self.stats = {'requests': 0, 'pages': 0, 'assets': 0, 'errors_injected': 0, 'not_found': 0, 'bytes': 0}
+
+    def snapshot(self) -> Dict[str, int]:
+        """요청 통계 사본"""
+        with self._lock:
+            return dict(self.stats)
+
+    def _count(self, key: str, size: int = 0):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats[key] += 1
+            self.stats['bytes'] += size
+
+    def _fixture(self, name: str) -> bytes:
+        """fixture 파일 내용 (최초 1회 읽어 캐시)"""
+        body = self._cache.get(name)
+        if body is None:
+            with open(os.path.join(self.fixtures_dir, name), 'rb') as f:
+                body = f.read()
+            self._cache[name] = body
+        return body
+
+    def _delay_sec(self) -> float:
+        """응답 지연 (초)"""
+        with self._lock:
+            jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _should_fail(self) -> bool:
+        """오류 주입 여부"""
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _route(self, path: str) -> Optional[Tuple[str, str, bool]]:
+        """경로에 해당하는 (fixture, Content-Type, 오류 주입 여부)"""
+        route = self.ROUTES.get(path)
+        if route is None:
+            for pattern, candidate in self.PATTERN_ROUTES:
+                if pattern.match(path):
+                    return candidate
+        return route
+
+    def _handler_class(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive (HTTP 클라이언트 커넥션 풀 재사용)
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                self._respond()
+
+            def _respond(self):
+                path = urlparse(self.path).path
+                route = site._route(path)
+
+                if route is None:
+                    asset = site.ASSET_TYPES.get(os.path.splitext(path)[1])
+                    if asset is None:
+                        site._count('not_found')
+                        self._send(404, 'text/plain', b'not found')
+                        return
+                    content_type, size = asset
+                    site._count('assets', size)
+                    self._send(200, content_type, b'\0' * size)
+                    return
+
+                fixture, content_type, inject_errors = route
+                time.sleep(site._delay_sec())
+
+                if inject_errors and site._should_fail():
+                    site._count('errors_injected')
+                    if site.error_status == 0:
+                        self.close_connection = True
+                        return
+                    self._send(site.error_status, 'text/plain', b'injected error')
+                    return
+
+                body = site._fixture(fixture)
+                site._count('pages', len(body))
+                self._send(200, content_type, body)
+
+            def _send(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # 요청 로그는 통계로 대신함
+                pass
+
+        return Handler
@@ -17,6 +17,16 @@ from .scheduler import TaskScheduler
 logger = logging.getLogger(__name__)
 
 
+async def _run_and_close_browser(coro):
+    """크롤링 코루틴 실행 후 공유 브라우저 종료"""
+    from .crawlers import close_browser_pool
+
+    try:
+        return await coro
+    finally:
+        await close_browser_pool()
+
+
 def cmd_crawl(args):
     """크롤링 명령 실행"""
     logger.info("TeacherHub Crawler starting")
@@ -40,18 +50,18 @@ def cmd_crawl(args):
                 logger.error(f"Unknown source: {args.source}")
                 return
 
-            result = asyncio.run(orchestrator.crawl_source(
+            result = asyncio.run(_run_and_close_browser(orchestrator.crawl_source(
                 source,
                 keyword=args.keyword,
                 limit=args.limit
-            ))
+            )))
             logger.info(f"Result: {result}")
         else:
             # 전체 소스 크롤링
-            results = asyncio.run(orchestrator.crawl_all_sources(
+            results = asyncio.run(_run_and_close_browser(orchestrator.crawl_all_sources(
                 keyword=args.keyword,
                 limit=args.limit
-            ))
+            )))
 
     finally:
         db.close()
@@ -106,6 +116,191 @@ def cmd_report(args):
         db.close()
 
 
+def cmd_rescore(args):
+    """멘션 감성 재분석 명령 (키워드/가중치 변경 후 백필)"""
+    from .services.sentiment_analyzer import SentimentAnalyzer
+    from .services.sentiment_batch import BatchSentimentScorer
+
+    logger.info("TeacherHub Sentiment Rescore starting")
+
+    db = SessionLocal()
+    try:
+        analyzer = SentimentAnalyzer(db)
+        analyzer.load_keywords()
+
+        scorer = BatchSentimentScorer(analyzer)
+        total = scorer.rescore_mentions(
+            db,
+            chunk_size=args.chunk_size,
+            only_unanalyzed=args.only_unanalyzed
+        )
+        logger.info(f"Rescored {total} mentions")
+
+    finally:
+        db.close()
+
+
+def cmd_reextract(args):
+    """멘션 재추출 명령 (강사 사전 변경 후 과거 게시글 재처리)"""
+    from .services.mention_reextractor import MentionReextractor
+
+    logger.info("TeacherHub Mention Re-extraction starting")
+
+    db = SessionLocal()
+    try:
+        source_id = None
+        if args.source:
+            from .models import CollectionSource
+            source = db.query(CollectionSource).filter(
+                CollectionSource.code == args.source
+            ).first()
+
+            if not source:
+                logger.error(f"Unknown source: {args.source}")
+                return
+            source_id = source.id
+
+        reextractor = MentionReextractor(db, workers=args.workers, chunk_size=args.chunk_size)
+        stats = reextractor.run(from_id=args.from_id, to_id=args.to_id, source_id=source_id)
+        logger.info(f"Result: {stats}")
+
+    finally:
+        db.close()
+
+
+def cmd_refresh_stats(args):
+    """통계 집계 갱신 명령 (구체화 뷰 갱신, 필요 시 일자 집계 재계산)"""
+    from .services.teacher_stats import TeacherStatsService
+
+    db = SessionLocal()
+    try:
+        service = TeacherStatsService(db)
+
+        if args.rebuild:
+            since = datetime.strptime(args.since, "%Y-%m-%d").date() if args.since else None
+            service.rebuild_daily_rollup(since)
+
+        count = service.refresh_views(concurrently=not args.blocking)
+        logger.info(f"Refreshed {count} materialized views")
+
+    finally:
+        db.close()
+
+
+def cmd_partitions(args):
+    """월별 파티션 유지보수 명령 (미래 파티션 생성, 보관 기간이 지난 파티션 분리)"""
+    from .services.partition_manager import PartitionManager
+
+    db = SessionLocal()
+    try:
+        result = PartitionManager(db).run_maintenance(
+            months_ahead=args.ahead,
+            retention_months=args.retention,
+            drop=args.drop
+        )
+        logger.info(
+            f"Partitions: {result['created']} created, {result['archived']} months archived, "
+            f"{result['default_rows']} posts in default partition"
+        )
+
+    finally:
+        db.close()
+
+
+def cmd_check_plans(args):
+    """리포트 쿼리 실행 계획 점검 (설정된 서버의 임시 DB 에서 실행, 순차 스캔 발견 시 종료 코드 1)"""
+    from .database import DATABASE_URL, scratch_database
+    from .services.query_plan_checker import QueryPlanChecker
+
+    with scratch_database(args.url or DATABASE_URL, prefix="plan_check") as engine:
+        violations = QueryPlanChecker(engine).run()
+
+    for v in violations:
+        logger.error(f"Sequential scan on {v['table']} in {v['query']}: {v['statement'][:200]}")
+
+    if violations:
+        raise SystemExit(1)
+
+    logger.info("All report queries use index access paths")
+
+
+def cmd_bench(args):
+    """크롤러 벤치마크 명령 (로컬 스텁 사이트, 기준 결과 대비 회귀 시 종료 코드 1)"""
+    from .benchmark import CrawlBenchmark, StubSite
+
+    site = StubSite(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+        fixtures_dir=args.fixtures
+    )
+
+    with site:
+        benchmark = CrawlBenchmark(
+            site,
+            limit=args.limit,
+            keyword=args.keyword,
+            rate=args.rate,
+            concurrency=args.concurrency,
+            block_resources=False if args.no_block_resources else None
+        )
+        result = asyncio.run(_run_and_close_browser(benchmark.run(args.target)))
+
+    for target, metrics in result['results'].items():
+        if 'error' in metrics:
+            logger.error(f"{target}: {metrics['error']}")
+            continue
+        logger.info(
+            f"{target}: {metrics['articles']} articles, {metrics['pages_per_sec']} pages/s, "
+            f"p50 {metrics['latency_p50_ms']}ms, p95 {metrics['latency_p95_ms']}ms, "
+            f"cpu {metrics['crawler_cpu_sec']}s (browser {metrics['browser_cpu_sec']}s), "
+            f"browser rss peak {metrics['browser_rss_peak_mb']}MB, "
+            f"{metrics['requests_blocked']} requests blocked"
+        )
+
+    path = CrawlBenchmark.save(result, args.output)
+    logger.info(f"Saved benchmark result: {path}")
+
+    if args.baseline:
+        baseline = CrawlBenchmark.load(args.baseline)
+        if baseline.get('config') != result['config']:
+            logger.warning("Baseline was run with a different configuration")
+
+        regressions = CrawlBenchmark.compare(baseline, result, threshold=args.threshold)
+        for r in regressions:
+            logger.error(f"Regression in {r['target']} {r['metric']}: {r['baseline']} -> {r['current']}")
+
+        if regressions:
+            raise SystemExit(1)
+
+        logger.info(f"No regressions against {args.baseline}")
+
+
+def cmd_bench_parse(args):
+    """HTML 파싱 벤치마크 명령 (엔진 / 부분 트리 파싱별 페이지당 시간, 메모리)"""
+    from .benchmark import CrawlBenchmark, ParseBenchmark
+
+    benchmark = ParseBenchmark(repeat=args.repeat, fixtures_dir=args.fixtures)
+    result = benchmark.run(args.page)
+
+    for page, metrics in result['results'].items():
+        for variant, m in metrics.items():
+            if variant == 'bytes':
+                continue
+            logger.info(
+                f"{page} ({metrics['bytes']} bytes) {variant}: {m['parse_ms']}ms, "
+                f"peak {m['peak_kb']}KB, {m['nodes']} nodes"
+            )
+
+    path = args.output or os.path.join(
+        CrawlBenchmark.RESULTS_DIR, f"parse_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    CrawlBenchmark.save(result, path)
+    logger.info(f"Saved parse benchmark result: {path}")
+
+
 def cmd_status(args):
     """상태 확인 명령"""
     logger.info("TeacherHub Status")
@@ -202,6 +397,64 @@ def main():
     report_parser.add_argument("-t", "--teacher-id", type=int, help="Teacher ID")
     report_parser.add_argument("--summary", action="store_true", help="Show summary")
 
+    # rescore 명령
+    rescore_parser = subparsers.add_parser("rescore", help="Rescore mention sentiment")
+    rescore_parser.add_argument("--chunk-size", type=int, default=2000, help="Mentions per UPDATE")
+    rescore_parser.add_argument("--only-unanalyzed", action="store_true", help="Only mentions without sentiment")
+
+    # reextract 명령
+    reextract_parser = subparsers.add_parser("reextract", help="Re-extract mentions from stored posts")
+    reextract_parser.add_argument("--from-id", type=int, help="First post ID (inclusive)")
+    reextract_parser.add_argument("--to-id", type=int, help="Last post ID (inclusive)")
+    reextract_parser.add_argument("-s", "--source", help="Source code to reprocess")
+    reextract_parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count)")
+    reextract_parser.add_argument("--chunk-size", type=int, default=200, help="Posts per worker task")
+
+    # refresh-stats 명령
+    stats_parser = subparsers.add_parser("refresh-stats", help="Refresh teacher stats views")
+    stats_parser.add_argument("--rebuild", action="store_true", help="Recompute daily mention rollup first")
+    stats_parser.add_argument("--since", help="Rebuild from date (YYYY-MM-DD)")
+    stats_parser.add_argument("--blocking", action="store_true", help="Refresh without CONCURRENTLY")
+
+    # partitions 명령
+    partitions_parser = subparsers.add_parser("partitions", help="Create/archive monthly partitions")
+    partitions_parser.add_argument("--ahead", type=int, help="Months to create ahead")
+    partitions_parser.add_argument("--retention", type=int, help="Months to keep (0: keep all)")
+    partitions_parser.add_argument("--drop", action="store_true", help="Drop old partitions instead of archiving")
+
+    # check-plans 명령
+    check_plans_parser = subparsers.add_parser("check-plans", help="Fail if report queries use sequential scans")
+    check_plans_parser.add_argument("--url", help="PostgreSQL server URL for the scratch database (default: configured DB server)")
+
+    # bench 명령
+    bench_parser = subparsers.add_parser("bench", help="Benchmark crawlers against a local stub site")
+    bench_parser.add_argument("-t", "--target", action="append", choices=["dcinside_http", "dcinside_browser", "naver_cafe_api", "naver_cafe_browser"],
+                              help="Target to run (repeatable, default: all)")
+    bench_parser.add_argument("-l", "--limit", type=int, default=50, help="Max posts per target")
+    bench_parser.add_argument("-k", "--keyword", help="Search keyword (default: latest posts)")
+    bench_parser.add_argument("--latency-ms", type=int, default=50, help="Stub response latency")
+    bench_parser.add_argument("--jitter-ms", type=int, default=20, help="Stub latency jitter (+/-)")
+    bench_parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of detail requests to fail")
+    bench_parser.add_argument("--error-status", type=int, default=500, help="Injected HTTP status (0: drop connection)")
+    bench_parser.add_argument("--seed", type=int, default=0, help="Random seed for latency/errors")
+    bench_parser.add_argument("--rate", type=float, default=50.0, help="Requests/sec per host")
+    bench_parser.add_argument("--concurrency", type=int, help="Concurrent detail fetches")
+    bench_parser.add_argument("--no-block-resources", action="store_true",
+                              help="Load images/fonts/media in browser targets (resource blocking off)")
+    bench_parser.add_argument("--fixtures", help="Fixture directory (default: bundled fixtures)")
+    bench_parser.add_argument("-o", "--output", help="Result JSON path")
+    bench_parser.add_argument("--baseline", help="Previous result JSON to compare against")
+    bench_parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown")
+
+    # bench-parse 명령
+    bench_parse_parser = subparsers.add_parser("bench-parse", help="Benchmark HTML parsing on recorded pages")
+    bench_parse_parser.add_argument("-p", "--page", action="append",
+                                    choices=["dcinside_list", "dcinside_view", "naver_cafe_list", "naver_cafe_article"],
+                                    help="Page to parse (repeatable, default: all)")
+    bench_parse_parser.add_argument("-r", "--repeat", type=int, default=20, help="Parses per variant")
+    bench_parse_parser.add_argument("--fixtures", help="Fixture directory (default: bundled fixtures)")
+    bench_parse_parser.add_argument("-o", "--output", help="Result JSON path")
+
     # status 명령
     status_parser = subparsers.add_parser("status", help="Show status")
 
@@ -218,6 +471,20 @@ def main():
         cmd_crawl(args)
     elif args.command == "report":
         cmd_report(args)
+    elif args.command == "rescore":
+        cmd_rescore(args)
+    elif args.command == "reextract":
+        cmd_reextract(args)
+    elif args.command == "refresh-stats":
+        cmd_refresh_stats(args)
+    elif args.command == "partitions":
+        cmd_partitions(args)
+    elif args.command == "check-plans":
+        cmd_check_plans(args)
+    elif args.command == "bench":
+        cmd_bench(args)
+    elif args.command == "bench-parse":
+        cmd_bench_parse(args)
     elif args.command == "status":
         cmd_status(args)
     elif args.command == "scheduler":
@@ -2,7 +2,8 @@
 TeacherHub Crawlers Package
 """
 from .base import BaseCrawler
+from .browser_pool import BrowserPool, close_browser_pool
 from .naver_cafe import NaverCafeCrawler
 from .dcinside import DCInsideCrawler
 
-__all__ = ['BaseCrawler', 'NaverCafeCrawler', 'DCInsideCrawler']
+__all__ = ['BaseCrawler', 'BrowserPool', 'close_browser_pool', 'NaverCafeCrawler', 'DCInsideCrawler']
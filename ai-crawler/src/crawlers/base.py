@@ -5,14 +5,130 @@ Base Crawler Class
 import asyncio
 import logging
 import random
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import deque
+from contextlib import aclosing, contextmanager
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from urllib.parse import urlparse
+from playwright.async_api import Browser, BrowserContext, Page, Request
+from .browser_pool import BrowserPool
+from .html_parser import HtmlParser, default_parser
+from .resource_policy import ResourcePolicy, ResourceStats
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    토큰 버킷 요청 속도 제한기
+
+    토큰이 음수가 될 수 있으며(선예약), 부족분만큼 대기한다.
+    await 사이에 상태 변경이 없으므로 asyncio 환경에서 락 없이 안전하다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 토큰 충전량 (요청/초)
+            capacity: 최대 버스트 크기
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        """토큰 1개 획득 (필요 시 대기)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class ReadyCondition:
+    """
+    페이지 내용 준비 완료 조건
+
+    selector 가 DOM 에 붙고, response 패턴과 일치하는 요청(댓글 XHR 등)이 끝나면 준비된
+    것으로 본다. 둘 다 지정하면 모두 기다리며, timeout_ms 안에 충족되지 않으면 그 시점의
+    페이지를 그대로 파싱한다.
+    """
+
+    def __init__(self, selector: str = None, response: str = None, timeout_ms: int = 5000):
+        """
+        Args:
+            selector: 내용 요소 CSS 셀렉터 (쉼표로 여러 후보 지정 시 하나만 있으면 충족)
+            response: 완료를 기다릴 요청 URL 정규식
+            timeout_ms: 최대 대기 시간 (ms)
+        """
+        self.selector = selector
+        self.response = re.compile(response) if response else None
+        self.timeout_ms = timeout_ms
+
+
+class _RequestWatch:
+    """페이지 요청 완료 감시 (requestfinished/requestfailed 이벤트)"""
+
+    def __init__(self, page: Page, pattern: re.Pattern):
+        self.page = page
+        self.pattern = pattern
+        self.event = asyncio.Event()
+        page.on("requestfinished", self._on_request)
+        page.on("requestfailed", self._on_request)
+
+    def _on_request(self, request: Request):
+        if self.pattern.search(request.url):
+            self.event.set()
+
+    def detach(self):
+        """이벤트 핸들러 해제"""
+        self.page.remove_listener("requestfinished", self._on_request)
+        self.page.remove_listener("requestfailed", self._on_request)
+
+
+class CrawlTimer:
+    """
+    크롤링 1회의 대기/작업 시간 집계
+
+    목록/상세 요청 1건 단위 경과 시간을 합산하고, 그중 속도 제한·재시도 백오프·준비 대기
+    시간을 대기로 분리한다. 동시 탭/요청은 각각 합산되므로 합계가 크롤링 경과 시간보다
+    클 수 있다.
+    """
+
+    def __init__(self):
+        self.total_sec = 0.0
+        self.wait_sec = 0.0
+
+    @property
+    def work_sec(self) -> float:
+        """요청 처리 시간 중 대기를 뺀 시간 (이동/전송/파싱)"""
+        return max(0.0, self.total_sec - self.wait_sec)
+
+    @contextmanager
+    def request(self):
+        """요청 1건 경과 시간 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.total_sec += time.perf_counter() - started
+
+    @contextmanager
+    def waiting(self):
+        """대기 시간 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.wait_sec += time.perf_counter() - started
+
+
 class BaseCrawler(ABC):
     """크롤러 기본 클래스"""
 
@@ -20,40 +136,75 @@ class BaseCrawler(ABC):
     DESKTOP_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
     MOBILE_UA = "Mozilla/5.0 (Linux; Android 14; SM-S928B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Mobile Safari/537.36"
 
-    def __init__(self, source_code: str, base_url: str):
+    # 상세 페이지 동시 탭 수
+    DETAIL_CONCURRENCY = 4
+
+    # 상세 페이지 준비 완료 조건 (하위 클래스에서 지정, None 이면 domcontentloaded 까지만)
+    DETAIL_READY: Optional[ReadyCondition] = None
+
+    # 호스트별 요청 속도 제한 (프로세스 전체 공유)
+    HOST_RATE_PER_SEC = 1.0
+    HOST_BURST = 2
+    _host_buckets: Dict[str, TokenBucket] = {}
+
+    def __init__(self, source_code: str, base_url: str, resource_policy: ResourcePolicy = None):
+        """
+        Args:
+            source_code: 소스 코드 (DB 저장용)
+            base_url: 사이트 기본 URL
+            resource_policy: 브라우저 요청 차단 정책 (기본: 환경변수 설정 기준)
+        """
         self.source_code = source_code
         self.base_url = base_url
-        self._playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._page_pool_lock = asyncio.Lock()
 
-    async def setup_browser(self, headless: bool = True, mobile: bool = False) -> Page:
-        """브라우저 설정 및 페이지 반환"""
-        self._playwright = await async_playwright().start()
+        # 브라우저 요청 차단 정책 / 집계 (크롤러 인스턴스 = 크롤링 1회)
+        self.resource_policy = resource_policy or ResourcePolicy()
+        self.resource_stats = ResourceStats()
+        self.timer = CrawlTimer()
 
-        self.browser = await self._playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage"
-            ]
-        )
+        # HTML 파서 (HTML_PARSER 환경변수로 엔진 선택)
+        self.parser: HtmlParser = default_parser()
+
+        # 증분 크롤링 상태 (set_watermark 로 설정)
+        self.watermark_id: Optional[int] = None
+        self.known_comment_counts: Dict[str, int] = {}
+        self.known_since: Optional[datetime] = None
+
+    async def setup_browser(
+        self,
+        headless: bool = True,
+        mobile: bool = False,
+        storage_state: Dict[str, Any] = None
+    ) -> Page:
+        """
+        공유 브라우저에서 격리된 컨텍스트를 빌려 페이지 반환
 
+        Args:
+            headless: 헤드리스 브라우저 사용 여부
+            mobile: 모바일 UA/뷰포트 사용 여부
+            storage_state: 복원할 쿠키/localStorage (저장된 로그인 세션)
+        """
         ua = self.MOBILE_UA if mobile else self.DESKTOP_UA
         viewport = {"width": 375, "height": 812} if mobile else {"width": 1920, "height": 1080}
 
-        self.context = await self.browser.new_context(
+        self.context = await BrowserPool.shared().acquire_context(
+            headless=headless,
             user_agent=ua,
             viewport=viewport,
             locale="ko-KR",
             timezone_id="Asia/Seoul",
+            storage_state=storage_state,
             extra_http_headers={
                 "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
             }
         )
+        self.browser = self.context.browser
 
         # Stealth 설정
         await self.context.add_init_script("""
@@ -62,41 +213,259 @@ class BaseCrawler(ABC):
             window.chrome = { runtime: {} };
         """)
 
+        # 이미지/폰트/미디어, 광고/분석 요청 차단
+        if self.resource_policy.enabled:
+            await self.context.route("**/*", self.resource_policy.handler(self.resource_stats))
+
         self.page = await self.context.new_page()
         return self.page
 
     async def close_browser(self):
-        """브라우저 및 Playwright 인스턴스 종료"""
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-            self.context = None
-            self.page = None
-        if self._playwright:
-            await self._playwright.stop()
-            self._playwright = None
+        """빌린 컨텍스트 반납 (브라우저 프로세스는 풀에서 유지)"""
+        self._page_pool = None
+        if self.context:
+            await BrowserPool.shared().release_context(self.context)
+            if self.resource_stats.blocked:
+                logger.info(
+                    f"{self.source_code}: blocked {self.resource_stats.blocked} requests "
+                    f"(~{self.resource_stats.blocked_bytes_est // 1024} KB), "
+                    f"allowed {self.resource_stats.allowed}"
+                )
+        self.browser = None
+        self.context = None
+        self.page = None
 
     async def random_delay(self, min_ms: int = 500, max_ms: int = 1500):
         """랜덤 딜레이"""
         await asyncio.sleep(random.randint(min_ms, max_ms) / 1000)
 
-    async def safe_goto(self, url: str, timeout: int = 30000, max_retries: int = 3) -> bool:
-        """안전한 페이지 이동 (지수 백오프 재시도)"""
+    async def throttle(self, url: str):
+        """호스트별 토큰 버킷으로 요청 간격 제한"""
+        host = urlparse(url).netloc
+        bucket = self._host_buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.HOST_RATE_PER_SEC, self.HOST_BURST)
+            self._host_buckets[host] = bucket
+        with self.timer.waiting():
+            await bucket.acquire()
+
+    async def safe_goto(
+        self,
+        url: str,
+        timeout: int = 30000,
+        max_retries: int = 3,
+        page: Page = None,
+        ready: ReadyCondition = None
+    ) -> bool:
+        """
+        안전한 페이지 이동 (호스트별 속도 제한 + 지수 백오프 재시도)
+
+        Args:
+            url: 이동할 URL
+            timeout: 이동 타임아웃 (ms)
+            max_retries: 최대 시도 횟수
+            page: 사용할 페이지 (기본: self.page)
+            ready: 이동 후 기다릴 내용 준비 조건 (시간 초과 시에도 이동 성공으로 반환)
+        """
+        page = page or self.page
         for attempt in range(max_retries):
+            # 응답 대기는 이동 전에 등록해야 놓치지 않음
+            finished = _RequestWatch(page, ready.response) if ready and ready.response else None
             try:
-                await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-                await self.random_delay(1000, 2000)
+                await self.throttle(url)
+                await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+                if ready:
+                    await self.wait_ready(page, ready, finished)
                 return True
             except Exception as e:
                 if attempt < max_retries - 1:
                     backoff_ms = (2 ** attempt) * 1000 + random.randint(0, 1000)
                     logger.warning(f"Navigation failed (attempt {attempt + 1}/{max_retries}): {url} - {e}, retrying in {backoff_ms}ms")
-                    await asyncio.sleep(backoff_ms / 1000)
+                    with self.timer.waiting():
+                        await asyncio.sleep(backoff_ms / 1000)
                 else:
                     logger.warning(f"Navigation failed after {max_retries} attempts: {url} - {e}")
                     return False
+            finally:
+                if finished:
+                    finished.detach()
         return False
 
+    async def wait_ready(self, page: Page, ready: ReadyCondition, finished: _RequestWatch = None) -> bool:
+        """
+        내용 준비 조건 대기 (대기 시간은 timer 에 기록)
+
+        Returns:
+            조건 충족 여부 (시간 초과 시 False, 호출자는 현재 페이지로 진행)
+        """
+        deadline = time.monotonic() + ready.timeout_ms / 1000
+
+        with self.timer.waiting():
+            try:
+                if ready.selector:
+                    await page.wait_for_selector(ready.selector, state="attached", timeout=ready.timeout_ms)
+                if finished:
+                    await asyncio.wait_for(finished.event.wait(), max(0.0, deadline - time.monotonic()))
+                    # 응답 처리 스크립트(댓글 렌더링 등)가 실행될 한 틱 양보
+                    await page.evaluate("() => new Promise(resolve => setTimeout(resolve, 0))")
+                return True
+            except Exception as e:
+                logger.debug(f"Content not ready within {ready.timeout_ms}ms: {page.url} - {e}")
+                return False
+
+    @staticmethod
+    def parse_external_id(external_id: Any) -> Optional[int]:
+        """숫자형 게시글 ID 변환 (숫자가 아니면 None)"""
+        if external_id is None:
+            return None
+        external_id = str(external_id)
+        return int(external_id) if external_id.isdigit() else None
+
+    def set_watermark(
+        self,
+        watermark_id: int,
+        known_comment_counts: Dict[str, int],
+        known_since: datetime = None
+    ):
+        """
+        증분 크롤링 상태 설정
+
+        Args:
+            watermark_id: 이전 크롤링까지 수집한 최대 external_id
+            known_comment_counts: 최근 수집 게시글의 external_id -> 댓글 수
+            known_since: known_comment_counts 조회 기준 시각 (이보다 오래된 기존 글은 재확인하지 않음)
+        """
+        self.watermark_id = watermark_id
+        self.known_comment_counts = known_comment_counts
+        self.known_since = known_since
+
+    def filter_known_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이미 수집한 게시글 제외 (상세 페이지 요청 생략)
+
+        워터마크 이하 게시글 중 댓글 수가 그대로이거나 재확인 기간보다 오래된 글을 제외한다.
+        공지처럼 오래된 글이 목록 상단에 고정될 수 있으므로 중단(break)하지 않고 건너뛴다.
+        """
+        if self.watermark_id is None:
+            return articles
+
+        fresh = []
+        for article in articles:
+            article_id = self.parse_external_id(article.get('external_id'))
+            if article_id is None or article_id > self.watermark_id:
+                fresh.append(article)
+                continue
+
+            post_date = article.get('post_date')
+            if self.known_since and post_date and post_date < self.known_since:
+                continue
+
+            known_count = self.known_comment_counts.get(article['external_id'])
+            if known_count is not None and known_count == article.get('comment_count', 0):
+                continue
+
+            fresh.append(article)
+
+        logger.info(
+            f"Incremental filter: {len(fresh)}/{len(articles)} articles to fetch "
+            f"(watermark={self.watermark_id})"
+        )
+        return fresh
+
+    async def _get_page_pool(self) -> asyncio.Queue:
+        """
+        상세 페이지용 탭 풀 (현재 BrowserContext 내 최대 DETAIL_CONCURRENCY 개)
+
+        iter_details 가 동시에 시작한 첫 요청들이 각자 풀을 만들지 않도록 생성 구간을 잠근다.
+        """
+        async with self._page_pool_lock:
+            if self._page_pool is None:
+                pool = asyncio.Queue()
+                pool.put_nowait(self.page)
+                for _ in range(self.DETAIL_CONCURRENCY - 1):
+                    pool.put_nowait(await self.context.new_page())
+                self._page_pool = pool
+        return self._page_pool
+
+    async def _fetch_detail_with_pool(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """탭 풀에서 페이지를 빌려 상세 페이지 크롤링 후 article 에 병합"""
+        pool = await self._get_page_pool()
+        page = await pool.get()
+        try:
+            detail = await self._crawl_detail(article['url'], page=page)
+        finally:
+            pool.put_nowait(page)
+        article.update(detail)
+        return article
+
+    async def iter_details(
+        self,
+        articles: List[Dict[str, Any]],
+        fetch: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        상세 페이지 병렬 크롤링 (스트리밍)
+
+        최대 DETAIL_CONCURRENCY 개를 동시에 요청하고, 완료된 게시글을 입력 순서대로
+        yield 한다. 소비자가 다음 값을 요청하기 전에는 새 요청을 시작하지 않으므로
+        메모리에 머무는 상세 결과는 동시 실행 수로 제한된다.
+
+        Args:
+            articles: 목록에서 파싱한 게시글
+            fetch: 게시글 1건 상세 크롤링 함수 (기본: 탭 풀 + _crawl_detail)
+        """
+        fetch = fetch or self._fetch_detail_with_pool
+        window = deque()
+
+        async def timed_fetch(article: Dict[str, Any]) -> Dict[str, Any]:
+            with self.timer.request():
+                return await fetch(article)
+
+        try:
+            for article in articles:
+                window.append(asyncio.ensure_future(timed_fetch(article)))
+                if len(window) >= self.DETAIL_CONCURRENCY:
+                    yield await window.popleft()
+
+            while window:
+                yield await window.popleft()
+        finally:
+            # 중단(예외/소비 종료) 시 진행 중인 요청 취소 (탭 반납까지 대기)
+            for task in window:
+                task.cancel()
+            if window:
+                await asyncio.gather(*window, return_exceptions=True)
+
+    async def fetch_details(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        상세 페이지 병렬 크롤링
+
+        탭 풀에서 페이지를 빌려 _crawl_detail 을 동시에 실행하고,
+        결과를 각 article 에 병합해 입력 순서대로 반환한다.
+        """
+        async with aclosing(self.iter_details(articles)) as details:
+            return [article async for article in details]
+
+    async def stream(self, keyword: str = None, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """
+        게시글 스트리밍 크롤링 (keyword 가 없으면 최신글)
+
+        상세 페이지 파싱이 끝난 게시글부터 하나씩 yield 한다. 기본 구현은
+        crawl/crawl_latest 결과를 순서대로 내보내며, 하위 클래스에서 재정의한다.
+        """
+        if keyword:
+            posts = await self.crawl(keyword=keyword, limit=limit)
+        else:
+            posts = await self.crawl_latest(limit=limit)
+
+        for post in posts:
+            yield post
+
+    @abstractmethod
+    async def _crawl_detail(self, url: str, page: Page = None) -> Dict[str, Any]:
+        """상세 페이지 크롤링 (하위 클래스에서 구현, page 미지정 시 self.page 사용)"""
+        pass
+
     @abstractmethod
     async def crawl(self, keyword: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
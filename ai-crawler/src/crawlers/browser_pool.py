@@ -0,0 +1,266 @@
+"""
+Shared Browser Pool
+프로세스 전역 Chromium 공유 및 BrowserContext 대여
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+def _child_processes_rss_mb() -> Optional[float]:
+    """
+    현재 프로세스의 하위 프로세스(Playwright 드라이버, Chromium) RSS 합계 (MB)
+
+    Linux /proc 기준이며, 지원하지 않는 환경에서는 None 반환
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    children: Dict[int, list] = {}
+    rss_kb: Dict[int, int] = {}
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        ppid = None
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('PPid:'):
+                        ppid = int(line.split()[1])
+                    elif line.startswith('VmRSS:'):
+                        rss_kb[pid] = int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid is not None:
+            children.setdefault(ppid, []).append(pid)
+
+    total_kb = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        total_kb += rss_kb.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return total_kb / 1024
+
+
+class _BrowserHandle:
+    """브라우저 프로세스 1세대의 사용 현황"""
+
+    def __init__(self, browser: Browser, headless: bool):
+        self.browser = browser
+        self.headless = headless
+        self.pages_opened = 0
+        self.active_contexts = 0
+        self.retired = False
+        self.memory_checked_at = time.monotonic()  # 마지막 메모리 점검 시각 (실행 직후는 점검 생략)
+
+    def count_page(self, _page=None):
+        """새 페이지 생성 이벤트 핸들러"""
+        self.pages_opened += 1
+
+
+class BrowserPool:
+    """
+    공유 브라우저 풀
+
+    Chromium 프로세스를 크롤링 작업 간에 재사용하고, 크롤러에는 격리된
+    BrowserContext 만 빌려준다. 연결이 끊기거나 누적 페이지 수/메모리가
+    임계값을 넘으면 새 브라우저로 교체하며, 기존 브라우저는 대여 중인
+    컨텍스트가 모두 반납된 뒤 종료한다.
+    """
+
+    LAUNCH_ARGS = [
+        "--disable-blink-features=AutomationControlled",
+        "--no-sandbox",
+        "--disable-dev-shm-usage"
+    ]
+
+    # 브라우저 교체 기준
+    MAX_PAGES_PER_BROWSER = int(os.getenv("BROWSER_MAX_PAGES", "500"))
+    MAX_MEMORY_MB = int(os.getenv("BROWSER_MAX_MEMORY_MB", "1500"))
+
+    # 메모리 점검 최소 간격 (/proc 전체를 읽으므로 컨텍스트 대여마다 하지 않음)
+    MEMORY_CHECK_INTERVAL_SEC = float(os.getenv("BROWSER_MEMORY_CHECK_SEC", "10"))
+
+    _shared: Optional['BrowserPool'] = None
+
+    @classmethod
+    def shared(cls) -> 'BrowserPool':
+        """프로세스 전역 인스턴스"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self):
+        self._playwright = None
+        self._handles: Dict[bool, _BrowserHandle] = {}  # headless -> 현재 브라우저
+        self._owners: Dict[int, _BrowserHandle] = {}  # id(context) -> 소속 브라우저
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _bind_loop(self):
+        """
+        실행 중인 이벤트 루프에 바인딩
+
+        Playwright 연결은 생성된 루프에 묶이므로, 루프가 바뀌면(asyncio.run 재호출 등)
+        이전 상태는 사용할 수 없어 버린다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._handles or self._playwright:
+            logger.warning("Event loop changed. Discarding previous browser pool state")
+
+        self._playwright = None
+        self._handles = {}
+        self._owners = {}
+        self._loop = loop
+        self._lock = asyncio.Lock()
+
+    async def acquire_context(self, headless: bool = True, **context_options) -> BrowserContext:
+        """
+        격리된 BrowserContext 대여
+
+        Args:
+            headless: 헤드리스 브라우저 사용 여부
+            context_options: Browser.new_context 옵션 (user_agent, viewport 등)
+        """
+        self._bind_loop()
+
+        async with self._lock:
+            handle = await self._get_handle(headless)
+            handle.active_contexts += 1
+
+        try:
+            context = await handle.browser.new_context(**context_options)
+        except Exception:
+            await self._release_handle(handle)
+            raise
+
+        context.on("page", handle.count_page)
+        self._owners[id(context)] = handle
+        return context
+
+    async def release_context(self, context: BrowserContext):
+        """BrowserContext 반납 (컨텍스트 종료)"""
+        handle = self._owners.pop(id(context), None)
+
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Context close error: {e}")
+
+        if handle:
+            await self._release_handle(handle)
+
+    async def close(self):
+        """모든 브라우저 및 Playwright 종료"""
+        if self._loop is None:
+            return
+
+        if self._loop is not asyncio.get_running_loop():
+            # 다른 루프에서 만든 연결은 종료할 수 없음
+            self._bind_loop()
+            return
+
+        async with self._lock:
+            handles = list(self._handles.values())
+            handles.extend(h for h in set(self._owners.values()) if h not in handles)
+            self._handles = {}
+            self._owners = {}
+
+            for handle in handles:
+                await self._close_handle(handle)
+
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+
+        logger.info("Browser pool closed")
+
+    async def _get_handle(self, headless: bool) -> _BrowserHandle:
+        """사용 가능한 브라우저 반환 (필요 시 교체/실행)"""
+        handle = self._handles.get(headless)
+
+        if handle:
+            reason = await self._recycle_reason(handle)
+            if reason:
+                logger.info(f"Recycling browser: {reason}")
+                del self._handles[headless]
+                await self._retire(handle)
+                handle = None
+
+        if handle is None:
+            handle = await self._launch(headless)
+            self._handles[headless] = handle
+
+        return handle
+
+    async def _recycle_reason(self, handle: _BrowserHandle) -> Optional[str]:
+        """
+        브라우저 상태 점검 (교체 사유, 정상이면 None)
+
+        메모리는 MEMORY_CHECK_INTERVAL_SEC 마다 작업자 스레드에서 점검한다 (이벤트 루프 차단 방지).
+        """
+        if not handle.browser.is_connected():
+            return "browser disconnected"
+
+        if handle.pages_opened >= self.MAX_PAGES_PER_BROWSER:
+            return f"{handle.pages_opened} pages opened"
+
+        now = time.monotonic()
+        if now - handle.memory_checked_at < self.MEMORY_CHECK_INTERVAL_SEC:
+            return None
+        handle.memory_checked_at = now
+
+        rss_mb = await asyncio.to_thread(_child_processes_rss_mb)
+        if rss_mb is not None and rss_mb >= self.MAX_MEMORY_MB:
+            return f"memory {rss_mb:.0f}MB"
+
+        return None
+
+    async def _launch(self, headless: bool) -> _BrowserHandle:
+        """새 Chromium 실행"""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        browser = await self._playwright.chromium.launch(
+            headless=headless,
+            args=self.LAUNCH_ARGS
+        )
+        logger.info(f"Launched shared browser (headless={headless})")
+
+        return _BrowserHandle(browser, headless)
+
+    async def _retire(self, handle: _BrowserHandle):
+        """브라우저 퇴역 (대여 중인 컨텍스트가 없으면 즉시 종료)"""
+        handle.retired = True
+        if handle.active_contexts <= 0:
+            await self._close_handle(handle)
+
+    async def _release_handle(self, handle: _BrowserHandle):
+        """대여 카운트 감소 및 퇴역 브라우저 정리"""
+        handle.active_contexts -= 1
+        if handle.retired and handle.active_contexts <= 0:
+            await self._close_handle(handle)
+
+    async def _close_handle(self, handle: _BrowserHandle):
+        """브라우저 종료"""
+        try:
+            await handle.browser.close()
+        except Exception as e:
+            logger.debug(f"Browser close error: {e}")
+
+
+async def close_browser_pool():
+    """공유 브라우저 풀 종료"""
+    await BrowserPool.shared().close()
@@ -3,12 +3,16 @@ DC Inside Gallery Crawler
 디시인사이드 갤러리 크롤러
 """
 import logging
+import os
 import re
-from typing import List, Dict, Any, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
-from urllib.parse import urlencode
-from .base import BaseCrawler
+from urllib.parse import urlencode, urlparse, parse_qs
+from playwright.async_api import Page
+from .base import BaseCrawler, ReadyCondition
+from .http_fetcher import HttpFetcher, BlockedError
 
 logger = logging.getLogger(__name__)
 
@@ -35,34 +39,77 @@ class DCInsideCrawler(BaseCrawler):
         }
     }
 
-    def __init__(self, gallery_id: str, source_code: str):
+    DEFAULT_HOST = 'https://gall.dcinside.com'
+
+    # 차단/봇 확인 페이지 판별 (HTTP 모드 → 브라우저 전환 조건)
+    # 같은 문구가 게시글 본문에도 나올 수 있어 페이지 제목과 챌린지 요소로만 판별
+    BLOCK_TITLES = (
+        'Just a moment',
+        'Attention Required',
+        '비정상적인 접근',
+        '접근이 차단',
+    )
+    BLOCK_SELECTORS = (
+        '#challenge-form',
+        '#challenge-running',
+        '.cf-browser-verification',
+    )
+
+    # 댓글 API 갤러리 타입 코드
+    GALLTYPE_CODES = {'gallery': 'G', 'mgallery': 'M', 'mini': 'MI'}
+
+    # 상세 페이지: 본문 + 페이지 스크립트의 댓글 API 요청 완료
+    DETAIL_READY = ReadyCondition(selector=".write_div", response=r"/board/comment/")
+
+    # 트리를 만들 최상위 요소 (목록 행 / 본문, 댓글, 댓글 API 토큰)
+    LIST_TARGETS = ("tr.ub-content",)
+    DETAIL_TARGETS = (".write_div", ".cmt_info", "input#e_s_n_o")
+
+    def __init__(
+        self,
+        gallery_id: str,
+        source_code: str,
+        fetch_mode: str = None,
+        host: str = None
+    ):
         """
         Args:
             gallery_id: 갤러리 ID (government, gongmuwon)
             source_code: 소스 코드 (DB 저장용)
+            fetch_mode: 'http'(경량 HTTP, 차단 시 브라우저 전환) 또는 'browser'
+                        (기본: DCINSIDE_FETCH_MODE 환경변수, 없으면 'http')
+            host: 요청 호스트 (로컬 스텁 서버 테스트용, 기본: https://gall.dcinside.com)
         """
+        self.host = (host or self.DEFAULT_HOST).rstrip('/')
+
         gallery_info = self.GALLERIES.get(gallery_id, {})
-        base_url = gallery_info.get('url', f'https://gall.dcinside.com/mgallery/board/lists/?id={gallery_id}')
+        base_url = gallery_info.get('url', f'{self.DEFAULT_HOST}/mgallery/board/lists/?id={gallery_id}')
+        base_url = base_url.replace(self.DEFAULT_HOST, self.host, 1)
 
         super().__init__(source_code, base_url)
         self.gallery_id = gallery_id
         self.gallery_type = gallery_info.get('type', 'mgallery')
+        self.fetch_mode = (fetch_mode or os.getenv('DCINSIDE_FETCH_MODE', 'http')).lower()
 
     def _get_base_path(self) -> str:
         """갤러리 타입에 따른 기본 경로"""
         if self.gallery_type == 'gallery':
-            return 'https://gall.dcinside.com/board'
+            return f'{self.host}/board'
         elif self.gallery_type == 'mini':
-            return 'https://gall.dcinside.com/mini/board'
-        return 'https://gall.dcinside.com/mgallery/board'
+            return f'{self.host}/mini/board'
+        return f'{self.host}/mgallery/board'
 
     async def crawl(self, keyword: str, limit: int = 50) -> List[Dict[str, Any]]:
         """키워드로 검색하여 크롤링"""
-        results = []
+        return [post async for post in self.stream(keyword=keyword, limit=limit)]
 
-        try:
-            await self.setup_browser(headless=True, mobile=False)
+    async def crawl_latest(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최신글 크롤링"""
+        return [post async for post in self.stream(limit=limit)]
 
+    async def stream(self, keyword: str = None, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """게시글 스트리밍 크롤링 (keyword 가 없으면 최신글)"""
+        if keyword:
             # 검색 URL 구성
             base_path = self._get_base_path()
             params = {
@@ -70,59 +117,108 @@ class DCInsideCrawler(BaseCrawler):
                 's_type': 'search_subject_memo',  # 제목+내용 검색
                 's_keyword': keyword
             }
-            search_url = f"{base_path}/lists/?{urlencode(params)}"
-            logger.info(f"DC Inside Search: {search_url}")
-
-            if not await self.safe_goto(search_url):
-                return results
-
-            # 목록 파싱
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-
-            articles = self._parse_list_page(soup, limit)
-            logger.info(f"Found {len(articles)} articles. Fetching details...")
-
-            # 상세 페이지 크롤링
-            for article in articles:
-                detail = await self._crawl_detail(article['url'])
-                article.update(detail)
-                results.append(article)
-                await self.random_delay(1000, 2000)
+            list_url = f"{base_path}/lists/?{urlencode(params)}"
+            logger.info(f"DC Inside Search: {list_url}")
+        else:
+            list_url = self.base_url
+            logger.info(f"DC Inside Latest: {list_url}")
 
-        finally:
-            await self.close_browser()
+        async with aclosing(self._stream_list(list_url, limit)) as posts:
+            async for post in posts:
+                yield post
 
-        return results
-
-    async def crawl_latest(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """최신글 크롤링"""
-        results = []
+    async def _stream_list(self, list_url: str, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """목록 + 상세 크롤링 (HTTP 모드 우선, 차단 감지 시 브라우저로 전환)"""
+        yielded_ids = set()
 
+        if self.fetch_mode == 'http':
+            try:
+                async with aclosing(self._stream_list_http(list_url, limit)) as posts:
+                    async for post in posts:
+                        yielded_ids.add(post['external_id'])
+                        yield post
+                return
+            except BlockedError as e:
+                logger.warning(f"HTTP fetch blocked, falling back to browser: {e}")
+
+        # 차단 전까지 내보낸 게시글은 브라우저 모드에서 건너뜀
+        async with aclosing(self._stream_list_browser(list_url, limit, skip_ids=yielded_ids)) as posts:
+            async for post in posts:
+                yield post
+
+    async def _stream_list_browser(
+        self,
+        list_url: str,
+        limit: int,
+        skip_ids: Iterable[str] = ()
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Playwright 로 목록 + 상세 크롤링"""
         try:
             await self.setup_browser(headless=True, mobile=False)
 
-            logger.info(f"DC Inside Latest: {self.base_url}")
+            with self.timer.request():
+                if not await self.safe_goto(list_url):
+                    return
 
-            if not await self.safe_goto(self.base_url):
-                return results
+                # 목록 파싱
+                content = await self.page.content()
+                soup = self.parser.parse(content, self.LIST_TARGETS)
 
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-
-            articles = self._parse_list_page(soup, limit)
+                skip_ids = set(skip_ids)
+                articles = [
+                    article for article in self.filter_known_articles(self._parse_list_page(soup, limit))
+                    if article['external_id'] not in skip_ids
+                ]
             logger.info(f"Found {len(articles)} articles. Fetching details...")
 
-            for article in articles:
-                detail = await self._crawl_detail(article['url'])
-                article.update(detail)
-                results.append(article)
-                await self.random_delay(1000, 2000)
+            # 상세 페이지 크롤링 (탭 풀 병렬)
+            async with aclosing(self.iter_details(articles)) as posts:
+                async for post in posts:
+                    yield post
 
         finally:
             await self.close_browser()
 
-        return results
+    async def _stream_list_http(self, list_url: str, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        HTTP 클라이언트로 목록 + 상세 크롤링
+
+        Raises:
+            BlockedError: 차단/챌린지 응답 감지 (브라우저 모드로 재시도 필요)
+        """
+        headers = {
+            "User-Agent": self.DESKTOP_UA,
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+        }
+
+        async with HttpFetcher(
+            headers=headers,
+            block_titles=self.BLOCK_TITLES,
+            block_selectors=self.BLOCK_SELECTORS,
+            throttle=self.throttle,
+            max_connections=self.DETAIL_CONCURRENCY
+        ) as fetcher:
+            with self.timer.request():
+                html = await fetcher.get_text(list_url)
+                if html is None:
+                    return
+
+                soup = self.parser.parse(html, self.LIST_TARGETS)
+                articles = self.filter_known_articles(self._parse_list_page(soup, limit))
+            logger.info(f"Found {len(articles)} articles. Fetching details (http)...")
+
+            async def fetch(article: Dict[str, Any]) -> Dict[str, Any]:
+                detail = await self._crawl_detail_http(
+                    fetcher, article['url'], fetch_comments=article.get('comment_count', 0) > 0
+                )
+                article.update(detail)
+                return article
+
+            # 차단 감지 시 iter_details 가 남은 요청을 취소하고 BlockedError 전파
+            async with aclosing(self.iter_details(articles, fetch=fetch)) as posts:
+                async for post in posts:
+                    yield post
 
     def _parse_list_page(self, soup: BeautifulSoup, limit: int) -> List[Dict[str, Any]]:
         """목록 페이지 파싱"""
@@ -167,7 +263,7 @@ class DCInsideCrawler(BaseCrawler):
 
         # URL 구성
         if href.startswith('/'):
-            url = f"https://gall.dcinside.com{href}"
+            url = f"{self.host}{href}"
         else:
             url = href
 
@@ -253,52 +349,145 @@ class DCInsideCrawler(BaseCrawler):
 
         return None
 
-    async def _crawl_detail(self, url: str) -> Dict[str, Any]:
+    async def _crawl_detail(self, url: str, page: Page = None) -> Dict[str, Any]:
         """상세 페이지 크롤링"""
+        page = page or self.page
+        result = {
+            'content': '',
+            'comments': []
+        }
+
+        try:
+            await self.safe_goto(url, page=page, ready=self.DETAIL_READY)
+
+            html = await page.content()
+            result = self._parse_detail(self.parser.parse(html, self.DETAIL_TARGETS))
+
+        except Exception as e:
+            logger.warning(f"Detail crawl error: {e}")
+
+        return result
+
+    async def _crawl_detail_http(
+        self,
+        fetcher: HttpFetcher,
+        url: str,
+        fetch_comments: bool = True
+    ) -> Dict[str, Any]:
+        """
+        상세 페이지 크롤링 (HTTP 모드)
+
+        댓글은 페이지 로드 후 스크립트로 채워지므로 댓글 API 로 별도 조회한다.
+        (fetch_comments=False 면 목록상 댓글이 없는 글로 보고 생략)
+
+        Raises:
+            BlockedError: 차단 응답 감지
+        """
         result = {
             'content': '',
             'comments': []
         }
 
         try:
-            await self.safe_goto(url)
-            await self.page.wait_for_timeout(1500)
-
-            html = await self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # 본문 추출
-            content_elem = soup.select_one(".write_div")
-            if content_elem:
-                # 이미지, 동영상 태그 제거하고 텍스트만
-                for tag in content_elem.select('img, video, iframe, script, style'):
-                    tag.decompose()
-                result['content'] = content_elem.get_text(strip=True)
-
-            # 댓글 추출
-            comments = []
-            comment_list = soup.select(".cmt_info")
-
-            for idx, cmt in enumerate(comment_list):
-                try:
-                    content_elem = cmt.select_one(".usertxt")
-                    author_elem = cmt.select_one(".gall_writer .nickname")
-                    date_elem = cmt.select_one(".date_time")
-
-                    if content_elem:
-                        comments.append({
-                            'external_id': str(idx),
-                            'content': content_elem.get_text(strip=True),
-                            'author': author_elem.get('title', '') if author_elem else '',
-                            'comment_date': self._parse_dc_date(date_elem.get_text(strip=True) if date_elem else None),
-                            'like_count': 0
-                        })
-                except Exception as e:
-                    continue
-
-            result['comments'] = comments
+            html = await fetcher.get_text(url)
+            if html is None:
+                return result
+
+            soup = self.parser.parse(html, self.DETAIL_TARGETS)
+            result = self._parse_detail(soup)
+            if fetch_comments and not result['comments']:
+                result['comments'] = await self._fetch_comments_http(fetcher, url, soup)
 
+        except BlockedError:
+            raise
         except Exception as e:
             logger.warning(f"Detail crawl error: {e}")
 
         return result
+
+    async def _fetch_comments_http(
+        self,
+        fetcher: HttpFetcher,
+        url: str,
+        soup: BeautifulSoup
+    ) -> List[Dict[str, Any]]:
+        """댓글 API 조회 (브라우저 모드의 .cmt_info 파싱 결과와 같은 형식)"""
+        post_no = parse_qs(urlparse(url).query).get('no', [None])[0]
+        esno_elem = soup.select_one('input#e_s_n_o')
+        if not post_no or not esno_elem:
+            return []
+
+        data = await fetcher.post_json(
+            f"{self.host}/board/comment/",
+            data={
+                'id': self.gallery_id,
+                'no': post_no,
+                'cmt_id': self.gallery_id,
+                'cmt_no': post_no,
+                'e_s_n_o': esno_elem.get('value', ''),
+                'comment_page': 1,
+                'sort': '',
+                '_GALLTYPE_': self.GALLTYPE_CODES.get(self.gallery_type, 'M')
+            },
+            headers={
+                'X-Requested-With': 'XMLHttpRequest',
+                'Referer': url
+            }
+        )
+        if not isinstance(data, dict):
+            return []
+
+        comments = []
+        for item in data.get('comments') or []:
+            memo = item.get('memo')
+            if not memo:
+                continue
+            comments.append({
+                'external_id': str(len(comments)),
+                'content': self.parser.text(memo),
+                'author': item.get('name', ''),
+                'comment_date': self._parse_dc_date(item.get('reg_date')),
+                'like_count': 0
+            })
+
+        return comments
+
+    def _parse_detail(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """상세 페이지 파싱 (본문 + 댓글)"""
+        result = {
+            'content': '',
+            'comments': []
+        }
+
+        # 본문 추출
+        content_elem = soup.select_one(".write_div")
+        if content_elem:
+            # 이미지, 동영상 태그 제거하고 텍스트만
+            for tag in content_elem.select('img, video, iframe, script, style'):
+                tag.decompose()
+            result['content'] = content_elem.get_text(strip=True)
+
+        # 댓글 추출
+        comments = []
+        comment_list = soup.select(".cmt_info")
+
+        for idx, cmt in enumerate(comment_list):
+            try:
+                content_elem = cmt.select_one(".usertxt")
+                author_elem = cmt.select_one(".gall_writer .nickname")
+                date_elem = cmt.select_one(".date_time")
+
+                if content_elem:
+                    comments.append({
+                        'external_id': str(idx),
+                        'content': content_elem.get_text(strip=True),
+                        'author': author_elem.get('title', '') if author_elem else '',
+                        'comment_date': self._parse_dc_date(date_elem.get_text(strip=True) if date_elem else None),
+                        'like_count': 0
+                    })
+            except Exception as e:
+                continue
+
+        result['comments'] = comments
+
+        return result
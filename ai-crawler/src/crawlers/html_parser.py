@@ -0,0 +1,145 @@
+"""
+HTML Parser
+크롤러 공용 HTML 파서 (lxml 우선, 필요한 부분 트리만 생성)
+"""
+import logging
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ('lxml', 'html.parser')
+
+# 단순 셀렉터: 태그명, #id, .class 조합 (예: tr.ub-content, #postContent, .write_div)
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][a-zA-Z0-9-]*)?((?:[#.][\w-]+)*)$')
+
+
+def _parse_target(selector: str) -> Tuple[Optional[str], Optional[str], frozenset]:
+    """단순 셀렉터 → (태그명, id, class 집합)"""
+    match = _SIMPLE_SELECTOR.match(selector.strip())
+    if not match or not selector.strip():
+        raise ValueError(f"Unsupported target selector (tag/#id/.class only): {selector!r}")
+
+    tag_id = None
+    classes = set()
+    for token in re.findall(r'[#.][\w-]+', match.group(2) or ''):
+        if token[0] == '#':
+            tag_id = token[1:]
+        else:
+            classes.add(token[1:])
+
+    name = match.group(1).lower() if match.group(1) else None
+    return name, tag_id, frozenset(classes)
+
+
+class _SubtreeStrainer(SoupStrainer):
+    """
+    지정한 셀렉터와 일치하는 최상위 요소의 하위 트리만 만드는 parse_only 필터
+
+    트리 생성 여부를 묻는 훅 이름이 bs4 버전마다 달라(4.12: search_tag, 4.13+:
+    allow_tag_creation) 둘 다 구현한다. 일치한 요소 안쪽은 bs4 가 검사 없이 모두 만든다.
+    """
+
+    def __init__(self, selectors: Iterable[str]):
+        super().__init__()
+        self.targets = [_parse_target(s) for s in selectors]
+
+    def _match_start(self, name: str, attrs: Optional[Dict[str, Any]]) -> bool:
+        attrs = attrs or {}
+        tag_id = attrs.get('id')
+        classes = attrs.get('class') or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        classes = set(classes)
+
+        for target_name, target_id, target_classes in self.targets:
+            if target_name and target_name != name:
+                continue
+            if target_id and target_id != tag_id:
+                continue
+            if target_classes <= classes:
+                return True
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._match_start(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if isinstance(markup_name, str):
+            return self._match_start(markup_name, markup_attrs)
+        return super().search_tag(markup_name, markup_attrs)
+
+
+class HtmlParser:
+    """
+    HTML 파싱 계층
+
+    결과는 BeautifulSoup 트리라 호출부의 select/get_text 코드는 그대로 쓴다. 엔진은
+    lxml(C 구현, 설치된 경우 기본)과 html.parser 중 선택하며, targets 를 주면 해당
+    셀렉터와 일치하는 요소의 하위 트리만 만들어 스크립트/광고 등 나머지 노드 생성을 건너뛴다.
+    targets 는 태그명/#id/.class 조합만 지원하며, 하위 선택은 결과 트리에서 select 로 한다.
+    """
+
+    def __init__(self, engine: str = None):
+        """
+        Args:
+            engine: 'lxml' 또는 'html.parser' (기본: HTML_PARSER 환경변수, 없으면 lxml 설치 시 lxml)
+        """
+        engine = engine or os.getenv("HTML_PARSER") or ('lxml' if HAS_LXML else 'html.parser')
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown HTML parser engine: {engine}")
+        if engine == 'lxml' and not HAS_LXML:
+            logger.warning("lxml not installed, falling back to html.parser")
+            engine = 'html.parser'
+        self.engine = engine
+        self._strainers: Dict[Tuple[str, ...], _SubtreeStrainer] = {}
+
+    def parse(self, markup: str, targets: Iterable[str] = None) -> BeautifulSoup:
+        """
+        HTML 파싱
+
+        Args:
+            markup: HTML 문자열
+            targets: 트리를 만들 최상위 요소 셀렉터 (None 이면 문서 전체)
+        """
+        if not targets:
+            return BeautifulSoup(markup, self.engine)
+
+        key = tuple(targets)
+        strainer = self._strainers.get(key)
+        if strainer is None:
+            strainer = self._strainers[key] = _SubtreeStrainer(key)
+        return BeautifulSoup(markup, self.engine, parse_only=strainer)
+
+    def text(self, markup: str) -> str:
+        """HTML 조각의 텍스트 (댓글 본문 등)"""
+        return BeautifulSoup(markup, self.engine).get_text(strip=True)
+
+
+_default: Optional[HtmlParser] = None
+
+
+def default_parser() -> HtmlParser:
+    """프로세스 기본 파서 (HTML_PARSER 환경변수 기준)"""
+    global _default
+    if _default is None:
+        _default = HtmlParser()
+    return _default
+
+
+def select_roots(selectors: Iterable[str]) -> List[str]:
+    """셀렉터 목록의 최상위 단순 셀렉터 (예: '.WriterInfo .nickname' → '.WriterInfo')"""
+    roots = []
+    for selector in selectors:
+        root = selector.split()[0]
+        if root not in roots:
+            roots.append(root)
+    return roots
@@ -0,0 +1,165 @@
+"""
+HTTP Fetcher
+브라우저 없이 HTML/JSON 을 가져오는 경량 비동기 HTTP 클라이언트
+"""
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+import httpx
+
+from .html_parser import default_parser
+
+logger = logging.getLogger(__name__)
+
+
+class BlockedError(Exception):
+    """차단 페이지 또는 봇 확인(challenge) 응답 감지"""
+
+
+class HttpFetcher:
+    """
+    커넥션 풀 기반 비동기 HTTP 클라이언트
+
+    - keep-alive 커넥션 재사용, gzip/deflate 압축 응답 자동 해제
+    - 쿠키는 클라이언트 수명 동안 유지
+    - 차단 상태코드 또는 챌린지 페이지(제목/챌린지 요소) 감지 시 BlockedError (호출자가 브라우저로 전환)
+    """
+
+    BLOCK_STATUS_CODES = (403, 429, 503)
+
+    # 챌린지 페이지 검사 대상 최대 본문 크기 (정상 응답 기준, 오류 응답은 크기와 무관하게 검사)
+    BLOCK_PAGE_MAX_BYTES = 32 * 1024
+
+    def __init__(
+        self,
+        headers: Dict[str, str] = None,
+        block_titles: Iterable[str] = (),
+        block_selectors: Iterable[str] = (),
+        throttle: Callable[[str], Awaitable[None]] = None,
+        max_connections: int = 4,
+        timeout: float = 30.0,
+        cookies: List[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            headers: 기본 요청 헤더 (User-Agent 등)
+            block_titles: 차단/챌린지 페이지 <title> 에 포함되는 문자열
+            block_selectors: 차단/챌린지 페이지에만 있는 요소 (태그명/#id/.class)
+            throttle: 요청 전 호출할 속도 제한 함수 (BaseCrawler.throttle)
+            max_connections: 최대 동시 커넥션 수
+            timeout: 요청 타임아웃 (초)
+            cookies: 초기 쿠키 (Playwright BrowserContext.cookies() 형식, 로그인 세션 재사용)
+        """
+        self.block_titles = tuple(block_titles)
+        self.block_selectors = tuple(block_selectors)
+        self._throttle = throttle
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            follow_redirects=True,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+        for cookie in cookies or []:
+            self._client.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """커넥션 풀 종료"""
+        await self._client.aclose()
+
+    async def get_text(self, url: str, **kwargs) -> Optional[str]:
+        """GET 요청 후 본문 반환 (404 등 오류 시 None)"""
+        response = await self.request("GET", url, **kwargs)
+        return response.text if response is not None else None
+
+    async def get_json(self, url: str, **kwargs) -> Optional[Any]:
+        """GET 요청 후 JSON 반환 (오류/파싱 실패 시 None)"""
+        return self._json(url, await self.request("GET", url, **kwargs))
+
+    async def post_json(self, url: str, **kwargs) -> Optional[Any]:
+        """POST 요청 후 JSON 반환 (오류/파싱 실패 시 None)"""
+        return self._json(url, await self.request("POST", url, **kwargs))
+
+    def _json(self, url: str, response: Optional[httpx.Response]) -> Optional[Any]:
+        """응답 JSON 파싱 (차단 페이지면 BlockedError, 그 외 실패 시 None)"""
+        if response is None:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            self._check_blocked(url, response)
+            logger.debug(f"Invalid JSON response: {url}")
+            return None
+
+    async def request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> Optional[httpx.Response]:
+        """
+        요청 실행 (호스트별 속도 제한 + 지수 백오프 재시도)
+
+        Raises:
+            BlockedError: 차단 상태코드 또는 챌린지 페이지 감지
+        """
+        for attempt in range(max_retries):
+            try:
+                if self._throttle:
+                    await self._throttle(url)
+                response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt < max_retries - 1:
+                    backoff_ms = (2 ** attempt) * 1000 + random.randint(0, 1000)
+                    logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {url} - {e}, retrying in {backoff_ms}ms")
+                    await asyncio.sleep(backoff_ms / 1000)
+                    continue
+                logger.warning(f"Request failed after {max_retries} attempts: {url} - {e}")
+                return None
+
+            self._check_blocked(url, response)
+
+            if response.status_code >= 400:
+                logger.warning(f"HTTP {response.status_code}: {url}")
+                return None
+
+            return response
+
+        return None
+
+    def _check_blocked(self, url: str, response: httpx.Response):
+        """
+        차단 응답 여부 검사
+
+        차단 문구는 게시글/댓글 본문에도 나올 수 있으므로 본문 전체가 아니라 페이지 제목과
+        챌린지 요소만 본다. 정상 목록/상세 페이지는 챌린지 페이지보다 훨씬 크므로, 2xx 응답은
+        BLOCK_PAGE_MAX_BYTES 이하일 때만 검사한다.
+        """
+        if response.status_code in self.BLOCK_STATUS_CODES:
+            raise BlockedError(f"HTTP {response.status_code}: {url}")
+
+        if not (self.block_titles or self.block_selectors):
+            return
+        if response.is_success and len(response.content) > self.BLOCK_PAGE_MAX_BYTES:
+            return
+
+        soup = default_parser().parse(response.text, ('title',) + self.block_selectors)
+
+        title = soup.title.get_text(strip=True) if soup.title else ''
+        for marker in self.block_titles:
+            if marker in title:
+                raise BlockedError(f"Block page title '{title}': {url}")
+
+        for selector in self.block_selectors:
+            if soup.select_one(selector):
+                raise BlockedError(f"Challenge element '{selector}' found: {url}")
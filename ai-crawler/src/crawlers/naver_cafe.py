@@ -2,15 +2,25 @@
 Naver Cafe Crawler
 네이버 카페 크롤러
 """
+import html
 import logging
+import os
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from bs4 import BeautifulSoup
-from .base import BaseCrawler
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable, List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+from playwright.async_api import Page
+from .base import BaseCrawler, ReadyCondition
+from .html_parser import select_roots
+from .http_fetcher import HttpFetcher, BlockedError
+from .session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
+# 카페 화면 표시 시각 기준 (API 의 epoch 시각을 브라우저 모드 파싱 결과와 맞춤)
+KST = timezone(timedelta(hours=9))
+
 
 class NaverCafeCrawler(BaseCrawler):
     """네이버 카페 크롤러"""
@@ -22,19 +32,74 @@ class NaverCafeCrawler(BaseCrawler):
         '9gong': '16558386',         # 9급공무원갤러리
     }
 
-    def __init__(self, cafe_id: str, source_code: str, nid: str = None, npw: str = None):
+    DEFAULT_HOST = 'https://cafe.naver.com'
+    DEFAULT_API_HOST = 'https://apis.naver.com'
+
+    # 로그인 필요 페이지 (세션이 없으면 nidlogin 으로 리다이렉트)
+    SESSION_PROBE_URL = 'https://nid.naver.com/user2/help/myInfoV2?lang=ko_KR'
+
+    # 본문 컨테이너 (데스크톱 + 모바일)
+    CONTENT_SELECTORS = [
+        ".se-main-container", "#postContent", ".post_content",
+        "div.ContentRenderer", ".article_viewer", "#body"
+    ]
+
+    # 작성자 / 조회수 (데스크톱 셀렉터)
+    AUTHOR_SELECTORS = [
+        ".WriterInfo .nickname", ".article_writer .nickname",
+        ".nick_box .nickname", ".nick", ".writer"
+    ]
+    VIEW_SELECTORS = [
+        ".article_info .count", ".no", ".view_count",
+        "span.count"
+    ]
+
+    # 브라우저 모드 준비 조건: 목록 요소 / 본문 컨테이너
+    LIST_READY = ReadyCondition(selector="a.article, table.board-list, .article-board")
+    DETAIL_READY = ReadyCondition(selector=", ".join(CONTENT_SELECTORS))
+
+    # 트리를 만들 최상위 요소 (목록 게시판 / 본문, 작성자, 조회수, 댓글)
+    LIST_TARGETS = (".article-board", "a.article")
+    DETAIL_TARGETS = tuple(select_roots(
+        CONTENT_SELECTORS + AUTHOR_SELECTORS + VIEW_SELECTORS + [".u_cbox_comment_box"]
+    ))
+
+    # 목록 API 페이지 크기 / 게시글당 추가 댓글 페이지 최대 수
+    LIST_PAGE_SIZE = 50
+    COMMENT_PAGE_LIMIT = 10
+
+    def __init__(
+        self,
+        cafe_id: str,
+        source_code: str,
+        nid: str = None,
+        npw: str = None,
+        host: str = None,
+        fetch_mode: str = None,
+        api_host: str = None,
+        club_id: str = None
+    ):
         """
         Args:
             cafe_id: 카페 ID (예: gongstar, m2school)
             source_code: 소스 코드 (DB 저장용)
             nid: 네이버 아이디 (로그인 필요 시)
             npw: 네이버 비밀번호
+            host: 요청 호스트 (로컬 스텁 서버 테스트용, 기본: https://cafe.naver.com)
+            fetch_mode: 'api'(JSON API, 차단 시 브라우저 전환) 또는 'browser'
+                        (기본: NAVER_FETCH_MODE 환경변수, 없으면 'api')
+            api_host: JSON API 호스트 (로컬 스텁 서버 테스트용, 기본: https://apis.naver.com)
+            club_id: 이전에 확인한 Club ID (소스 설정에 저장된 값)
         """
-        super().__init__(source_code, f"https://cafe.naver.com/{cafe_id}")
+        self.host = (host or self.DEFAULT_HOST).rstrip('/')
+        self.api_host = (api_host or self.DEFAULT_API_HOST).rstrip('/')
+        super().__init__(source_code, f"{self.host}/{cafe_id}")
         self.cafe_id = cafe_id
         self.nid = nid
         self.npw = npw
-        self.club_id = self.CAFE_IDS.get(cafe_id)
+        self.club_id = club_id or self.CAFE_IDS.get(cafe_id)
+        self.fetch_mode = (fetch_mode or os.getenv('NAVER_FETCH_MODE', 'api')).lower()
+        self.session_store = SessionStore('naver', nid, secret=npw) if nid and npw else None
 
     async def login(self):
         """네이버 로그인"""
@@ -56,6 +121,70 @@ class NaverCafeCrawler(BaseCrawler):
             logger.warning(f"Login failed: {e}")
             return False
 
+    async def _saved_session(self) -> Optional[Dict[str, Any]]:
+        """저장된 로그인 세션 (세션 확인 요청을 통과한 경우만)"""
+        state = self.session_store.load()
+        if state is None:
+            return None
+
+        valid = await self._probe_session(state.get('cookies', []))
+        if valid is None:
+            # 네트워크 오류 등으로 확인 불가 - 세션은 지우지 않고 그대로 사용
+            logger.info("Could not verify saved Naver session, reusing it")
+            return state
+        if valid:
+            logger.info("Reusing saved Naver session")
+            return state
+
+        logger.info("Saved Naver session rejected, logging in again")
+        self.session_store.clear()
+        return None
+
+    async def _probe_session(self, cookies: List[Dict[str, Any]]) -> Optional[bool]:
+        """
+        쿠키로 로그인 필요 페이지 요청
+
+        Returns:
+            True: 유효, False: 로그인 페이지로 리다이렉트됨,
+            None: 타임아웃/연결 오류/차단 등으로 확인 불가
+        """
+        headers = {
+            "User-Agent": self.DESKTOP_UA,
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
+        }
+        try:
+            async with HttpFetcher(headers=headers, max_connections=1, cookies=cookies) as fetcher:
+                response = await fetcher.request("GET", self.SESSION_PROBE_URL, max_retries=1)
+        except BlockedError as e:
+            logger.warning(f"Session probe blocked: {e}")
+            return None
+
+        if response is None:
+            return None
+        return 'nidlogin' not in str(response.url)
+
+    async def _login_and_save(self) -> Optional[Dict[str, Any]]:
+        """
+        현재 컨텍스트에서 로그인 후 세션 저장
+
+        Returns:
+            storage_state (로그인 실패 또는 세션 확인 실패 시 None)
+        """
+        if not await self.login():
+            return None
+
+        state = await self.context.storage_state()
+        valid = await self._probe_session(state.get('cookies', []))
+        if valid is False:
+            # 캡차/추가 인증 등으로 로그인이 완료되지 않음
+            logger.warning("Login did not produce a valid session")
+            return None
+
+        # 확인하지 못한 세션은 이번 크롤링에만 사용
+        if valid:
+            self.session_store.save(state)
+        return state
+
     async def get_club_id(self) -> Optional[str]:
         """카페 Club ID 추출"""
         if self.club_id:
@@ -78,115 +207,346 @@ class NaverCafeCrawler(BaseCrawler):
 
     async def crawl(self, keyword: str, limit: int = 50) -> List[Dict[str, Any]]:
         """키워드로 검색하여 크롤링 (데스크톱 모드)"""
-        results = []
+        return [post async for post in self.stream(keyword=keyword, limit=limit)]
 
+    async def crawl_latest(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최신글 크롤링 (전체 게시판, 데스크톱 모드)"""
+        return [post async for post in self.stream(limit=limit)]
+
+    async def stream(self, keyword: str = None, limit: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """게시글 스트리밍 크롤링 (keyword 가 없으면 전체 게시판 최신글, API 우선)"""
+        yielded_ids = set()
+
+        if self.fetch_mode == 'api':
+            try:
+                async with aclosing(self._stream_api(keyword, limit)) as posts:
+                    async for post in posts:
+                        yielded_ids.add(post['external_id'])
+                        yield post
+                return
+            except BlockedError as e:
+                logger.warning(f"Cafe API unavailable, falling back to browser: {e}")
+
+        # API 로 이미 내보낸 게시글은 브라우저 모드에서 건너뜀
+        async with aclosing(self._stream_browser(keyword, limit, skip_ids=yielded_ids)) as posts:
+            async for post in posts:
+                yield post
+
+    async def _stream_browser(
+        self,
+        keyword: str,
+        limit: int,
+        skip_ids: Iterable[str] = ()
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Playwright 로 목록 + 상세 크롤링"""
         try:
-            await self.setup_browser(headless=True, mobile=False)
+            skip_ids = set(skip_ids)
+            articles = [
+                article for article in await self._fetch_article_list(keyword, limit)
+                if article['external_id'] not in skip_ids
+            ]
+            if keyword:
+                logger.info(f"Found {len(articles)} articles. Fetching details...")
 
-            if self.nid and self.npw:
-                login_ok = await self.login()
-                if not login_ok:
-                    logger.info("Continuing without login (fallback)")
+            # 상세 페이지 크롤링 (탭 풀 병렬)
+            async with aclosing(self.iter_details(articles)) as posts:
+                async for post in posts:
+                    yield post
+
+        finally:
+            await self.close_browser()
+
+    async def _stream_api(self, keyword: str, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        카페 JSON API 로 목록 + 상세(본문/댓글) 크롤링
+
+        Raises:
+            BlockedError: 차단 응답 또는 목록 API 사용 불가 (브라우저 모드로 재시도 필요)
+        """
+        cookies = await self._login_cookies()
+
+        headers = {
+            "User-Agent": self.DESKTOP_UA,
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Accept": "application/json, text/plain, */*",
+            "Referer": f"{self.host}/{self.cafe_id}"
+        }
 
-            club_id = await self.get_club_id()
+        async with HttpFetcher(
+            headers=headers,
+            throttle=self.throttle,
+            max_connections=self.DETAIL_CONCURRENCY,
+            cookies=cookies
+        ) as fetcher:
+            club_id = await self._resolve_club_id_api(fetcher)
             if not club_id:
-                logger.error("Failed to get ClubID. Aborting.")
-                return results
+                raise BlockedError(f"Cannot resolve ClubID for {self.cafe_id}")
 
-            # 데스크톱 검색 URL
-            search_url = f"https://cafe.naver.com/ArticleSearchList.nhn?search.clubid={club_id}&search.searchBy=1&search.query={keyword}&search.sortBy=date"
-            logger.info(f"Crawling: {search_url}")
+            with self.timer.request():
+                articles = self.filter_known_articles(
+                    await self._fetch_article_list_api(fetcher, club_id, keyword, limit)
+                )
+            logger.info(f"Found {len(articles)} articles. Fetching details (api)...")
 
-            if not await self.safe_goto(search_url):
-                return results
+            async def fetch(article: Dict[str, Any]) -> Dict[str, Any]:
+                detail = await self._crawl_detail_api(fetcher, club_id, article['external_id'])
+                article.update(detail)
+                return article
 
-            # 목록 셀렉터 대기 (데스크톱)
-            list_selectors = ["a.article", "table.board-list", ".article-board"]
-            list_found = False
-            for sel in list_selectors:
-                try:
-                    await self.page.wait_for_selector(sel, timeout=5000)
-                    list_found = True
-                    break
-                except Exception:
-                    continue
+            # 차단 감지 시 iter_details 가 남은 요청을 취소하고 BlockedError 전파
+            async with aclosing(self.iter_details(articles, fetch=fetch)) as posts:
+                async for post in posts:
+                    yield post
 
-            if not list_found:
-                logger.warning("No results found")
-                return results
+    async def _login_cookies(self) -> List[Dict[str, Any]]:
+        """
+        로그인 쿠키 반환 (계정 정보가 없거나 실패하면 빈 목록)
 
-            # 목록 파싱 (데스크톱)
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            items = soup.select("a.article")
+        저장된 세션이 유효하면 브라우저를 띄우지 않고, 아니면 브라우저로 로그인 후 저장한다.
+        """
+        if not self.session_store:
+            return []
+
+        async with self.session_store.lock():
+            state = await self._saved_session()
+            if state:
+                return state.get('cookies', [])
+
+            try:
+                await self.setup_browser(headless=True, mobile=False)
+                state = await self._login_and_save()
+            finally:
+                await self.close_browser()
+
+        if not state:
+            logger.info("Continuing without login (fallback)")
+            return []
+        return state.get('cookies', [])
+
+    async def _resolve_club_id_api(self, fetcher: HttpFetcher) -> Optional[str]:
+        """카페 ID(URL)로 Club ID 조회 (이미 알고 있으면 요청 생략)"""
+        if self.club_id:
+            return self.club_id
 
-            articles = []
-            for item in items[:limit]:
+        data = await fetcher.get_json(
+            f"{self.api_host}/cafe-web/cafe2/CafeGateInfo.json?{urlencode({'cluburl': self.cafe_id})}"
+        )
+        try:
+            club_id = data['message']['result']['cafeInfoView']['cafeId']
+        except (KeyError, TypeError):
+            logger.warning(f"Unexpected cafe info response for {self.cafe_id}")
+            return None
+
+        self.club_id = str(club_id)
+        logger.info(f"Detected ClubID: {self.club_id}")
+        return self.club_id
+
+    async def _fetch_article_list_api(
+        self,
+        fetcher: HttpFetcher,
+        club_id: str,
+        keyword: str,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        검색/전체글 목록 API (LIST_PAGE_SIZE 씩 limit 까지 페이지 조회)
+
+        Raises:
+            BlockedError: 첫 페이지 응답이 없거나 형식이 다름
+        """
+        articles = []
+        page = 1
+
+        while len(articles) < limit:
+            if keyword:
+                url = f"{self.api_host}/cafe-web/cafe-mobile/CafeMobileWebArticleSearchListV4?" + urlencode({
+                    'cafeId': club_id,
+                    'query': keyword,
+                    'searchBy': 1,
+                    'sortBy': 'date',
+                    'page': page,
+                    'perPage': self.LIST_PAGE_SIZE
+                })
+            else:
+                url = f"{self.api_host}/cafe-web/cafe2/ArticleListV2dot1.json?" + urlencode({
+                    'search.clubid': club_id,
+                    'search.queryType': 'lastArticle',
+                    'search.menuid': 0,
+                    'search.page': page,
+                    'search.perPage': self.LIST_PAGE_SIZE
+                })
+
+            data = await fetcher.get_json(url)
+            try:
+                items = data['message']['result']['articleList']
+            except (KeyError, TypeError):
+                if page == 1:
+                    raise BlockedError(f"Unexpected article list response: {url}")
+                break
+
+            for item in items:
+                # 검색 API 는 {'type': 'ARTICLE', 'item': {...}} 형태
+                article = self._parse_api_list_item(item.get('item', item), club_id)
+                if article:
+                    articles.append(article)
+
+            if len(items) < self.LIST_PAGE_SIZE:
+                break
+            page += 1
+
+        return articles[:limit]
+
+    def _parse_api_list_item(self, item: Dict[str, Any], club_id: str) -> Optional[Dict[str, Any]]:
+        """목록 API 항목 → 게시글 dict (브라우저 목록 파싱 결과와 같은 형식)"""
+        article_id = item.get('articleId')
+        title = html.unescape(item.get('subject') or '').strip()
+        if not article_id or not title:
+            return None
+
+        return {
+            'external_id': str(article_id),
+            'title': title,
+            'url': f"{self.host}/ArticleRead.nhn?clubid={club_id}&articleid={article_id}",
+            'post_date': self._from_timestamp(item.get('writeDateTimestamp')),
+            'comment_count': item.get('commentCount') or 0,
+            'content': '',
+            'author': item.get('writerNickname') or '',
+            'view_count': item.get('readCount') or 0,
+            'like_count': item.get('likeItCount') or 0,
+            'comments': []
+        }
+
+    async def _crawl_detail_api(self, fetcher: HttpFetcher, club_id: str, article_id: str) -> Dict[str, Any]:
+        """
+        게시글 API 로 본문 + 댓글 조회 (첫 댓글 페이지는 게시글 응답에 포함)
+
+        Raises:
+            BlockedError: 차단 응답 감지
+        """
+        result = {
+            'content': '',
+            'comments': []
+        }
+        base = f"{self.api_host}/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}"
+
+        try:
+            data = await fetcher.get_json(f"{base}?useCafeId=true&requestFrom=A")
+            if not isinstance(data, dict) or 'article' not in (data.get('result') or {}):
+                # 회원 공개 글 등 (목록 정보만 저장)
+                logger.debug(f"Article not readable via API: {article_id}")
+                return result
+
+            article = data['result']['article']
+            soup = self.parser.parse(article.get('contentHtml') or '')
+            content_elem = soup.select_one('.se-main-container') or soup
+
+            result['content'] = content_elem.get_text(strip=True)
+            result['author'] = (article.get('writer') or {}).get('nick', '')
+            result['view_count'] = article.get('readCount') or 0
+
+            items = list(((data['result'].get('comments') or {}).get('items')) or [])
+            comment_count = article.get('commentCount') or 0
+
+            page = 2
+            while len(items) < comment_count and page <= self.COMMENT_PAGE_LIMIT:
+                more = await fetcher.get_json(f"{base}/comments/pages/{page}?requestFrom=A&orderBy=asc")
                 try:
-                    article = self._parse_list_item(item)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.debug(f"Parse error: {e}")
-                    continue
-
-            logger.info(f"Found {len(articles)} articles. Fetching details...")
-
-            # 상세 페이지 크롤링
-            for article in articles:
-                detail = await self._crawl_detail(article['url'])
-                article.update(detail)
-                results.append(article)
-                await self.random_delay()
+                    page_items = more['result']['comments']['items']
+                except (KeyError, TypeError):
+                    break
+                if not page_items:
+                    break
+                items.extend(page_items)
+                page += 1
 
-        finally:
-            await self.close_browser()
+            result['comments'] = self._parse_api_comments(items)
+            result['comment_count'] = max(comment_count, len(result['comments']))
 
-        return results
+        except BlockedError:
+            raise
+        except Exception as e:
+            logger.warning(f"Detail crawl error: {e}")
 
-    async def crawl_latest(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """최신글 크롤링 (전체 게시판, 데스크톱 모드)"""
-        results = []
+        return result
 
+    def _parse_api_comments(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """댓글 API 항목 → 댓글 dict (브라우저 모드와 같은 순번 external_id)"""
+        comments = []
+        for idx, item in enumerate(items):
+            if item.get('isDeleted') or not item.get('content'):
+                continue
+            comments.append({
+                'external_id': str(idx),
+                'content': self.parser.text(item['content']),
+                'author': (item.get('writer') or {}).get('nick', ''),
+                'comment_date': self._from_timestamp(item.get('updateDate') or item.get('writeDate')),
+                'like_count': 0
+            })
+        return comments
+
+    @staticmethod
+    def _from_timestamp(value: Any) -> Optional[datetime]:
+        """API 시각(epoch ms) → 한국 시각 naive datetime"""
         try:
-            await self.setup_browser(headless=True, mobile=False)
+            return datetime.fromtimestamp(int(value) / 1000, KST).replace(tzinfo=None)
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
 
-            if self.nid and self.npw:
-                login_ok = await self.login()
-                if not login_ok:
+    async def _fetch_article_list(self, keyword: str, limit: int) -> List[Dict[str, Any]]:
+        """브라우저 준비(저장된 세션 복원 또는 로그인) 후 검색/전체글 목록 파싱"""
+        if self.session_store:
+            async with self.session_store.lock():
+                state = await self._saved_session()
+                await self.setup_browser(headless=True, mobile=False, storage_state=state)
+                if state is None and not await self._login_and_save():
                     logger.info("Continuing without login (fallback)")
+        else:
+            await self.setup_browser(headless=True, mobile=False)
 
-            club_id = await self.get_club_id()
-            if not club_id:
-                return results
+        club_id = await self.get_club_id()
+        if not club_id:
+            if keyword:
+                logger.error("Failed to get ClubID. Aborting.")
+            return []
 
+        if keyword:
+            # 데스크톱 검색 URL
+            list_url = f"{self.host}/ArticleSearchList.nhn?search.clubid={club_id}&search.searchBy=1&search.query={keyword}&search.sortBy=date"
+            logger.info(f"Crawling: {list_url}")
+        else:
             # 데스크톱 전체글 보기 URL
-            list_url = f"https://cafe.naver.com/ArticleList.nhn?search.clubid={club_id}&search.menuid=0&search.boardtype=L"
+            list_url = f"{self.host}/ArticleList.nhn?search.clubid={club_id}&search.menuid=0&search.boardtype=L"
             logger.info(f"Crawling latest: {list_url}")
 
-            if not await self.safe_goto(list_url):
-                return results
+        with self.timer.request():
+            return await self._load_list_page(list_url, keyword, limit)
 
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            items = soup.select("a.article")
+    async def _load_list_page(self, list_url: str, keyword: str, limit: int) -> List[Dict[str, Any]]:
+        """목록 페이지 이동 후 파싱 (데스크톱 모드)"""
+        if not await self.safe_goto(list_url):
+            return []
 
-            for item in items[:limit]:
-                try:
-                    article = self._parse_list_item(item)
-                    if article:
-                        detail = await self._crawl_detail(article['url'])
-                        article.update(detail)
-                        results.append(article)
-                        await self.random_delay()
-                except Exception as e:
-                    logger.debug(f"Error: {e}")
-                    continue
+        # 검색 결과가 없으면 목록 요소가 나타나지 않음
+        if not await self.wait_ready(self.page, self.LIST_READY) and keyword:
+            logger.warning("No results found")
+            return []
 
-        finally:
-            await self.close_browser()
+        # 목록 파싱 (데스크톱)
+        content = await self.page.content()
+        soup = self.parser.parse(content, self.LIST_TARGETS)
+        items = soup.select("a.article")
+
+        articles = []
+        for item in items[:limit]:
+            try:
+                article = self._parse_list_item(item)
+                if article:
+                    articles.append(article)
+            except Exception as e:
+                logger.debug(f"Parse error: {e}")
+                continue
 
-        return results
+        return self.filter_known_articles(articles)
 
     def _parse_list_item(self, item) -> Optional[Dict[str, Any]]:
         """목록 아이템 파싱 (데스크톱 모드: item은 a.article 엘리먼트)"""
@@ -241,7 +601,7 @@ class NaverCafeCrawler(BaseCrawler):
 
         # URL (이미 절대경로)
         if href.startswith('/'):
-            url = f"https://cafe.naver.com{href}"
+            url = f"{self.host}{href}"
         else:
             url = href
 
@@ -258,8 +618,9 @@ class NaverCafeCrawler(BaseCrawler):
             'comments': []
         }
 
-    async def _crawl_detail(self, url: str) -> Dict[str, Any]:
+    async def _crawl_detail(self, url: str, page: Page = None) -> Dict[str, Any]:
         """상세 페이지 크롤링 (데스크톱 모드)"""
+        page = page or self.page
         result = {
             'content': '',
             'author': '',
@@ -271,40 +632,27 @@ class NaverCafeCrawler(BaseCrawler):
         try:
             # 데스크톱 URL로 변환 (m.cafe → cafe)
             desktop_url = url.replace("m.cafe.naver.com", "cafe.naver.com")
-            await self.safe_goto(desktop_url)
-            await self.page.wait_for_timeout(1500)
+            await self.safe_goto(desktop_url, page=page, ready=self.DETAIL_READY)
 
-            html = await self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            html = await page.content()
+            soup = self.parser.parse(html, self.DETAIL_TARGETS)
 
             # 본문 추출 (데스크톱 + 모바일 셀렉터 모두 시도)
-            content_selectors = [
-                ".se-main-container", "#postContent", ".post_content",
-                "div.ContentRenderer", ".article_viewer", "#body"
-            ]
-            for sel in content_selectors:
+            for sel in self.CONTENT_SELECTORS:
                 elem = soup.select_one(sel)
                 if elem:
                     result['content'] = elem.get_text(strip=True)
                     break
 
-            # 작성자 (데스크톱 셀렉터)
-            author_selectors = [
-                ".WriterInfo .nickname", ".article_writer .nickname",
-                ".nick_box .nickname", ".nick", ".writer"
-            ]
-            for sel in author_selectors:
+            # 작성자
+            for sel in self.AUTHOR_SELECTORS:
                 author_elem = soup.select_one(sel)
                 if author_elem:
                     result['author'] = author_elem.get_text(strip=True)
                     break
 
-            # 조회수 (데스크톱 셀렉터)
-            view_selectors = [
-                ".article_info .count", ".no", ".view_count",
-                "span.count"
-            ]
-            for sel in view_selectors:
+            # 조회수
+            for sel in self.VIEW_SELECTORS:
                 view_elem = soup.select_one(sel)
                 if view_elem:
                     try:
@@ -0,0 +1,136 @@
+"""
+Resource Policy
+브라우저 요청 차단 정책 (이미지/폰트/미디어, 광고/분석 호스트)
+"""
+import logging
+import os
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+from playwright.async_api import Route
+
+logger = logging.getLogger(__name__)
+
+
+def _env_list(name: str, default: str) -> frozenset:
+    """쉼표 구분 환경변수 → 소문자 집합"""
+    return frozenset(v.strip().lower() for v in os.getenv(name, default).split(',') if v.strip())
+
+
+class ResourceStats:
+    """크롤링 1회의 요청 차단 집계"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked = 0
+        self.blocked_bytes_est = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_by_host: Dict[str, int] = {}
+
+    def record_blocked(self, resource_type: str, host: str, estimated_bytes: int):
+        self.blocked += 1
+        self.blocked_bytes_est += estimated_bytes
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.blocked_by_host[host] = self.blocked_by_host.get(host, 0) + 1
+
+
+class ResourcePolicy:
+    """
+    리소스 유형/호스트별 요청 허용·차단 정책
+
+    크롤러는 page.content() 의 텍스트만 파싱하므로 이미지/폰트/미디어와 광고/분석 요청은
+    필요 없다. 판정 순서는 허용 목록(유형/호스트) → 차단 호스트 → 차단 유형이며,
+    호스트는 하위 도메인까지 일치한다. 스크립트/XHR 은 차단 유형이 아니므로 JS 로 그리는
+    댓글 등은 그대로 로드되고, 광고 호스트의 iframe 문서는 호스트 기준으로 차단된다.
+    차단된 요청은 내려받지 않으므로 절감 바이트는 유형별 평균 크기로 추정한다.
+    """
+
+    # 기본 차단 유형 (Playwright request.resource_type)
+    BLOCK_TYPES = _env_list("BROWSER_BLOCK_TYPES", "image,media,font")
+
+    # 유형과 무관하게 차단할 광고/분석 호스트
+    BLOCK_HOSTS = _env_list(
+        "BROWSER_BLOCK_HOSTS",
+        "doubleclick.net,googlesyndication.com,googleadservices.com,google-analytics.com,"
+        "googletagmanager.com,googletagservices.com,adservice.google.com,facebook.net,"
+        "criteo.com,criteo.net,scorecardresearch.com,"
+        "siape.veta.naver.com,nam.veta.naver.com,tivan.naver.com,wcs.naver.net,lcs.naver.com,"
+        "addc.dcinside.com"
+    )
+
+    # 항상 허용 (차단 목록보다 우선)
+    ALLOW_TYPES = _env_list("BROWSER_ALLOW_TYPES", "")
+    ALLOW_HOSTS = _env_list("BROWSER_ALLOW_HOSTS", "")
+
+    # 차단 요청 크기 추정치 (바이트, 유형별)
+    ESTIMATED_BYTES = {
+        'image': 40 * 1024,
+        'media': 500 * 1024,
+        'font': 30 * 1024,
+        'stylesheet': 20 * 1024,
+        'script': 30 * 1024
+    }
+    DEFAULT_ESTIMATED_BYTES = 5 * 1024
+
+    def __init__(
+        self,
+        enabled: bool = None,
+        block_types: Iterable[str] = None,
+        block_hosts: Iterable[str] = None,
+        allow_types: Iterable[str] = None,
+        allow_hosts: Iterable[str] = None
+    ):
+        """
+        Args:
+            enabled: 차단 사용 여부 (기본: BROWSER_BLOCK_RESOURCES 환경변수, 없으면 true)
+            block_types: 차단할 리소스 유형 (기본: BLOCK_TYPES)
+            block_hosts: 차단할 호스트 (기본: BLOCK_HOSTS)
+            allow_types: 항상 허용할 리소스 유형 (기본: ALLOW_TYPES)
+            allow_hosts: 항상 허용할 호스트 (기본: ALLOW_HOSTS)
+        """
+        if enabled is None:
+            enabled = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() == "true"
+        self.enabled = enabled
+        self.block_types = self.BLOCK_TYPES if block_types is None else frozenset(block_types)
+        self.block_hosts = self.BLOCK_HOSTS if block_hosts is None else frozenset(block_hosts)
+        self.allow_types = self.ALLOW_TYPES if allow_types is None else frozenset(allow_types)
+        self.allow_hosts = self.ALLOW_HOSTS if allow_hosts is None else frozenset(allow_hosts)
+
+    @staticmethod
+    def _host_matches(host: str, hosts: frozenset) -> bool:
+        """호스트 또는 상위 도메인이 목록에 있는지"""
+        parts = host.split('.')
+        return any('.'.join(parts[i:]) in hosts for i in range(len(parts)))
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """요청 차단 여부"""
+        host = (urlparse(url).hostname or '').lower()
+
+        if resource_type in self.allow_types or self._host_matches(host, self.allow_hosts):
+            return False
+        if self._host_matches(host, self.block_hosts):
+            return True
+        return resource_type in self.block_types
+
+    def handler(self, stats: ResourceStats):
+        """BrowserContext.route 용 핸들러 (판정 결과를 stats 에 집계)"""
+
+        async def handle(route: Route):
+            request = route.request
+            resource_type = request.resource_type
+            try:
+                if self.should_block(resource_type, request.url):
+                    stats.record_blocked(
+                        resource_type,
+                        urlparse(request.url).hostname or '',
+                        self.ESTIMATED_BYTES.get(resource_type, self.DEFAULT_ESTIMATED_BYTES)
+                    )
+                    await route.abort('blockedbyclient')
+                    return
+
+                stats.allowed += 1
+                await route.continue_()
+            except Exception as e:
+                # 페이지/컨텍스트가 이미 닫힌 경우
+                logger.debug(f"Route handling failed for {request.url}: {e}")
+
+        return handle
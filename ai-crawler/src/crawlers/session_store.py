@@ -0,0 +1,143 @@
+"""
+Session Store
+로그인 세션(Playwright storage_state) 암호화 파일 저장소
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+from cryptography.fernet import Fernet, InvalidToken
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """
+    계정별 로그인 세션 저장소
+
+    storage_state(쿠키 + localStorage)를 Fernet 으로 암호화해 계정별 파일에 저장한다.
+    유효 기간은 Fernet 토큰 생성 시각 기준으로 검사하며, 만료/복호화 실패(키 변경 등)
+    파일은 없는 것으로 취급한다. 키는 SESSION_ENCRYPTION_KEY 환경변수에서, 없으면 계정
+    비밀번호에서 유도하므로 비밀번호가 바뀌면 이전 세션은 자동으로 무효가 된다.
+    """
+
+    SESSION_DIR = os.getenv("SESSION_DIR", ".sessions")
+    TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "12"))
+
+    KDF_ITERATIONS = 200_000
+
+    # 계정별 로그인 직렬화 (같은 계정 소스 동시 크롤링 시 중복 로그인 방지)
+    _locks: Dict[str, asyncio.Lock] = {}
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __init__(
+        self,
+        site: str,
+        account: str,
+        secret: str = None,
+        directory: str = None,
+        ttl_hours: float = None
+    ):
+        """
+        Args:
+            site: 사이트 이름 (파일명 접두사, 예: naver)
+            account: 계정 아이디
+            secret: SESSION_ENCRYPTION_KEY 환경변수가 없을 때 쓸 비밀값 (예: 계정 비밀번호)
+            directory: 저장 디렉터리 (기본: SESSION_DIR 환경변수, 없으면 .sessions)
+            ttl_hours: 세션 유효 시간 (기본: SESSION_TTL_HOURS 환경변수, 없으면 12)
+        """
+        self.site = site
+        self.account = account
+        self.secret = os.getenv("SESSION_ENCRYPTION_KEY") or secret
+        self.directory = directory or self.SESSION_DIR
+        self.ttl_hours = self.TTL_HOURS if ttl_hours is None else ttl_hours
+        self._account_hash = hashlib.sha256(f"{site}:{account}".encode()).hexdigest()[:16]
+        self._fernet: Optional[Fernet] = None
+
+    @property
+    def path(self) -> str:
+        """세션 파일 경로 (계정 아이디는 해시로만 노출)"""
+        return os.path.join(self.directory, f"{self.site}_{self._account_hash}.session")
+
+    def _cipher(self) -> Fernet:
+        """비밀값에서 유도한 Fernet 키 (PBKDF2-SHA256, 계정별 salt)"""
+        if self._fernet is None:
+            key = hashlib.pbkdf2_hmac(
+                'sha256',
+                self.secret.encode(),
+                f"teacherhub:{self._account_hash}".encode(),
+                self.KDF_ITERATIONS
+            )
+            self._fernet = Fernet(base64.urlsafe_b64encode(key))
+        return self._fernet
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """저장된 storage_state (없거나 만료/손상 시 None)"""
+        if not self.secret or self.ttl_hours <= 0 or not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, 'rb') as f:
+                token = f.read()
+            state = json.loads(self._cipher().decrypt(token, ttl=int(self.ttl_hours * 3600)))
+        except InvalidToken:
+            logger.info(f"Saved {self.site} session expired or unreadable, discarding")
+            self.clear()
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read {self.site} session: {e}")
+            return None
+
+        logger.debug(f"Loaded {self.site} session: {len(state.get('cookies', []))} cookies")
+        return state
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        """
+        storage_state 암호화 저장 (임시 파일 작성 후 교체, 소유자만 읽기/쓰기)
+
+        Returns:
+            저장 여부 (비밀값이 없거나 TTL 이 0이면 저장하지 않음)
+        """
+        if not self.secret or self.ttl_hours <= 0:
+            return False
+
+        token = self._cipher().encrypt(json.dumps(state).encode())
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(token)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save {self.site} session: {e}")
+            return False
+
+        logger.info(f"Saved {self.site} session (valid for {self.ttl_hours:g}h)")
+        return True
+
+    def clear(self):
+        """저장된 세션 삭제"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove {self.site} session: {e}")
+
+    def lock(self) -> asyncio.Lock:
+        """
+        계정별 비동기 락
+
+        asyncio.Lock 은 생성된 루프에 묶이므로, 루프가 바뀌면(asyncio.run 재호출 등)
+        이전 락은 버린다.
+        """
+        loop = asyncio.get_running_loop()
+        if SessionStore._loop is not loop:
+            SessionStore._locks = {}
+            SessionStore._loop = loop
+
+        return SessionStore._locks.setdefault(self.path, asyncio.Lock())
@@ -2,9 +2,15 @@
 TeacherHub Database Configuration
 SQLAlchemy Engine 및 Session 설정
 """
+import asyncio
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 
 # Database Connection Settings
@@ -48,6 +54,93 @@ def get_session():
 
 
 def init_db():
-    """Initialize database tables (create if not exists)"""
+    """Initialize database tables (create if not exists) and monthly partitions"""
     from . import models  # Import models to register them
+    from .services.partition_manager import PartitionManager
+
     Base.metadata.create_all(bind=engine)
+
+    # 파티션 테이블(posts/comments/teacher_mentions)은 파티션이 있어야 INSERT 가능
+    db = SessionLocal()
+    try:
+        PartitionManager(db).ensure_partitions()
+    finally:
+        db.close()
+
+
+@contextmanager
+def scratch_database(url: str, prefix: str = "scratch") -> Iterator[Engine]:
+    """
+    임시 데이터베이스 (같은 서버에 생성 후 삭제, 점검/테스트용)
+
+    init_db 와 같이 모델 기준 테이블과 월 파티션을 만든 엔진을 넘겨준다.
+    CREATEDB 권한이 필요하다.
+
+    Args:
+        url: 서버 접속 URL (데이터베이스 이름은 무시)
+        prefix: 임시 데이터베이스 이름 접두어
+    """
+    from . import models  # Import models to register them
+    from .services.partition_manager import PartitionManager
+
+    server_url = make_url(url)
+    name = f"{prefix}_{uuid.uuid4().hex[:8]}"
+
+    admin = create_engine(server_url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin.connect() as conn:
+            conn.execute(text(f'CREATE DATABASE "{name}"'))
+
+        scratch = create_engine(server_url.set(database=name))
+        try:
+            Base.metadata.create_all(bind=scratch)
+            with Session(bind=scratch) as db:
+                PartitionManager(db).ensure_partitions()
+            yield scratch
+        finally:
+            scratch.dispose()
+            with admin.connect() as conn:
+                conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+    finally:
+        admin.dispose()
+
+
+class SessionWorker:
+    """
+    전용 스레드 + 전용 세션 DB 작업자
+
+    async 코드의 동기 SQLAlchemy 작업을 이벤트 루프 밖(작업자 스레드)에서 실행한다.
+    작업은 제출 순서대로 하나씩 실행되므로 세션이 여러 스레드에서 동시에 쓰이지 않는다.
+    세션은 작업자 스레드에서 처음 작업할 때 생성된다.
+    """
+
+    def __init__(self, name: str = "db"):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-worker")
+        self._session: Optional[Session] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _call(self, fn: Callable[..., Any], args, kwargs):
+        if self._session is None:
+            self._session = SessionLocal()
+        return fn(self._session, *args, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """fn(session, *args, **kwargs) 를 작업자 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args, kwargs)
+
+    async def close(self):
+        """세션 종료 및 작업자 스레드 정리 (대기 중인 작업 완료 후)"""
+        def close_session():
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, close_session)
+        self._executor.shutdown(wait=False)
@@ -126,7 +126,7 @@ async def run_full_mode():
     except (KeyboardInterrupt, SystemExit):
         pass
     finally:
-        scheduler.stop()
+        await scheduler.shutdown()
 
 
 async def run_ai_only_mode():
@@ -5,8 +5,8 @@ TeacherHub V2 SQLAlchemy Models
 from datetime import datetime, date
 from typing import List, Optional
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, Float, DateTime, Date,
-    ForeignKey, UniqueConstraint, Index, ARRAY
+    Column, Integer, BigInteger, String, Text, Boolean, Float, DateTime, Date,
+    ForeignKey, ForeignKeyConstraint, UniqueConstraint, Index, ARRAY
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -114,20 +114,21 @@ class CollectionSource(Base):
 # 5. 게시글 테이블
 # ============================================
 class Post(Base):
-    """수집된 게시글"""
+    """수집된 게시글 (post_date 월별 파티션, PK 는 파티션 키 포함)"""
     __tablename__ = 'posts'
 
-    id = Column(Integer, primary_key=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     source_id = Column(Integer, ForeignKey('collection_sources.id'))
     external_id = Column(String(100))  # 원본 게시글 ID
     title = Column(String(500), nullable=False)
     content = Column(Text)
     url = Column(String(500))
     author = Column(String(100))
-    post_date = Column(DateTime)
+    post_date = Column(DateTime, primary_key=True, default=datetime.utcnow)  # 파티션 키 (없으면 수집 시각)
     view_count = Column(Integer, default=0)
     like_count = Column(Integer, default=0)
     comment_count = Column(Integer, default=0)
+    content_hash = Column(String(32))  # 제목+본문+댓글 ID 해시 (재수집 시 변경 여부 판정)
     collected_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -137,10 +138,14 @@ class Post(Base):
 
     # Constraints & Indexes
     __table_args__ = (
-        UniqueConstraint('source_id', 'external_id', name='uq_posts_source_external'),
+        # 파티션 키 포함 필수라 DB 는 (source_id, external_id) 1행을 보장하지 않음
+        # (재수집 시 MentionExtractor 가 저장된 post_date 를 재사용해 중복 방지)
+        UniqueConstraint('source_id', 'external_id', 'post_date', name='uq_posts_source_external'),
         Index('idx_posts_source', 'source_id'),
         Index('idx_posts_date', 'post_date'),
+        Index('idx_posts_date_covering', 'post_date', postgresql_include=['id']),
         Index('idx_posts_collected', 'collected_at'),
+        {'postgresql_partition_by': 'RANGE (post_date)'},
     )
 
 
@@ -148,11 +153,12 @@ class Post(Base):
 # 6. 댓글 테이블
 # ============================================
 class Comment(Base):
-    """게시글 댓글"""
+    """게시글 댓글 (게시글 post_date 월별 파티션)"""
     __tablename__ = 'comments'
 
-    id = Column(Integer, primary_key=True)
-    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'))
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    post_id = Column(Integer)
+    post_date = Column(DateTime, primary_key=True)  # 파티션 키 (게시글 post_date)
     external_id = Column(String(100))
     content = Column(Text)
     author = Column(String(100))
@@ -162,11 +168,15 @@ class Comment(Base):
 
     # Relationships
     post = relationship("Post", back_populates="comments")
-    mentions = relationship("TeacherMention", back_populates="comment", cascade="all, delete-orphan")
+    mentions = relationship("TeacherMention", back_populates="comment", cascade="all, delete-orphan",
+                            overlaps="mentions")
 
-    # Indexes
+    # Constraints & Indexes
     __table_args__ = (
+        ForeignKeyConstraint(['post_id', 'post_date'], ['posts.id', 'posts.post_date'], ondelete='CASCADE'),
         Index('idx_comments_post', 'post_id'),
+        Index('uq_comments_post_external', 'post_id', 'external_id', 'post_date', unique=True),
+        {'postgresql_partition_by': 'RANGE (post_date)'},
     )
 
 
@@ -174,13 +184,14 @@ class Comment(Base):
 # 7. 강사 멘션 테이블
 # ============================================
 class TeacherMention(Base):
-    """강사 멘션 및 분석 결과"""
+    """강사 멘션 및 분석 결과 (게시글 post_date 월별 파티션)"""
     __tablename__ = 'teacher_mentions'
 
-    id = Column(Integer, primary_key=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     teacher_id = Column(Integer, ForeignKey('teachers.id', ondelete='CASCADE'))
-    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'))
-    comment_id = Column(Integer, ForeignKey('comments.id', ondelete='CASCADE'), nullable=True)
+    post_id = Column(Integer)
+    comment_id = Column(Integer, nullable=True)
+    post_date = Column(DateTime, primary_key=True)  # 파티션 키 (게시글 post_date)
 
     mention_type = Column(String(20), nullable=False)  # title, content, comment
     matched_text = Column(String(200))  # 매칭된 텍스트
@@ -194,18 +205,31 @@ class TeacherMention(Base):
 
     analyzed_at = Column(DateTime, default=datetime.utcnow)
 
-    # Relationships
+    # Relationships (post_date 는 게시글/댓글 외래키가 공유)
     teacher = relationship("Teacher", back_populates="mentions")
-    post = relationship("Post", back_populates="mentions")
-    comment = relationship("Comment", back_populates="mentions")
+    post = relationship("Post", back_populates="mentions", overlaps="mentions")
+    comment = relationship("Comment", back_populates="mentions", overlaps="post,mentions")
 
     # Constraints & Indexes
     __table_args__ = (
-        UniqueConstraint('teacher_id', 'post_id', 'comment_id', 'mention_type',
+        ForeignKeyConstraint(['post_id', 'post_date'], ['posts.id', 'posts.post_date'], ondelete='CASCADE'),
+        ForeignKeyConstraint(['comment_id', 'post_date'], ['comments.id', 'comments.post_date'],
+                             ondelete='CASCADE'),
+        UniqueConstraint('teacher_id', 'post_id', 'comment_id', 'mention_type', 'post_date',
                         name='uq_mentions_teacher_post_comment_type'),
-        Index('idx_mentions_teacher', 'teacher_id'),
+        Index('idx_mentions_teacher_post', 'teacher_id', 'post_id'),
+        # 강사별 기간 조회 (게시일 범위로 파티션 제외)
+        Index('idx_mentions_teacher_date', 'teacher_id', 'post_date'),
+        # 전체 강사 일간 리포트 (게시일 범위)
+        Index('idx_mentions_post_date', 'post_date'),
         Index('idx_mentions_post', 'post_id'),
         Index('idx_mentions_analyzed', 'analyzed_at'),
+        # 게시글 단위 멘션(comment_id IS NULL) 중복 방지 - 배치 upsert 충돌 대상
+        Index('uq_mentions_post_level', 'teacher_id', 'post_id', 'mention_type', 'post_date',
+              unique=True, postgresql_where=comment_id.is_(None)),
+        # 미분석 멘션 재분석 키셋 스캔
+        Index('idx_mentions_unanalyzed', 'id', postgresql_where=sentiment.is_(None)),
+        {'postgresql_partition_by': 'RANGE (post_date)'},
     )
 
 
@@ -256,7 +280,7 @@ class DailyReport(Base):
     __table_args__ = (
         UniqueConstraint('report_date', 'teacher_id', name='uq_reports_date_teacher'),
         Index('idx_reports_date', 'report_date'),
-        Index('idx_reports_teacher', 'teacher_id'),
+        Index('idx_reports_teacher_date', 'teacher_id', 'report_date'),
     )
 
 
@@ -304,6 +328,10 @@ class CrawlLog(Base):
     comments_collected = Column(Integer, default=0)
     mentions_found = Column(Integer, default=0)
     error_message = Column(Text)
+    wait_seconds = Column(Float)  # 속도 제한/백오프/내용 준비 대기 합 (동시 요청은 각각 합산)
+    work_seconds = Column(Float)  # 요청 처리 시간 중 대기 제외 합
+    requests_blocked = Column(Integer)  # 브라우저에서 차단한 요청 수 (이미지/폰트/미디어, 광고/분석)
+    blocked_bytes_est = Column(BigInteger)  # 차단으로 절감한 전송량 추정치 (바이트)
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -396,6 +424,7 @@ class WeeklyReport(Base):
         Index('idx_weekly_reports_teacher', 'teacher_id'),
         Index('idx_weekly_reports_academy', 'academy_id'),
         Index('idx_weekly_reports_year_week', 'year', 'week_number'),
+        Index('idx_weekly_reports_year_week_mentions', 'year', 'week_number', mention_count.desc()),
     )
 
 
@@ -487,6 +516,35 @@ class SystemConfig(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# ============================================
+# 16. 강사 x 일자 멘션 집계 테이블
+# ============================================
+class TeacherMentionDaily(Base):
+    """강사 x 일자 멘션 집계 (teacher_mentions 트리거로 증분 유지, V2_4 마이그레이션)"""
+    __tablename__ = 'teacher_mention_daily'
+
+    teacher_id = Column(Integer, ForeignKey('teachers.id', ondelete='CASCADE'), primary_key=True)
+    stat_date = Column(Date, primary_key=True)  # 게시글 작성일 (없으면 수집일)
+
+    mention_count = Column(Integer, nullable=False, default=0)
+    title_count = Column(Integer, nullable=False, default=0)
+    content_count = Column(Integer, nullable=False, default=0)
+    comment_count = Column(Integer, nullable=False, default=0)
+    positive_count = Column(Integer, nullable=False, default=0)
+    negative_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    recommendation_count = Column(Integer, nullable=False, default=0)
+    difficulty_easy_count = Column(Integer, nullable=False, default=0)
+    difficulty_medium_count = Column(Integer, nullable=False, default=0)
+    difficulty_hard_count = Column(Integer, nullable=False, default=0)
+    sentiment_score_sum = Column(Float, nullable=False, default=0)
+    sentiment_score_count = Column(Integer, nullable=False, default=0)  # 평균 = sum / count
+
+    __table_args__ = (
+        Index('idx_mention_daily_date', 'stat_date'),
+    )
+
+
 # ============================================
 # Legacy 테이블 (기존 호환성 유지)
 # ============================================
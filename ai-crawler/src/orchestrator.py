@@ -4,13 +4,14 @@ Crawler Orchestrator
 """
 import asyncio
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
-from .database import SessionLocal
-from .models import CollectionSource, CrawlLog
-from .crawlers import NaverCafeCrawler, DCInsideCrawler
+from .database import SessionLocal, SessionWorker
+from .models import CollectionSource, CrawlLog, Post
+from .crawlers import BaseCrawler, NaverCafeCrawler, DCInsideCrawler, close_browser_pool
 from .services import MentionExtractor
 
 logger = logging.getLogger(__name__)
@@ -32,11 +33,18 @@ class CrawlerOrchestrator:
         'dcinside_gosi': ('dcinside', 'gosi'),
     }
 
+    # 증분 크롤링: 워터마크 이하 게시글의 댓글 수 변화를 재확인하는 기간
+    WATERMARK_LOOKBACK_DAYS = 7
+
+    # 스트리밍 저장: 크롤러 → 큐(최대 STREAM_QUEUE_SIZE) → 배치 저장
+    STREAM_QUEUE_SIZE = 20
+    PERSIST_BATCH_SIZE = 10
+    PERSIST_FLUSH_SEC = 5.0
+
     def __init__(self, db: Session = None, naver_id: str = None, naver_pw: str = None):
         self.db = db or SessionLocal()
         self.naver_id = naver_id
         self.naver_pw = naver_pw
-        self.extractor = MentionExtractor(self.db)
 
     def get_active_sources(self) -> List[CollectionSource]:
         """활성화된 수집 소스 목록"""
@@ -58,7 +66,8 @@ class CrawlerOrchestrator:
                 cafe_id=target_id,
                 source_code=source.code,
                 nid=self.naver_id,
-                npw=self.naver_pw
+                npw=self.naver_pw,
+                club_id=(source.config or {}).get('club_id')
             )
         elif crawler_type == 'dcinside':
             return DCInsideCrawler(
@@ -68,71 +77,293 @@ class CrawlerOrchestrator:
 
         return None
 
+    def apply_watermark(self, source: CollectionSource, crawler: BaseCrawler, db: Session = None):
+        """소스 워터마크와 최근 수집 게시글 댓글 수를 크롤러에 설정 (증분 크롤링)"""
+        db = db or self.db
+        watermark = (source.config or {}).get('watermark') or {}
+        watermark_id = BaseCrawler.parse_external_id(watermark.get('external_id'))
+        if watermark_id is None:
+            return
+
+        known_since = datetime.now() - timedelta(days=self.WATERMARK_LOOKBACK_DAYS)
+        rows = db.query(Post.external_id, Post.comment_count).filter(
+            Post.source_id == source.id,
+            Post.post_date >= known_since
+        ).all()
+
+        crawler.set_watermark(
+            watermark_id,
+            {row.external_id: row.comment_count or 0 for row in rows},
+            known_since
+        )
+
+    def update_club_id(self, source: CollectionSource, crawler: BaseCrawler):
+        """크롤러가 확인한 네이버 카페 Club ID 를 소스 설정에 저장 (다음 실행부터 조회 생략)"""
+        club_id = getattr(crawler, 'club_id', None)
+        config = source.config or {}
+        if not club_id or config.get('club_id') == club_id:
+            return
+
+        # JSONB 변경 감지를 위해 새 dict 로 교체
+        source.config = {**config, 'club_id': club_id}
+
+    def update_watermark(self, source: CollectionSource, posts: List[Dict[str, Any]]):
+        """수집한 게시글 중 최대 external_id 로 소스 워터마크 갱신"""
+        config = source.config or {}
+        watermark = config.get('watermark') or {}
+        current_id = BaseCrawler.parse_external_id(watermark.get('external_id'))
+
+        newest = None
+        for post in posts:
+            post_id = BaseCrawler.parse_external_id(post.get('external_id'))
+            if post_id is not None and (newest is None or post_id > newest[0]):
+                newest = (post_id, post.get('post_date'))
+
+        if newest is None or (current_id is not None and newest[0] <= current_id):
+            return
+
+        # JSONB 변경 감지를 위해 새 dict 로 교체
+        source.config = {
+            **config,
+            'watermark': {
+                'external_id': str(newest[0]),
+                'post_date': newest[1].isoformat() if newest[1] else None,
+                'updated_at': datetime.utcnow().isoformat()
+            }
+        }
+
+    async def stream_and_persist(
+        self,
+        crawler: BaseCrawler,
+        save_batch: Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, int]]],
+        keyword: str = None,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        크롤링과 저장을 겹쳐 실행 (생산자/소비자)
+
+        크롤러 스트림의 게시글을 크기 제한 큐로 넘기고, 소비자가 PERSIST_BATCH_SIZE 건
+        또는 PERSIST_FLUSH_SEC 초마다 모아 save_batch 로 저장한다. 큐가 가득 차면
+        크롤러가 대기하므로 메모리에 머무는 게시글 수는 limit 와 무관하게 제한된다.
+
+        Args:
+            crawler: 크롤러
+            save_batch: 게시글 묶음 저장 코루틴 (MentionExtractor 처리 통계 반환)
+
+        Returns:
+            처리 통계 (posts_crawled, posts_created, posts_updated, posts_unchanged,
+            comments_created, mentions_found) 및 워터마크 갱신용 게시글 ID/날짜 목록 (crawled_keys)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        totals = {
+            'posts_crawled': 0,
+            'posts_created': 0,
+            'posts_updated': 0,
+            'posts_unchanged': 0,
+            'comments_created': 0,
+            'mentions_found': 0,
+            'crawled_keys': []
+        }
+
+        async def produce():
+            try:
+                async with aclosing(crawler.stream(keyword=keyword, limit=limit)) as posts:
+                    async for post in posts:
+                        await queue.put(post)
+            except Exception as e:
+                # 소비자에게 예외 전달
+                await queue.put(e)
+                return
+            await queue.put(None)  # 종료 표시
+
+        async def persist(batch: List[Dict[str, Any]]):
+            stats = await save_batch(batch)
+            for key in ('posts_created', 'posts_updated', 'posts_unchanged', 'comments_created', 'mentions_found'):
+                totals[key] += stats[key]
+            totals['posts_crawled'] += len(batch)
+            totals['crawled_keys'].extend(
+                {'external_id': post.get('external_id'), 'post_date': post.get('post_date')}
+                for post in batch
+            )
+            logger.debug(f"Persisted {len(batch)} posts from {crawler.source_code} (total {totals['posts_crawled']})")
+
+        producer = asyncio.ensure_future(produce())
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=self.PERSIST_FLUSH_SEC)
+                except asyncio.TimeoutError:
+                    # 크롤링이 느릴 때도 모인 게시글은 주기적으로 저장
+                    if batch:
+                        await persist(batch)
+                        batch = []
+                    continue
+
+                if isinstance(item, Exception):
+                    raise item
+                if item is None:
+                    break
+
+                batch.append(item)
+                if len(batch) >= self.PERSIST_BATCH_SIZE:
+                    await persist(batch)
+                    batch = []
+
+            if batch:
+                await persist(batch)
+
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        return totals
+
     async def crawl_source(
         self,
         source: CollectionSource,
         keyword: str = None,
         limit: int = 50
     ) -> Dict[str, Any]:
-        """단일 소스 크롤링"""
+        """
+        단일 소스 크롤링
+
+        DB 작업은 소스 전용 SessionWorker(작업자 스레드 + 세션)에서 실행하므로
+        이벤트 루프를 막지 않고, 동시에 크롤링하는 소스끼리 세션을 공유하지 않는다.
+        """
         result = {
             'source_code': source.code,
             'success': False,
             'posts_collected': 0,
             'comments_collected': 0,
             'mentions_found': 0,
+            'wait_seconds': None,
+            'work_seconds': None,
+            'requests_blocked': None,
+            'blocked_bytes_est': None,
             'error': None
         }
+        crawler = None
+
+        async with SessionWorker(f"db-{source.code}") as worker:
+            # 크롤링 로그 시작
+            job = await worker.run(self._begin_crawl, source.id)
+
+            try:
+                crawler = self.create_crawler(source)
+                if not crawler:
+                    raise Exception(f"Cannot create crawler for {source.code}")
+
+                logger.info(f"Starting crawl: {source.name}")
+
+                # 최신글은 워터마크 기준 증분 크롤링
+                if not keyword:
+                    await worker.run(lambda db: self.apply_watermark(job['source'], crawler, db))
+
+                async def save_batch(batch: List[Dict[str, Any]]) -> Dict[str, int]:
+                    return await worker.run(
+                        lambda db: job['extractor'].process_crawled_data(job['source'], batch)
+                    )
+
+                # 크롤링 + 멘션 추출/저장 (스트리밍)
+                stats = await self.stream_and_persist(crawler, save_batch, keyword=keyword, limit=limit)
+
+                self._record_metrics(result, crawler)
+                logger.info(
+                    f"Crawled {stats['posts_crawled']} posts from {source.code} "
+                    f"({stats['posts_unchanged']} unchanged, "
+                    f"wait {result['wait_seconds']}s / work {result['work_seconds']}s, "
+                    f"{result['requests_blocked']} requests blocked)"
+                )
+
+                result['success'] = True
+                result['posts_collected'] = stats['posts_created'] + stats['posts_updated']
+                result['comments_collected'] = stats['comments_created']
+                result['mentions_found'] = stats['mentions_found']
+
+                await worker.run(lambda db: self.update_club_id(job['source'], crawler))
+                await worker.run(
+                    self._finish_crawl, job, result,
+                    None if keyword else stats['crawled_keys']
+                )
+
+            except Exception as e:
+                result['success'] = False
+                result['error'] = str(e)
+                logger.error(f"Crawl error for {source.code}: {e}")
+
+                if crawler:
+                    self._record_metrics(result, crawler)
+                await worker.run(self._fail_crawl, job, result)
+
+        return result
+
+    @staticmethod
+    def _record_metrics(result: Dict[str, Any], crawler: BaseCrawler):
+        """크롤러의 대기/작업 시간과 브라우저 리소스 차단 집계를 결과에 기록"""
+        result['wait_seconds'] = round(crawler.timer.wait_sec, 3)
+        result['work_seconds'] = round(crawler.timer.work_sec, 3)
+        result['requests_blocked'] = crawler.resource_stats.blocked
+        result['blocked_bytes_est'] = crawler.resource_stats.blocked_bytes_est
+
+    def _begin_crawl(self, db: Session, source_id: int) -> Dict[str, Any]:
+        """크롤링 로그 생성 (작업자 세션용 소스/추출기 준비)"""
+        source = db.get(CollectionSource, source_id)
 
-        # 크롤링 로그 시작
         log = CrawlLog(
-            source_id=source.id,
+            source_id=source_id,
             started_at=datetime.utcnow(),
             status='running'
         )
-        self.db.add(log)
-        self.db.commit()
-
-        try:
-            crawler = self.create_crawler(source)
-            if not crawler:
-                raise Exception(f"Cannot create crawler for {source.code}")
+        db.add(log)
+        db.commit()
 
-            logger.info(f"Starting crawl: {source.name}")
-
-            # 크롤링 실행
-            if keyword:
-                posts = await crawler.crawl(keyword=keyword, limit=limit)
-            else:
-                posts = await crawler.crawl_latest(limit=limit)
-
-            logger.info(f"Crawled {len(posts)} posts from {source.code}")
-
-            # 멘션 추출 및 저장
-            stats = self.extractor.process_crawled_data(source, posts)
-
-            result['success'] = True
-            result['posts_collected'] = stats['posts_created'] + stats['posts_updated']
-            result['comments_collected'] = stats['comments_created']
-            result['mentions_found'] = stats['mentions_found']
-
-            # 로그 업데이트
-            log.status = 'completed'
-            log.finished_at = datetime.utcnow()
-            log.posts_collected = result['posts_collected']
-            log.comments_collected = result['comments_collected']
-            log.mentions_found = result['mentions_found']
-
-        except Exception as e:
-            result['error'] = str(e)
-            logger.error(f"Crawl error for {source.code}: {e}")
-
-            log.status = 'failed'
-            log.finished_at = datetime.utcnow()
-            log.error_message = str(e)
+        return {
+            'source': source,
+            'log': log,
+            'extractor': MentionExtractor(db)
+        }
 
-        self.db.commit()
-        return result
+    def _finish_crawl(
+        self,
+        db: Session,
+        job: Dict[str, Any],
+        result: Dict[str, Any],
+        crawled_keys: Optional[List[Dict[str, Any]]]
+    ):
+        """워터마크 갱신 및 크롤링 로그 완료 처리"""
+        if crawled_keys is not None:
+            self.update_watermark(job['source'], crawled_keys)
+
+        log = job['log']
+        log.status = 'completed'
+        log.finished_at = datetime.utcnow()
+        log.posts_collected = result['posts_collected']
+        log.comments_collected = result['comments_collected']
+        log.mentions_found = result['mentions_found']
+        log.wait_seconds = result['wait_seconds']
+        log.work_seconds = result['work_seconds']
+        log.requests_blocked = result['requests_blocked']
+        log.blocked_bytes_est = result['blocked_bytes_est']
+
+        db.commit()
+
+    def _fail_crawl(self, db: Session, job: Dict[str, Any], result: Dict[str, Any]):
+        """크롤링 로그 실패 처리"""
+        db.rollback()
+
+        log = job['log']
+        log.status = 'failed'
+        log.finished_at = datetime.utcnow()
+        log.error_message = result['error']
+        log.wait_seconds = result['wait_seconds']
+        log.work_seconds = result['work_seconds']
+        log.requests_blocked = result['requests_blocked']
+        log.blocked_bytes_est = result['blocked_bytes_est']
+
+        db.commit()
 
     async def crawl_all_sources(
         self,
@@ -167,6 +398,10 @@ class CrawlerOrchestrator:
                     'posts_collected': 0,
                     'comments_collected': 0,
                     'mentions_found': 0,
+                    'wait_seconds': None,
+                    'work_seconds': None,
+                    'requests_blocked': None,
+                    'blocked_bytes_est': None,
                     'error': str(result)
                 })
             else:
@@ -240,6 +475,7 @@ async def run_daily_crawl(
 
     finally:
         db.close()
+        await close_browser_pool()
 
 
 if __name__ == "__main__":
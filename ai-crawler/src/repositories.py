@@ -168,11 +168,11 @@ class TeacherMentionRepository:
     @staticmethod
     def get_by_teacher_and_date(db: Session, teacher_id: int, start_date: datetime,
                                  end_date: datetime) -> List[TeacherMention]:
-        return db.query(TeacherMention).join(Post).filter(
+        return db.query(TeacherMention).filter(
             and_(
                 TeacherMention.teacher_id == teacher_id,
-                Post.post_date >= start_date,
-                Post.post_date <= end_date
+                TeacherMention.post_date >= start_date,
+                TeacherMention.post_date <= end_date
             )
         ).all()
 
@@ -182,11 +182,11 @@ class TeacherMentionRepository:
         start = datetime.combine(report_date, datetime.min.time())
         end = datetime.combine(report_date, datetime.max.time())
 
-        mentions = db.query(TeacherMention).join(Post).filter(
+        mentions = db.query(TeacherMention).filter(
             and_(
                 TeacherMention.teacher_id == teacher_id,
-                Post.post_date >= start,
-                Post.post_date <= end
+                TeacherMention.post_date >= start,
+                TeacherMention.post_date <= end
             )
         ).all()
 
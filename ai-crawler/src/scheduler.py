@@ -12,8 +12,11 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from .database import SessionLocal
 from .orchestrator import CrawlerOrchestrator
+from .crawlers import close_browser_pool
 from .services.report_generator import ReportGenerator
 from .services.weekly_aggregator import WeeklyAggregator
+from .services.teacher_stats import TeacherStatsService
+from .services.partition_manager import PartitionManager
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,7 @@ class TaskScheduler:
 
         self.scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
         self._is_running = False
+        self._browser_close_task: asyncio.Task = None
 
     def add_crawl_job(
         self,
@@ -98,6 +102,37 @@ class TaskScheduler:
         )
         logger.info(f"Added weekly aggregation job: {job_id} on {day_of_week} at {hour:02d}:{minute:02d}")
 
+    def add_stats_refresh_job(
+        self,
+        minutes: int = 30,
+        job_id: str = "stats_refresh"
+    ):
+        """통계 구체화 뷰 갱신 작업 추가 (N분마다)"""
+        self.scheduler.add_job(
+            self._run_stats_refresh,
+            IntervalTrigger(minutes=minutes),
+            id=job_id,
+            name=f"Stats Refresh (every {minutes}m)",
+            replace_existing=True
+        )
+        logger.info(f"Added stats refresh job: {job_id} every {minutes} minutes")
+
+    def add_partition_job(
+        self,
+        hour: int = 3,
+        minute: int = 30,
+        job_id: str = "partition_maintenance"
+    ):
+        """월별 파티션 유지보수 작업 추가 (매일 특정 시간, 미래 파티션 생성 + 오래된 파티션 보관)"""
+        self.scheduler.add_job(
+            self._run_partition_maintenance,
+            CronTrigger(hour=hour, minute=minute),
+            id=job_id,
+            name="Partition Maintenance",
+            replace_existing=True
+        )
+        logger.info(f"Added partition maintenance job: {job_id} at {hour:02d}:{minute:02d}")
+
     async def _run_crawl(self):
         """크롤링 작업 실행"""
         logger.info("Starting scheduled crawl")
@@ -140,6 +175,9 @@ class TaskScheduler:
                 f"{stats['academy_stats']} academy stats"
             )
 
+            # 최신 리포트 기준 통계 뷰 즉시 갱신
+            TeacherStatsService(db).refresh_views()
+
         except Exception as e:
             logger.error(f"Report generation error: {e}")
         finally:
@@ -161,6 +199,33 @@ class TaskScheduler:
         finally:
             db.close()
 
+    async def _run_stats_refresh(self):
+        """통계 구체화 뷰 갱신 작업 실행"""
+        db = SessionLocal()
+        try:
+            count = TeacherStatsService(db).refresh_views()
+            logger.info(f"Stats refresh completed: {count} views")
+
+        except Exception as e:
+            logger.error(f"Stats refresh error: {e}")
+        finally:
+            db.close()
+
+    async def _run_partition_maintenance(self):
+        """월별 파티션 유지보수 작업 실행"""
+        db = SessionLocal()
+        try:
+            result = PartitionManager(db).run_maintenance()
+            logger.info(
+                f"Partition maintenance completed: "
+                f"{result['created']} created, {result['archived']} months archived"
+            )
+
+        except Exception as e:
+            logger.error(f"Partition maintenance error: {e}")
+        finally:
+            db.close()
+
     def setup_default_jobs(self):
         """기본 작업 설정"""
         # 매일 새벽 1시: 크롤링
@@ -175,10 +240,17 @@ class TaskScheduler:
         # 매주 월요일 새벽 2시: 주간 집계
         self.add_weekly_aggregation_job(day_of_week="mon", hour=2, minute=0)
 
+        # 30분마다: 통계 구체화 뷰 갱신
+        self.add_stats_refresh_job(minutes=30)
+
+        # 매일 새벽 3시 30분: 월별 파티션 생성/보관
+        self.add_partition_job(hour=3, minute=30)
+
         logger.info(
             "Default jobs configured: "
             "daily crawl 01:00, daily report 01:30, "
-            "interval crawl 4h, weekly aggregation Mon 02:00"
+            "interval crawl 4h, weekly aggregation Mon 02:00, stats refresh 30m, "
+            "partition maintenance 03:30"
         )
 
     def start(self):
@@ -206,6 +278,19 @@ class TaskScheduler:
         self._is_running = False
         logger.info("Scheduler stopped")
 
+        # 공유 브라우저 종료 (이벤트 루프 실행 중일 때만 가능)
+        try:
+            self._browser_close_task = asyncio.get_running_loop().create_task(close_browser_pool())
+        except RuntimeError:
+            self._browser_close_task = None
+
+    async def shutdown(self):
+        """스케줄러 중지 및 공유 브라우저 종료 완료까지 대기"""
+        self.stop()
+        if self._browser_close_task:
+            await self._browser_close_task
+            self._browser_close_task = None
+
     def run_now(self, job_type: str = "crawl"):
         """즉시 작업 실행"""
         if job_type == "crawl":
@@ -214,6 +299,10 @@ class TaskScheduler:
             asyncio.create_task(self._run_report_generation())
         elif job_type == "weekly":
             asyncio.create_task(self._run_weekly_aggregation())
+        elif job_type == "stats":
+            asyncio.create_task(self._run_stats_refresh())
+        elif job_type == "partition":
+            asyncio.create_task(self._run_partition_maintenance())
         else:
             logger.warning(f"Unknown job type: {job_type}")
 
@@ -246,7 +335,7 @@ async def run_scheduler():
             await asyncio.sleep(60)
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-        scheduler.stop()
+        await scheduler.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 """
 TeacherHub Services Package
 """
-from .teacher_matcher import TeacherMatcher
+from .teacher_matcher import TeacherMatcher, TeacherDictionary
 from .mention_extractor import MentionExtractor
 from .sentiment_analyzer import SentimentAnalyzer
 from .report_generator import ReportGenerator
 from .weekly_aggregator import WeeklyAggregator
 
-__all__ = ['TeacherMatcher', 'MentionExtractor', 'SentimentAnalyzer', 'ReportGenerator', 'WeeklyAggregator']
+__all__ = ['TeacherMatcher', 'TeacherDictionary', 'MentionExtractor', 'SentimentAnalyzer', 'ReportGenerator', 'WeeklyAggregator']
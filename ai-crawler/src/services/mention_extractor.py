@@ -2,138 +2,131 @@
 Mention Extractor Service
 게시글에서 강사 멘션 추출 및 저장
 """
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, time
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import DateTime, Integer, and_, column, func, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 
 logger = logging.getLogger(__name__)
 
-from .teacher_matcher import TeacherMatcher, MatchResult
+from .teacher_matcher import TeacherMatcher
 from .sentiment_analyzer import SentimentAnalyzer
+from .partition_manager import PartitionManager
 from ..models import (
     Post, Comment, TeacherMention, Teacher, CollectionSource
 )
 
 
+def _chunks(items: List[Any], size: int):
+    """리스트를 size 단위로 분할"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 class MentionExtractor:
     """강사 멘션 추출 서비스"""
 
-    def __init__(self, db: Session):
+    # 배치 저장 시 INSERT 1회에 담을 최대 행 수
+    BULK_CHUNK_SIZE = 500
+
+    def __init__(self, db: Session, bulk: bool = True):
+        """
+        Args:
+            db: DB 세션
+            bulk: True면 배치 upsert(INSERT ... ON CONFLICT)로 저장, False면 건별 SELECT/flush
+        """
         self.db = db
+        self.bulk = bulk
         self.matcher = TeacherMatcher(db)
         self.analyzer = SentimentAnalyzer(db)
         self._initialized = False
+        self._partitioned: Optional[bool] = None  # posts 파티션 테이블 여부 (최초 1회 조회)
 
-    def initialize(self):
-        """서비스 초기화 (강사 정보 및 키워드 로드)"""
+    def initialize(
+        self,
+        teachers: List[Dict[str, Any]] = None,
+        keywords: Dict[str, List[tuple]] = None
+    ):
+        """
+        서비스 초기화 (강사 정보 및 키워드 로드)
+
+        Args:
+            teachers: 강사 정보 목록 (None이면 DB에서 로드)
+            keywords: 분석 키워드 표 (None이면 DB에서 로드)
+        """
         if self._initialized:
             return
 
-        self.matcher.load_teachers()
-        self.analyzer.load_keywords()
+        self.matcher.load_teachers(teachers)
+        self.analyzer.load_keywords(keywords=keywords)
         self._initialized = True
 
-    def extract_and_save(self, post: Post) -> List[TeacherMention]:
+    def extract_and_save(self, post: Post, existing_keys: Set[tuple] = None) -> List[TeacherMention]:
         """
         게시글에서 멘션 추출 및 저장
 
         Args:
             post: Post 모델 객체
+            existing_keys: 이미 저장된 멘션 키 집합 (load_mention_keys 결과, None이면 이 게시글만 조회)
+                           새로 저장한 멘션 키가 추가된다.
 
         Returns:
             생성된 TeacherMention 목록
         """
         self.initialize()
 
-        mentions = []
+        if existing_keys is None:
+            existing_keys = self.load_mention_keys([post.id], [post.post_date])
 
-        # 제목에서 멘션 찾기
-        title_mentions = self.matcher.find_mentions(post.title or '')
-        for match in title_mentions:
-            mention = self._create_mention(
-                post=post,
-                match=match,
-                mention_type='title',
-                text=post.title
-            )
-            if mention:
-                mentions.append(mention)
-
-        # 본문에서 멘션 찾기
-        content_mentions = self.matcher.find_mentions(post.content or '')
-        for match in content_mentions:
-            mention = self._create_mention(
-                post=post,
-                match=match,
-                mention_type='content',
-                text=post.content
-            )
-            if mention:
-                mentions.append(mention)
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        analysis_cache: Dict[str, Dict[str, Any]] = {}
 
-        # 댓글에서 멘션 찾기
+        # 제목/본문/댓글에서 멘션 찾기
+        self._collect_mentions(rows, analysis_cache, post.id, post.post_date, None, 'title', post.title or '')
+        self._collect_mentions(rows, analysis_cache, post.id, post.post_date, None, 'content', post.content or '')
         if post.comments:
             for comment in post.comments:
-                comment_mentions = self.matcher.find_mentions(comment.content or '')
-                for match in comment_mentions:
-                    mention = self._create_mention(
-                        post=post,
-                        comment=comment,
-                        match=match,
-                        mention_type='comment',
-                        text=comment.content
-                    )
-                    if mention:
-                        mentions.append(mention)
+                self._collect_mentions(
+                    rows, analysis_cache, post.id, post.post_date, comment.id, 'comment', comment.content or ''
+                )
 
-        return mentions
+        # 이미 저장된 멘션 제외 (동시 저장 경합은 ON CONFLICT DO NOTHING 으로 무시)
+        new_rows = [row for key, row in rows.items() if key not in existing_keys]
+        if not new_rows:
+            return []
 
-    def _create_mention(
-        self,
-        post: Post,
-        match: MatchResult,
-        mention_type: str,
-        text: str,
-        comment: Comment = None
-    ) -> Optional[TeacherMention]:
-        """멘션 생성 및 분석"""
+        stmt = pg_insert(TeacherMention).values(new_rows).on_conflict_do_nothing().returning(TeacherMention)
+        mentions = list(self.db.scalars(stmt).all())
 
-        # 중복 체크
-        existing = self.db.query(TeacherMention).filter(
-            and_(
-                TeacherMention.teacher_id == match.teacher_id,
-                TeacherMention.post_id == post.id,
-                TeacherMention.comment_id == (comment.id if comment else None),
-                TeacherMention.mention_type == mention_type
-            )
-        ).first()
+        existing_keys.update(rows.keys())
+        return mentions
 
-        if existing:
-            return None
+    def load_mention_keys(self, post_ids: List[int], post_dates: List[datetime] = None) -> Set[tuple]:
+        """
+        게시글들의 저장된 멘션 키 (teacher_id, post_id, comment_id, mention_type) 1회 조회
 
-        # 감성/난이도 분석
-        analysis = self.analyzer.analyze(text)
+        Args:
+            post_ids: 게시글 ID 목록
+            post_dates: 게시글 post_date 목록 (주면 해당 월 파티션만 조회)
+        """
+        if not post_ids:
+            return set()
 
-        mention = TeacherMention(
-            teacher_id=match.teacher_id,
-            post_id=post.id,
-            comment_id=comment.id if comment else None,
-            mention_type=mention_type,
-            matched_text=match.matched_text,
-            context=match.context,
-            sentiment=analysis['sentiment'],
-            sentiment_score=analysis['sentiment_score'],
-            difficulty=analysis['difficulty'],
-            is_recommended=analysis['is_recommended'],
-            analyzed_at=datetime.utcnow()
-        )
+        query = self.db.query(
+            TeacherMention.teacher_id,
+            TeacherMention.post_id,
+            TeacherMention.comment_id,
+            TeacherMention.mention_type
+        ).filter(TeacherMention.post_id.in_(post_ids))
 
-        self.db.add(mention)
-        self.db.flush()
+        if post_dates:
+            query = query.filter(TeacherMention.post_date.in_(set(post_dates)))
 
-        return mention
+        return {tuple(key) for key in query.all()}
 
     def process_crawled_data(
         self,
@@ -151,51 +144,445 @@ class MentionExtractor:
             처리 통계 (posts_created, comments_created, mentions_found)
         """
         self.initialize()
+        self.matcher.refresh()
+        crawled_posts = self._skip_archived(crawled_posts)
 
-        stats = {
+        if self.bulk:
+            try:
+                return self._process_bulk(source, crawled_posts)
+            except SQLAlchemyError as e:
+                # 유니크 인덱스 미적용(V2_2 마이그레이션 전) 등 - 건별 저장으로 재시도
+                logger.warning(f"Bulk persistence failed, falling back to row-by-row: {e}")
+                self.db.rollback()
+
+        return self._process_rows(source, crawled_posts)
+
+    def _skip_archived(self, crawled_posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        보관 기간이 지난 게시글 제외
+
+        보관(분리)된 월의 게시글은 기존 행을 찾지 못해 새 ID 로 DEFAULT 파티션에 다시 저장되고,
+        멘션이 teacher_mention_daily 에 한 번 더 집계된다.
+        """
+        if self._partitioned is None:
+            self._partitioned = PartitionManager(self.db).is_partitioned()
+
+        cutoff = PartitionManager.retention_cutoff() if self._partitioned else None
+        if cutoff is None:
+            return crawled_posts
+
+        cutoff = datetime.combine(cutoff, time.min)
+        kept = [data for data in crawled_posts if self.partition_date(data) >= cutoff]
+        if len(kept) < len(crawled_posts):
+            logger.info(f"Skipped {len(crawled_posts) - len(kept)} posts dated before retention cutoff {cutoff:%Y-%m}")
+        return kept
+
+    def _new_stats(self) -> Dict[str, int]:
+        """처리 통계 초기값"""
+        return {
             'posts_created': 0,
             'posts_updated': 0,
+            'posts_unchanged': 0,
             'comments_created': 0,
             'mentions_found': 0
         }
 
+    @staticmethod
+    def partition_date(data: Dict[str, Any]) -> datetime:
+        """게시글 파티션 키 (게시일, 없으면 수집 시각)"""
+        return data.get('post_date') or datetime.utcnow()
+
+    @staticmethod
+    def content_hash(data: Dict[str, Any]) -> str:
+        """게시글 내용 해시 (제목 + 본문 + 댓글 ID), 재수집 시 변경 여부 판정용"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update((data.get('title') or '').encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update((data.get('content') or '').encode('utf-8'))
+        for external_id in sorted(str(c.get('external_id', '')) for c in data.get('comments', [])):
+            digest.update(b'\x00')
+            digest.update(external_id.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _process_rows(
+        self,
+        source: CollectionSource,
+        crawled_posts: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """건별 저장 (게시글/댓글마다 SELECT + flush, 멘션은 게시글당 INSERT 1회)"""
+        stats = self._new_stats()
+        # 커밋 전 통계 (롤백되면 저장된 것이 없으므로 버리고, 커밋 성공 후 stats 에 더함)
+        pending = self._new_stats()
+        changed_posts: List[Post] = []
+
         for post_data in crawled_posts:
             try:
                 # 게시글 저장/업데이트
-                post, created = self._save_post(source, post_data)
+                post, created, changed = self._save_post(source, post_data)
                 if created:
-                    stats['posts_created'] += 1
+                    pending['posts_created'] += 1
                 else:
-                    stats['posts_updated'] += 1
+                    pending['posts_updated'] += 1
+
+                # 내용이 그대로면 댓글/멘션 처리 생략
+                if not changed:
+                    pending['posts_unchanged'] += 1
+                    continue
 
                 # 댓글 저장
                 comments_data = post_data.get('comments', [])
                 for comment_data in comments_data:
                     comment, created = self._save_comment(post, comment_data)
                     if created:
-                        stats['comments_created'] += 1
+                        pending['comments_created'] += 1
 
-                # 멘션 추출
-                mentions = self.extract_and_save(post)
-                stats['mentions_found'] += len(mentions)
+                changed_posts.append(post)
 
             except Exception as e:
                 logger.error(f"Error processing post: {e}")
                 self.db.rollback()
+                # 롤백으로 앞서 저장한 게시글도 취소됨
+                changed_posts.clear()
+                pending = self._new_stats()
+                continue
+
+        # 멘션 추출 (배치 게시글의 기존 멘션 키는 1회 조회 후 메모리에서 중복 판정)
+        existing_keys = self.load_mention_keys(
+            list({post.id for post in changed_posts}),
+            [post.post_date for post in changed_posts]
+        )
+        for post in changed_posts:
+            # 게시글별 SAVEPOINT: 실패 시 해당 게시글 멘션만 취소 (전체 rollback 은 앞서 저장한 게시글까지 취소함)
+            try:
+                with self.db.begin_nested():
+                    mentions = self.extract_and_save(post, existing_keys)
+                pending['mentions_found'] += len(mentions)
+            except Exception as e:
+                logger.error(f"Error extracting mentions for post {post.external_id}: {e}")
                 continue
 
         # 전체 처리 완료 후 1회 commit (건별 commit 대신 배치 commit)
         try:
             self.db.commit()
+            for key, value in pending.items():
+                stats[key] += value
         except Exception as e:
             logger.error(f"Error committing batch: {e}")
             self.db.rollback()
 
         return stats
 
+    def _process_bulk(
+        self,
+        source: CollectionSource,
+        crawled_posts: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        배치 저장 (게시글 → 댓글 → 멘션 순으로 테이블당 INSERT ... ON CONFLICT 1회)
+
+        SQL 오류는 호출자가 처리하도록 그대로 전파한다.
+        """
+        stats = self._new_stats()
+        if not crawled_posts:
+            return stats
+
+        # 배치 내 중복 게시글은 마지막 데이터로 1회만 upsert (건별 저장의 update와 동일)
+        posts_by_external_id: Dict[Any, Dict[str, Any]] = {}
+        for post_data in crawled_posts:
+            external_id = post_data.get('external_id')
+            if external_id in posts_by_external_id:
+                stats['posts_updated'] += 1
+            posts_by_external_id[external_id] = post_data
+
+        # 0. 내용이 바뀌지 않은 기존 게시글은 카운터만 갱신하고 이후 단계에서 제외
+        hashes = {
+            external_id: self.content_hash(data)
+            for external_id, data in posts_by_external_id.items()
+        }
+        unchanged, stored_dates = self._bulk_update_unchanged(source, posts_by_external_id, hashes)
+        for external_id in unchanged:
+            del posts_by_external_id[external_id]
+        stats['posts_updated'] += len(unchanged)
+        stats['posts_unchanged'] = len(unchanged)
+
+        # 1. 게시글 upsert
+        post_keys = self._bulk_upsert_posts(source, posts_by_external_id, hashes, stored_dates, stats)
+
+        # 2. 댓글 insert (기존 댓글은 유지)
+        stats['comments_created'] = self._bulk_insert_comments(posts_by_external_id, post_keys)
+
+        # 3. 멘션 추출 및 insert
+        stats['mentions_found'] = self._bulk_insert_mentions(posts_by_external_id, post_keys)
+
+        self.db.commit()
+
+        return stats
+
+    def _bulk_update_unchanged(
+        self,
+        source: CollectionSource,
+        posts_by_external_id: Dict[Any, Dict[str, Any]],
+        hashes: Dict[Any, str]
+    ) -> tuple:
+        """
+        내용 해시가 같은 기존 게시글의 조회수/추천수/댓글수를 UPDATE 1회로 갱신
+
+        Returns:
+            (변경 없는 게시글 external_id 목록, 기존 게시글 external_id -> 저장된 post_date)
+        """
+        if not posts_by_external_id:
+            return [], {}
+
+        existing = self.db.query(Post.id, Post.external_id, Post.post_date, Post.content_hash).filter(
+            Post.source_id == source.id,
+            Post.external_id.in_(list(posts_by_external_id.keys()))
+        ).all()
+
+        # 파티션 키는 바꾸지 않음 (재수집 시 상대 날짜 표기로 게시일이 달라져도 같은 행 갱신)
+        stored_dates = {row.external_id: row.post_date for row in existing}
+
+        unchanged = []
+        counters = []
+        for row in existing:
+            if row.content_hash is None or row.content_hash != hashes.get(row.external_id):
+                continue
+            data = posts_by_external_id[row.external_id]
+            unchanged.append(row.external_id)
+            counters.append((
+                row.id,
+                row.post_date,
+                data.get('view_count', 0),
+                data.get('like_count', 0),
+                data.get('comment_count', 0)
+            ))
+
+        if counters:
+            recrawled = values(
+                column('id', Integer),
+                column('post_date', DateTime),
+                column('view_count', Integer),
+                column('like_count', Integer),
+                column('comment_count', Integer),
+                name='recrawled'
+            ).data(counters)
+
+            self.db.execute(
+                update(Post)
+                .where(Post.id == recrawled.c.id, Post.post_date == recrawled.c.post_date)
+                .values(
+                    view_count=recrawled.c.view_count,
+                    like_count=recrawled.c.like_count,
+                    comment_count=recrawled.c.comment_count
+                ),
+                execution_options={'synchronize_session': False}
+            )
+
+        return unchanged, stored_dates
+
+    def _bulk_upsert_posts(
+        self,
+        source: CollectionSource,
+        posts_by_external_id: Dict[Any, Dict[str, Any]],
+        hashes: Dict[Any, str],
+        stored_dates: Dict[Any, datetime],
+        stats: Dict[str, int]
+    ) -> Dict[Any, tuple]:
+        """게시글 upsert, external_id -> (post_id, post_date) 반환"""
+        rows = [
+            {
+                'source_id': source.id,
+                'external_id': external_id,
+                'title': data.get('title', ''),
+                'content': data.get('content', ''),
+                'url': data.get('url', ''),
+                'author': data.get('author', ''),
+                'post_date': stored_dates.get(external_id) or self.partition_date(data),
+                'view_count': data.get('view_count', 0),
+                'like_count': data.get('like_count', 0),
+                'comment_count': data.get('comment_count', 0),
+                'content_hash': hashes[external_id]
+            }
+            for external_id, data in posts_by_external_id.items()
+        ]
+
+        post_keys = {}
+        for chunk in _chunks(rows, self.BULK_CHUNK_SIZE):
+            stmt = pg_insert(Post).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['source_id', 'external_id', 'post_date'],
+                set_={
+                    # 크롤링 데이터에 제목/본문이 없으면 저장된 값 유지 (건별 저장과 동일)
+                    'title': func.coalesce(func.nullif(stmt.excluded.title, ''), Post.title),
+                    'content': func.coalesce(func.nullif(stmt.excluded.content, ''), Post.content),
+                    'view_count': stmt.excluded.view_count,
+                    'like_count': stmt.excluded.like_count,
+                    'comment_count': stmt.excluded.comment_count,
+                    'content_hash': stmt.excluded.content_hash
+                }
+            ).returning(Post.id, Post.external_id, Post.post_date)
+
+            # 파티션 테이블은 RETURNING 에서 xmax 를 읽을 수 없어 기존 게시일 유무로 신규 여부 판단
+            for row in self.db.execute(stmt):
+                post_keys[row.external_id] = (row.id, row.post_date)
+                if row.external_id not in stored_dates:
+                    stats['posts_created'] += 1
+                else:
+                    stats['posts_updated'] += 1
+
+        return post_keys
+
+    def _bulk_insert_comments(
+        self,
+        posts_by_external_id: Dict[Any, Dict[str, Any]],
+        post_keys: Dict[Any, tuple]
+    ) -> int:
+        """신규 댓글 insert, 생성된 댓글 수 반환"""
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for external_id, data in posts_by_external_id.items():
+            post_id, post_date = post_keys[external_id]
+            for comment_data in data.get('comments', []):
+                key = (post_id, comment_data.get('external_id', ''))
+                rows.setdefault(key, {
+                    'post_id': post_id,
+                    'post_date': post_date,
+                    'external_id': key[1],
+                    'content': comment_data.get('content', ''),
+                    'author': comment_data.get('author', ''),
+                    'comment_date': comment_data.get('comment_date'),
+                    'like_count': comment_data.get('like_count', 0)
+                })
+
+        created = 0
+        for chunk in _chunks(list(rows.values()), self.BULK_CHUNK_SIZE):
+            stmt = pg_insert(Comment).values(chunk).on_conflict_do_nothing(
+                index_elements=['post_id', 'external_id', 'post_date']
+            ).returning(Comment.id)
+            created += len(self.db.execute(stmt).all())
+
+        return created
+
+    def _bulk_insert_mentions(
+        self,
+        posts_by_external_id: Dict[Any, Dict[str, Any]],
+        post_keys: Dict[Any, tuple]
+    ) -> int:
+        """게시글/댓글 멘션 insert, 생성된 멘션 수 반환"""
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        analysis_cache: Dict[str, Dict[str, Any]] = {}
+
+        for external_id, data in posts_by_external_id.items():
+            post_id, post_date = post_keys[external_id]
+            self._collect_mentions(rows, analysis_cache, post_id, post_date, None, 'title', data.get('title') or '')
+            self._collect_mentions(rows, analysis_cache, post_id, post_date, None, 'content', data.get('content') or '')
+
+        # 이번 배치 게시글의 전체 댓글 (이전 수집분 포함, post.comments 와 동일 범위)
+        if post_keys:
+            comments = self.db.query(Comment.id, Comment.post_id, Comment.post_date, Comment.content).filter(
+                Comment.post_id.in_([post_id for post_id, _ in post_keys.values()]),
+                Comment.post_date.in_({post_date for _, post_date in post_keys.values()})
+            ).all()
+            for comment in comments:
+                self._collect_mentions(
+                    rows, analysis_cache, comment.post_id, comment.post_date, comment.id,
+                    'comment', comment.content or ''
+                )
+
+        return self.insert_mention_rows(list(rows.values()))
+
+    def extract_mention_rows(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        저장된 게시글/댓글의 멘션 insert 행 추출 (DB 조회 없음)
+
+        Args:
+            posts: [{'id', 'post_date', 'title', 'content', 'comments': [{'id', 'content'}, ...]}, ...]
+
+        Returns:
+            teacher_mentions insert 행 목록
+        """
+        self.initialize()
+
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        analysis_cache: Dict[str, Dict[str, Any]] = {}
+
+        for post in posts:
+            post_id, post_date = post['id'], post['post_date']
+            self._collect_mentions(rows, analysis_cache, post_id, post_date, None, 'title', post.get('title') or '')
+            self._collect_mentions(rows, analysis_cache, post_id, post_date, None, 'content', post.get('content') or '')
+            for comment in post.get('comments', []):
+                self._collect_mentions(
+                    rows, analysis_cache, post_id, post_date, comment['id'], 'comment', comment.get('content') or ''
+                )
+
+        return list(rows.values())
+
+    def insert_mention_rows(self, rows: List[Dict[str, Any]]) -> int:
+        """멘션 행 insert (기존 멘션과 충돌 시 무시), 생성된 멘션 수 반환"""
+        # comment_id IS NULL 행은 부분 유니크 인덱스로 충돌 판정
+        post_rows = [r for r in rows if r['comment_id'] is None]
+        comment_rows = [r for r in rows if r['comment_id'] is not None]
+
+        created = 0
+        for chunk in _chunks(post_rows, self.BULK_CHUNK_SIZE):
+            stmt = pg_insert(TeacherMention).values(chunk).on_conflict_do_nothing(
+                index_elements=['teacher_id', 'post_id', 'mention_type', 'post_date'],
+                index_where=TeacherMention.comment_id.is_(None)
+            ).returning(TeacherMention.id)
+            created += len(self.db.execute(stmt).all())
+
+        for chunk in _chunks(comment_rows, self.BULK_CHUNK_SIZE):
+            stmt = pg_insert(TeacherMention).values(chunk).on_conflict_do_nothing(
+                index_elements=['teacher_id', 'post_id', 'comment_id', 'mention_type', 'post_date']
+            ).returning(TeacherMention.id)
+            created += len(self.db.execute(stmt).all())
+
+        return created
+
+    def _collect_mentions(
+        self,
+        rows: Dict[tuple, Dict[str, Any]],
+        analysis_cache: Dict[str, Dict[str, Any]],
+        post_id: int,
+        post_date: datetime,
+        comment_id: Optional[int],
+        mention_type: str,
+        text: str
+    ):
+        """텍스트의 멘션을 insert 행으로 수집 (강사/게시글/댓글/타입당 첫 매칭만)"""
+        for match in self.matcher.find_mentions(text):
+            key = (match.teacher_id, post_id, comment_id, mention_type)
+            if key in rows:
+                continue
+
+            # 감성/난이도 분석은 텍스트 단위 결과이므로 1회만 계산
+            analysis = analysis_cache.get(text)
+            if analysis is None:
+                analysis = self.analyzer.analyze(text)
+                analysis_cache[text] = analysis
+
+            rows[key] = {
+                'teacher_id': match.teacher_id,
+                'post_id': post_id,
+                'post_date': post_date,
+                'comment_id': comment_id,
+                'mention_type': mention_type,
+                'matched_text': match.matched_text,
+                'context': match.context,
+                'sentiment': analysis['sentiment'],
+                'sentiment_score': analysis['sentiment_score'],
+                'difficulty': analysis['difficulty'],
+                'is_recommended': analysis['is_recommended'],
+                'analyzed_at': datetime.utcnow()
+            }
+
     def _save_post(self, source: CollectionSource, data: Dict[str, Any]) -> tuple:
-        """게시글 저장"""
+        """
+        게시글 저장
+
+        Returns:
+            (post, created, changed) - changed 가 False 면 내용 해시가 같아 카운터만 갱신됨
+        """
         external_id = data.get('external_id')
+        content_hash = self.content_hash(data)
 
         existing = self.db.query(Post).filter(
             and_(
@@ -205,14 +592,23 @@ class MentionExtractor:
         ).first()
 
         if existing:
+            if existing.content_hash == content_hash:
+                # 내용 변경 없음 - 카운터만 갱신
+                existing.view_count = data.get('view_count', existing.view_count)
+                existing.like_count = data.get('like_count', existing.like_count)
+                existing.comment_count = data.get('comment_count', existing.comment_count)
+                self.db.flush()
+                return existing, False, False
+
             # 업데이트
             existing.title = data.get('title', existing.title)
             existing.content = data.get('content', existing.content)
             existing.view_count = data.get('view_count', existing.view_count)
             existing.like_count = data.get('like_count', existing.like_count)
             existing.comment_count = data.get('comment_count', existing.comment_count)
+            existing.content_hash = content_hash
             self.db.flush()
-            return existing, False
+            return existing, False, True
 
         # 새로 생성
         post = Post(
@@ -222,16 +618,17 @@ class MentionExtractor:
             content=data.get('content', ''),
             url=data.get('url', ''),
             author=data.get('author', ''),
-            post_date=data.get('post_date'),
+            post_date=self.partition_date(data),
             view_count=data.get('view_count', 0),
             like_count=data.get('like_count', 0),
-            comment_count=data.get('comment_count', 0)
+            comment_count=data.get('comment_count', 0),
+            content_hash=content_hash
         )
 
         self.db.add(post)
         self.db.flush()
 
-        return post, True
+        return post, True, True
 
     def _save_comment(self, post: Post, data: Dict[str, Any]) -> tuple:
         """댓글 저장"""
@@ -241,6 +638,7 @@ class MentionExtractor:
         existing = self.db.query(Comment).filter(
             and_(
                 Comment.post_id == post.id,
+                Comment.post_date == post.post_date,
                 Comment.external_id == external_id
             )
         ).first()
@@ -250,6 +648,7 @@ class MentionExtractor:
 
         comment = Comment(
             post_id=post.id,
+            post_date=post.post_date,
             external_id=external_id,
             content=data.get('content', ''),
             author=data.get('author', ''),
@@ -263,34 +662,7 @@ class MentionExtractor:
         return comment, True
 
     def get_teacher_mentions_summary(self, teacher_id: int, days: int = 7) -> Dict[str, Any]:
-        """강사별 멘션 요약"""
-        from datetime import timedelta
-
-        cutoff = datetime.utcnow() - timedelta(days=days)
-
-        mentions = self.db.query(TeacherMention).join(Post).filter(
-            and_(
-                TeacherMention.teacher_id == teacher_id,
-                Post.post_date >= cutoff
-            )
-        ).all()
-
-        summary = {
-            'total_mentions': len(mentions),
-            'title_mentions': len([m for m in mentions if m.mention_type == 'title']),
-            'content_mentions': len([m for m in mentions if m.mention_type == 'content']),
-            'comment_mentions': len([m for m in mentions if m.mention_type == 'comment']),
-            'positive': len([m for m in mentions if m.sentiment == 'POSITIVE']),
-            'negative': len([m for m in mentions if m.sentiment == 'NEGATIVE']),
-            'neutral': len([m for m in mentions if m.sentiment == 'NEUTRAL']),
-            'recommendations': len([m for m in mentions if m.is_recommended]),
-            'difficulty_easy': len([m for m in mentions if m.difficulty == 'EASY']),
-            'difficulty_medium': len([m for m in mentions if m.difficulty == 'MEDIUM']),
-            'difficulty_hard': len([m for m in mentions if m.difficulty == 'HARD']),
-        }
-
-        # 평균 감성 점수
-        scores = [m.sentiment_score for m in mentions if m.sentiment_score is not None]
-        summary['avg_sentiment_score'] = sum(scores) / len(scores) if scores else None
+        """강사별 멘션 요약 (강사 x 일자 집계 테이블 조회)"""
+        from .teacher_stats import TeacherStatsService
 
-        return summary
+        return TeacherStatsService(self.db).get_mentions_summary(teacher_id, days)
@@ -0,0 +1,170 @@
+"""
+Mention Re-extractor Service
+저장된 게시글/댓글 멘션 재추출 (프로세스 풀 병렬)
+
+- 별명 추가 등 강사 사전 변경 후 과거 데이터 재처리용
+- 매칭/감성 분석(CPU)은 작업자 프로세스, DB 읽기/쓰기는 부모 프로세스에서 수행
+"""
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from sqlalchemy.orm import Session
+
+from .mention_extractor import MentionExtractor
+from .teacher_matcher import TeacherDictionary
+from .sentiment_analyzer import SentimentAnalyzer
+from ..models import Post, Comment
+
+logger = logging.getLogger(__name__)
+
+# 작업자 프로세스 전역 추출기 (_init_worker 에서 1회 생성)
+_worker_extractor: Optional[MentionExtractor] = None
+
+
+def _init_worker(teachers: List[Dict[str, Any]], keywords: Dict[str, List[tuple]]):
+    """작업자 초기화: 강사 사전/키워드로 매처와 분석기를 한 번만 구성"""
+    global _worker_extractor
+    extractor = MentionExtractor(None)
+    extractor.initialize(teachers=teachers, keywords=keywords)
+    _worker_extractor = extractor
+
+
+def _extract_chunk(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """작업자: 게시글 묶음의 멘션 행 추출"""
+    return _worker_extractor.extract_mention_rows(posts)
+
+
+class MentionReextractor:
+    """저장된 게시글 멘션 재추출 서비스"""
+
+    DEFAULT_CHUNK_SIZE = 200  # 작업 1건당 게시글 수
+
+    def __init__(self, db: Session, workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            db: DB 세션 (게시글 조회 및 멘션 저장)
+            workers: 작업자 프로세스 수 (기본: CPU 코어 수)
+            chunk_size: 작업 1건당 게시글 수
+        """
+        self.db = db
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def run(
+        self,
+        from_id: int = None,
+        to_id: int = None,
+        source_id: int = None
+    ) -> Dict[str, int]:
+        """
+        게시글 ID 범위 멘션 재추출
+
+        게시글을 ID 순으로 chunk_size 씩 읽어 작업자에게 나눠 주고, 반환된 멘션 행을
+        청크 단위로 일괄 insert 한다. 이미 있는 멘션은 유지(충돌 무시)된다.
+        대기 중인 작업은 작업자 수의 2배로 제한해 메모리 사용량을 묶어 둔다.
+
+        Args:
+            from_id: 시작 게시글 ID (포함)
+            to_id: 끝 게시글 ID (포함)
+            source_id: 특정 소스만 처리
+
+        Returns:
+            처리 통계 (posts_processed, mentions_found, mentions_created)
+        """
+        stats = {
+            'posts_processed': 0,
+            'mentions_found': 0,
+            'mentions_created': 0
+        }
+
+        # 작업자에 넘길 강사 사전/키워드 (작업자는 DB에 접속하지 않음)
+        teachers = TeacherDictionary.shared().teachers(self.db)
+        analyzer = SentimentAnalyzer(self.db)
+        analyzer.load_keywords()
+
+        writer = MentionExtractor(self.db)
+
+        logger.info(
+            f"Re-extracting mentions: posts {from_id or 'start'} ~ {to_id or 'end'}, "
+            f"{len(teachers)} teachers, {self.workers} workers"
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(teachers, analyzer.keywords)
+        ) as pool:
+            pending: deque = deque()
+
+            for posts in self._iter_post_chunks(from_id, to_id, source_id):
+                pending.append((len(posts), pool.submit(_extract_chunk, posts)))
+                if len(pending) >= self.workers * 2:
+                    self._write(writer, stats, *pending.popleft())
+
+            while pending:
+                self._write(writer, stats, *pending.popleft())
+
+        logger.info(
+            f"Re-extraction completed: {stats['posts_processed']} posts, "
+            f"{stats['mentions_found']} mentions found, {stats['mentions_created']} created"
+        )
+        return stats
+
+    def _write(self, writer: MentionExtractor, stats: Dict[str, int], post_count: int, future: Future):
+        """작업 결과 멘션 일괄 insert 및 커밋"""
+        rows = future.result()
+
+        stats['mentions_created'] += writer.insert_mention_rows(rows)
+        self.db.commit()
+
+        stats['posts_processed'] += post_count
+        stats['mentions_found'] += len(rows)
+        logger.info(f"  {stats['posts_processed']} posts processed, {stats['mentions_created']} mentions created")
+
+    def _iter_post_chunks(
+        self,
+        from_id: Optional[int],
+        to_id: Optional[int],
+        source_id: Optional[int]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """게시글 + 댓글을 ID 순 청크로 조회 (키셋 페이지네이션)"""
+        last_id = (from_id or 1) - 1
+
+        while True:
+            query = self.db.query(Post.id, Post.post_date, Post.title, Post.content).filter(Post.id > last_id)
+            if to_id is not None:
+                query = query.filter(Post.id <= to_id)
+            if source_id is not None:
+                query = query.filter(Post.source_id == source_id)
+
+            rows = query.order_by(Post.id).limit(self.chunk_size).all()
+            if not rows:
+                return
+
+            post_ids = [row.id for row in rows]
+
+            comments: Dict[int, List[Dict[str, Any]]] = {}
+            comment_rows = self.db.query(Comment.id, Comment.post_id, Comment.content).filter(
+                Comment.post_id.in_(post_ids),
+                Comment.post_date.in_({row.post_date for row in rows})
+            ).order_by(Comment.id).all()
+            for comment in comment_rows:
+                comments.setdefault(comment.post_id, []).append({
+                    'id': comment.id,
+                    'content': comment.content
+                })
+
+            yield [
+                {
+                    'id': row.id,
+                    'post_date': row.post_date,
+                    'title': row.title,
+                    'content': row.content,
+                    'comments': comments.get(row.id, [])
+                }
+                for row in rows
+            ]
+
+            last_id = post_ids[-1]
@@ -0,0 +1,225 @@
+"""
+Partition Manager
+게시글/댓글/멘션 월별 파티션 생성 및 오래된 파티션 보관
+"""
+import logging
+import os
+import re
+from datetime import date
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def _add_months(month: date, months: int) -> date:
+    """월 초 날짜에 N개월 가감"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionManager:
+    """
+    월별 파티션 관리
+
+    posts / comments / teacher_mentions 는 게시글 post_date 기준 월별 RANGE 파티션이며
+    (V2_6 마이그레이션), 같은 달 파티션은 세 테이블이 항상 함께 생성/보관된다.
+    보관은 파티션을 DETACH 한 뒤 archive 스키마로 옮기거나 삭제한다. 트리거가 실행되지
+    않으므로 teacher_mention_daily 와 리포트 테이블의 과거 집계는 그대로 남는다.
+    """
+
+    # 댓글/멘션이 게시글을 참조하므로 생성은 역순, 분리는 이 순서로 한다
+    TABLES = ('teacher_mentions', 'comments', 'posts')
+
+    MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+    RETENTION_MONTHS = int(os.getenv("PARTITION_RETENTION_MONTHS", "24"))  # 0이면 보관 안 함
+    ARCHIVE_SCHEMA = "archive"
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def partition_name(table: str, month: date) -> str:
+        """월 파티션 이름 (<테이블>_pYYYYMM)"""
+        return f"{table}_p{month:%Y%m}"
+
+    def is_partitioned(self) -> bool:
+        """posts 가 파티션 테이블인지 (V2_6 적용 여부)"""
+        relkind = self.db.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass('posts')")
+        ).scalar()
+        return relkind == 'p'
+
+    def list_partitions(self, table: str) -> Dict[date, str]:
+        """월 파티션 목록 {월 초 날짜: 파티션 이름} (DEFAULT 파티션 제외)"""
+        names = self.db.execute(text("""
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table AS regclass)
+        """), {'table': table}).scalars().all()
+
+        pattern = re.compile(rf'^{table}_p(\d{{4}})(\d{{2}})$')
+        partitions = {}
+        for name in names:
+            match = pattern.match(name)
+            if match:
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+
+        return partitions
+
+    def ensure_partitions(self, months_ahead: int = None, since: date = None) -> int:
+        """
+        월 파티션 생성 (이미 있으면 건너뜀)
+
+        Args:
+            months_ahead: 이번 달 이후 미리 만들 개월 수 (기본: MONTHS_AHEAD)
+            since: 이 날짜가 속한 달부터 생성 (기본: 이번 달)
+
+        Returns:
+            생성된 파티션 수
+        """
+        if months_ahead is None:
+            months_ahead = self.MONTHS_AHEAD
+
+        if not self.is_partitioned():
+            logger.warning("posts is not partitioned (V2_6 migration not applied), skipping")
+            return 0
+
+        this_month = date.today().replace(day=1)
+        month = (since or this_month).replace(day=1)
+        last_month = _add_months(this_month, months_ahead)
+
+        created = 0
+        for table in reversed(self.TABLES):
+            self.db.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{table}_default" PARTITION OF "{table}" DEFAULT'
+            ))
+        self.db.commit()
+
+        existing = {table: self.list_partitions(table) for table in self.TABLES}
+
+        while month <= last_month:
+            missing = [t for t in reversed(self.TABLES) if month not in existing[t]]
+            try:
+                for table in missing:
+                    self.db.execute(text(
+                        f'CREATE TABLE "{self.partition_name(table, month)}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+                    ))
+                self.db.commit()
+                created += len(missing)
+            except SQLAlchemyError as e:
+                # DEFAULT 파티션에 이미 해당 월 행이 있으면 생성 불가
+                logger.warning(f"Failed to create partitions for {month:%Y-%m}: {e}")
+                self.db.rollback()
+
+            month = _add_months(month, 1)
+
+        if created:
+            logger.info(f"Created {created} partitions up to {last_month:%Y-%m}")
+
+        return created
+
+    @classmethod
+    def retention_cutoff(cls, retention_months: int = None) -> Optional[date]:
+        """보관 기준 월 초 (이보다 이전 달 파티션이 보관 대상, 보관하지 않으면 None)"""
+        if retention_months is None:
+            retention_months = cls.RETENTION_MONTHS
+        if retention_months <= 0:
+            return None
+        return _add_months(date.today().replace(day=1), -(retention_months - 1))
+
+    def archive_partitions(self, retention_months: int = None, drop: bool = False) -> List[date]:
+        """
+        보관 기간이 지난 월 파티션 분리
+
+        Args:
+            retention_months: 이번 달을 포함해 유지할 개월 수 (기본: RETENTION_MONTHS, 0이면 보관 안 함)
+            drop: True면 분리한 파티션 삭제, False면 archive 스키마로 이동
+
+        Returns:
+            보관된 월 목록
+        """
+        cutoff = self.retention_cutoff(retention_months)
+        if cutoff is None or not self.is_partitioned():
+            return []
+
+        partitions = {table: self.list_partitions(table) for table in self.TABLES}
+        months = sorted(m for m in partitions['posts'] if m < cutoff)
+
+        if not drop:
+            self.db.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.ARCHIVE_SCHEMA}"'))
+            self.db.commit()
+
+        archived = []
+        for month in months:
+            try:
+                for table in self.TABLES:
+                    name = partitions[table].get(month)
+                    if name:
+                        self._detach(table, name, drop)
+                self.db.commit()
+                archived.append(month)
+                logger.info(f"Archived partitions for {month:%Y-%m} ({'dropped' if drop else self.ARCHIVE_SCHEMA})")
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to archive partitions for {month:%Y-%m}: {e}")
+                self.db.rollback()
+
+        return archived
+
+    def _detach(self, table: str, name: str, drop: bool):
+        """파티션 분리 후 삭제 또는 archive 스키마로 이동"""
+        self.db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+
+        if drop:
+            self.db.execute(text(f'DROP TABLE "{name}"'))
+            return
+
+        # 분리된 테이블에 남는 게시글/댓글 외래키 제거 (운영 테이블과 독립)
+        foreign_keys = self.db.execute(text("""
+            SELECT conname FROM pg_constraint
+            WHERE conrelid = CAST(:name AS regclass)
+              AND contype = 'f'
+              AND confrelid IN ('posts'::regclass, 'comments'::regclass)
+        """), {'name': name}).scalars().all()
+        for constraint in foreign_keys:
+            self.db.execute(text(f'ALTER TABLE "{name}" DROP CONSTRAINT "{constraint}"'))
+
+        self.db.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{self.ARCHIVE_SCHEMA}"'))
+
+    def default_partition_rows(self) -> int:
+        """DEFAULT 파티션(월 파티션 범위 밖 게시일)의 게시글 수"""
+        return self.db.execute(text('SELECT count(*) FROM "posts_default"')).scalar()
+
+    def run_maintenance(
+        self,
+        months_ahead: int = None,
+        retention_months: int = None,
+        drop: bool = False
+    ) -> Dict[str, int]:
+        """
+        파티션 유지보수 (미래 파티션 생성 + 오래된 파티션 보관)
+
+        Args:
+            months_ahead: 미리 만들 개월 수 (기본: MONTHS_AHEAD)
+            retention_months: 유지할 개월 수 (기본: RETENTION_MONTHS, 0이면 보관 안 함)
+            drop: True면 보관 대상 파티션 삭제
+
+        Returns:
+            {'created': 생성 수, 'archived': 보관한 월 수, 'default_rows': DEFAULT 파티션 행 수}
+        """
+        if not self.is_partitioned():
+            logger.warning("posts is not partitioned (V2_6 migration not applied), skipping")
+            return {'created': 0, 'archived': 0, 'default_rows': 0}
+
+        created = self.ensure_partitions(months_ahead)
+        archived = self.archive_partitions(retention_months, drop)
+
+        default_rows = self.default_partition_rows()
+        if default_rows:
+            logger.warning(f"{default_rows} posts stored in posts_default (post_date outside monthly partitions)")
+
+        return {'created': created, 'archived': len(archived), 'default_rows': default_rows}
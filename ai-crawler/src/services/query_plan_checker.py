@@ -0,0 +1,221 @@
+"""
+Query Plan Checker
+리포트/집계 쿼리 실행 계획 점검 (인덱스 누락으로 인한 순차 스캔 회귀 검사)
+"""
+import logging
+import uuid
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..models import Academy, Teacher, Post
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPlanChecker:
+    """
+    리포트 쿼리 실행 계획 점검
+
+    하나의 트랜잭션 안에서 1년치 규모의 점검용 데이터를 넣고 ANALYZE 한 뒤, 실제 서비스
+    메서드(데일리 리포트, 주간 집계/조회, 댓글 저장, 멘션 요약)를 실행해 발생한 SQL 을
+    수집하고 각 문장을 EXPLAIN 한다. 감시 테이블에 순차 스캔이 나오면 해당 접근 경로를
+    받쳐줄 인덱스가 없다는 뜻이다. 시드 데이터를 포함한 모든 변경은 마지막에 롤백되지만,
+    ANALYZE 통계가 바뀌지 않도록 database.scratch_database 로 만든 임시 DB 에서 실행한다.
+    """
+
+    # 순차 스캔을 허용하지 않는 (계속 커지는) 테이블
+    WATCHED_TABLES = ('posts', 'comments', 'teacher_mentions', 'daily_reports', 'weekly_reports')
+
+    STATEMENT_PREFIXES = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+
+    # 시드 데이터 규모
+    SEED_TEACHERS = 50
+    SEED_DAYS = 365
+    SEED_POSTS_PER_DAY = 40
+
+    def __init__(self, engine: Engine = None):
+        if engine is None:
+            from ..database import engine
+        self.engine = engine
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        점검 실행
+
+        Returns:
+            순차 스캔 목록 [{'query': 워크로드 이름, 'table': 테이블, 'statement': SQL}, ...]
+        """
+        violations = []
+
+        with self.engine.connect() as conn:
+            outer = conn.begin()
+            try:
+                session = Session(bind=conn, join_transaction_mode="create_savepoint")
+
+                captured = self._capture(conn, session)
+                parents = self._partition_parents(conn)
+
+                for label, statement, parameters in captured:
+                    plan = conn.exec_driver_sql(
+                        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                    ).scalar()
+                    for relation in self._seq_scan_tables(plan[0]['Plan']):
+                        table = parents.get(relation, relation)
+                        if table in self.WATCHED_TABLES:
+                            violations.append({
+                                'query': label,
+                                'table': table,
+                                'statement': statement
+                            })
+
+                logger.info(f"Checked {len(captured)} statements, {len(violations)} sequential scans")
+                session.close()
+            finally:
+                outer.rollback()
+
+        return violations
+
+    def _capture(self, conn, session: Session) -> List[Tuple[str, str, Any]]:
+        """워크로드 실행 중 발생한 SQL 수집"""
+        fixture = self._seed(session)
+        captured: List[Tuple[str, str, Any]] = []
+        current = {'label': None}
+
+        def before_cursor_execute(_conn, _cursor, statement, parameters, _context, executemany):
+            if executemany or current['label'] is None:
+                return
+            if statement.lstrip().upper().startswith(self.STATEMENT_PREFIXES):
+                captured.append((current['label'], statement, parameters))
+
+        event.listen(conn, 'before_cursor_execute', before_cursor_execute)
+        try:
+            for label, fn in self._workload(session, fixture):
+                current['label'] = label
+                fn()
+                current['label'] = None
+        finally:
+            event.remove(conn, 'before_cursor_execute', before_cursor_execute)
+
+        return captured
+
+    def _seed(self, session: Session) -> Dict[str, Any]:
+        """점검용 데이터 (강사 SEED_TEACHERS 명, SEED_DAYS 일치 게시글/댓글/멘션/리포트) 후 ANALYZE"""
+        from .partition_manager import PartitionManager
+
+        today = date.today()
+        report_date = today - timedelta(days=1)
+        prefix = f"plan-check-{uuid.uuid4().hex[:8]}"
+
+        # 시드 기간의 월 파티션 (없으면 DEFAULT 파티션에 몰려 실제 분포와 달라짐)
+        PartitionManager(session).ensure_partitions(since=today - timedelta(days=self.SEED_DAYS))
+
+        academy = Academy(name=prefix, code=prefix)
+        session.add(academy)
+        session.flush()
+
+        teachers = [
+            Teacher(name=f"{prefix}-{i}", academy_id=academy.id)
+            for i in range(self.SEED_TEACHERS)
+        ]
+        session.add_all(teachers)
+        session.flush()
+
+        params = {
+            'prefix': prefix,
+            'today': today,
+            'days': self.SEED_DAYS,
+            'posts': self.SEED_DAYS * self.SEED_POSTS_PER_DAY,
+            'teacher_ids': [t.id for t in teachers]
+        }
+
+        for statement in (
+            """
+            INSERT INTO posts (external_id, title, content, post_date)
+            SELECT :prefix || '-' || g, :prefix || ' 추천', '',
+                   CAST(:today AS date) - (g % :days) + INTERVAL '12 hours'
+            FROM generate_series(1, :posts) g
+            """,
+            """
+            INSERT INTO comments (post_id, post_date, external_id, content)
+            SELECT id, post_date, '1', title FROM posts WHERE external_id LIKE :prefix || '-%'
+            """,
+            """
+            INSERT INTO teacher_mentions (teacher_id, post_id, post_date, mention_type, matched_text, context,
+                                          sentiment, sentiment_score)
+            SELECT (CAST(:teacher_ids AS INTEGER[]))[1 + p.id % cardinality(CAST(:teacher_ids AS INTEGER[]))],
+                   p.id, p.post_date, 'title', :prefix, p.title, 'POSITIVE', 0.5
+            FROM posts p WHERE p.external_id LIKE :prefix || '-%'
+            """,
+            """
+            INSERT INTO daily_reports (report_date, teacher_id, mention_count, positive_count)
+            SELECT CAST(:today AS date) - d, t, 1, 1
+            FROM generate_series(2, :days) d, unnest(CAST(:teacher_ids AS INTEGER[])) t
+            """,
+            """
+            INSERT INTO weekly_reports (teacher_id, academy_id, year, week_number,
+                                        week_start_date, week_end_date, mention_count, is_complete)
+            SELECT t, :academy_id,
+                   CAST(EXTRACT(isoyear FROM w) AS INTEGER), CAST(EXTRACT(week FROM w) AS INTEGER),
+                   w, w + 6, 1, TRUE
+            FROM generate_series(1, :days / 7) n,
+                 LATERAL (SELECT CAST(date_trunc('week', CAST(:today AS date)) AS date) - 7 * n AS w) weeks,
+                 unnest(CAST(:teacher_ids AS INTEGER[])) t
+            """
+        ):
+            session.execute(text(statement), {**params, 'academy_id': academy.id})
+
+        for table in self.WATCHED_TABLES:
+            session.execute(text(f"ANALYZE {table}"))
+
+        post = session.query(Post).filter(Post.external_id == f"{prefix}-1").one()
+
+        return {
+            'report_date': report_date,
+            'teacher_id': teachers[0].id,
+            'post': post
+        }
+
+    def _workload(self, session: Session, fixture: Dict[str, Any]) -> Iterator[Tuple[str, Callable[[], Any]]]:
+        """점검 대상 서비스 호출 목록"""
+        from .report_generator import ReportGenerator
+        from .weekly_aggregator import WeeklyAggregator
+        from .mention_extractor import MentionExtractor
+        from .teacher_stats import TeacherStatsService
+
+        report_date = fixture['report_date']
+        teacher_id = fixture['teacher_id']
+
+        generator = ReportGenerator(session)
+        aggregator = WeeklyAggregator(session)
+        extractor = MentionExtractor(session)
+
+        yield 'generate_teacher_report', lambda: generator.generate_teacher_report(teacher_id, report_date)
+        yield 'generate_all_reports', lambda: generator.generate_all_reports(report_date)
+        yield 'aggregate_weekly_reports', lambda: aggregator.aggregate_weekly_reports(report_date)
+        yield 'get_weekly_report', lambda: aggregator.get_weekly_report(teacher_id)
+        yield 'get_weekly_ranking', lambda: aggregator.get_weekly_ranking()
+        yield 'get_trend_data', lambda: aggregator.get_trend_data(teacher_id)
+        yield '_save_comment', lambda: extractor._save_comment(fixture['post'], {'external_id': '1'})
+        yield 'get_mentions_summary', lambda: TeacherStatsService(session).get_mentions_summary(teacher_id)
+
+    def _partition_parents(self, conn) -> Dict[str, str]:
+        """파티션 이름 -> 부모 테이블 이름 (월 파티션 순차 스캔을 부모 테이블 기준으로 판정)"""
+        rows = conn.execute(text("""
+            SELECT c.relname, p.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = ANY(:tables)
+        """), {'tables': list(self.WATCHED_TABLES)}).all()
+        return {child: parent for child, parent in rows}
+
+    @classmethod
+    def _seq_scan_tables(cls, node: Dict[str, Any]) -> Iterator[str]:
+        """실행 계획 트리의 순차 스캔 대상 테이블"""
+        if node.get('Node Type') == 'Seq Scan':
+            yield node.get('Relation Name')
+        for child in node.get('Plans', []):
+            yield from cls._seq_scan_tables(child)
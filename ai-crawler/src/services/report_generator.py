@@ -6,20 +6,30 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional
 from collections import Counter
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, and_, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 logger = logging.getLogger(__name__)
 
 from ..models import (
     Teacher, Academy, TeacherMention, DailyReport,
-    AcademyDailyStats, Post, Comment
+    AcademyDailyStats, Comment
 )
 
 
 class ReportGenerator:
     """데일리 리포트 생성 서비스"""
 
+    # 주요 키워드 목록 (수동 정의, context 에서 등장 여부 집계)
+    KEYWORD_CANDIDATES = [
+        '추천', '강추', '비추', '합격', '불합격',
+        '기초', '심화', '개념', '문풀', '기출',
+        '쉬움', '어려움', '명강의', '꿀강', '노잼',
+        '인강', '현강', '독학', '학원', '교재',
+        '국어', '영어', '한국사', '행정법', '행정학'
+    ]
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -45,11 +55,12 @@ class ReportGenerator:
         start_dt = datetime.combine(report_date, datetime.min.time())
         end_dt = datetime.combine(report_date, datetime.max.time())
 
-        mentions = self.db.query(TeacherMention).join(Post).filter(
+        # 멘션의 post_date(게시글 게시일) 조건으로 해당 월 파티션만 조회
+        mentions = self.db.query(TeacherMention).filter(
             and_(
                 TeacherMention.teacher_id == teacher_id,
-                Post.post_date >= start_dt,
-                Post.post_date <= end_dt
+                TeacherMention.post_date >= start_dt,
+                TeacherMention.post_date <= end_dt
             )
         ).all()
 
@@ -183,10 +194,15 @@ class ReportGenerator:
 
         return stats
 
-    def generate_all_reports(self, report_date: date = None) -> Dict[str, int]:
+    def generate_all_reports(self, report_date: date = None, set_based: bool = True) -> Dict[str, int]:
         """
         모든 강사 및 학원의 데일리 리포트 생성
 
+        Args:
+            report_date: 리포트 날짜 (기본: 오늘)
+            set_based: True면 전체 강사를 집계 쿼리 1회 + 일괄 upsert 로 생성,
+                       False면 강사별 generate_teacher_report 반복
+
         Returns:
             생성 통계 (teacher_reports, academy_stats)
         """
@@ -198,17 +214,21 @@ class ReportGenerator:
             'academy_stats': 0
         }
 
-        # 활성 강사 목록
-        teachers = self.db.query(Teacher).filter(Teacher.is_active == True).all()
-
         logger.info(f"Generating reports for {report_date}")
-        logger.info(f"Processing {len(teachers)} teachers...")
 
-        for teacher in teachers:
-            report = self.generate_teacher_report(teacher.id, report_date)
-            if report:
-                stats['teacher_reports'] += 1
-                logger.debug(f"  {teacher.name}: {report.mention_count} mentions")
+        if set_based:
+            stats['teacher_reports'] = self.generate_teacher_reports_bulk(report_date)
+        else:
+            # 활성 강사 목록
+            teachers = self.db.query(Teacher).filter(Teacher.is_active == True).all()
+
+            logger.info(f"Processing {len(teachers)} teachers...")
+
+            for teacher in teachers:
+                report = self.generate_teacher_report(teacher.id, report_date)
+                if report:
+                    stats['teacher_reports'] += 1
+                    logger.debug(f"  {teacher.name}: {report.mention_count} mentions")
 
         # 학원별 통계
         academies = self.db.query(Academy).filter(Academy.is_active == True).all()
@@ -236,6 +256,127 @@ class ReportGenerator:
 
         return stats
 
+    def generate_teacher_reports_bulk(self, report_date: date) -> int:
+        """
+        전체 활성 강사 데일리 리포트 일괄 생성
+
+        멘션 통계/키워드 등장 수를 teacher_id 별 GROUP BY 1회로 집계하고,
+        전일 리포트를 SQL 조인으로 붙인 뒤 daily_reports 에 1회 upsert 한다.
+        결과는 강사별 generate_teacher_report 와 동일하다.
+
+        Returns:
+            생성/갱신된 리포트 수
+        """
+        start_dt = datetime.combine(report_date, datetime.min.time())
+        end_dt = datetime.combine(report_date, datetime.max.time())
+        prev_date = report_date - timedelta(days=1)
+
+        def count_if(condition):
+            return func.count(case((condition, 1)))
+
+        context = func.lower(func.coalesce(TeacherMention.context, ''))
+        keyword_columns = [
+            count_if(func.strpos(context, keyword) > 0).label(f'kw_{idx}')
+            for idx, keyword in enumerate(self.KEYWORD_CANDIDATES)
+        ]
+
+        agg = self.db.query(
+            TeacherMention.teacher_id.label('teacher_id'),
+            func.count(TeacherMention.id).label('mention_count'),
+            count_if(TeacherMention.mention_type.in_(('title', 'content'))).label('post_mention_count'),
+            count_if(TeacherMention.mention_type == 'comment').label('comment_mention_count'),
+            count_if(TeacherMention.sentiment == 'POSITIVE').label('positive_count'),
+            count_if(TeacherMention.sentiment == 'NEGATIVE').label('negative_count'),
+            func.avg(TeacherMention.sentiment_score).label('avg_sentiment_score'),
+            count_if(TeacherMention.difficulty == 'EASY').label('difficulty_easy_count'),
+            count_if(TeacherMention.difficulty == 'MEDIUM').label('difficulty_medium_count'),
+            count_if(TeacherMention.difficulty == 'HARD').label('difficulty_hard_count'),
+            count_if(TeacherMention.is_recommended.is_(True)).label('recommendation_count'),
+            *keyword_columns
+        ).join(
+            Teacher, Teacher.id == TeacherMention.teacher_id
+        ).filter(
+            Teacher.is_active == True,
+            TeacherMention.post_date >= start_dt,
+            TeacherMention.post_date <= end_dt
+        ).group_by(TeacherMention.teacher_id).subquery()
+
+        prev = aliased(DailyReport)
+        rows = self.db.query(
+            agg,
+            Teacher.name.label('teacher_name'),
+            prev.id.label('prev_id'),
+            prev.mention_count.label('prev_mention_count'),
+            prev.avg_sentiment_score.label('prev_avg_sentiment_score')
+        ).join(
+            Teacher, Teacher.id == agg.c.teacher_id
+        ).outerjoin(
+            prev, and_(prev.teacher_id == agg.c.teacher_id, prev.report_date == prev_date)
+        ).all()
+
+        if not rows:
+            return 0
+
+        values = []
+        for row in rows:
+            stats = {
+                'mention_count': row.mention_count,
+                'post_mention_count': row.post_mention_count,
+                'comment_mention_count': row.comment_mention_count,
+                'positive_count': row.positive_count,
+                'negative_count': row.negative_count,
+                'neutral_count': row.mention_count - row.positive_count - row.negative_count,
+                'avg_sentiment_score': (
+                    round(float(row.avg_sentiment_score), 3)
+                    if row.avg_sentiment_score is not None else None
+                ),
+                'difficulty_easy_count': row.difficulty_easy_count,
+                'difficulty_medium_count': row.difficulty_medium_count,
+                'difficulty_hard_count': row.difficulty_hard_count,
+                'recommendation_count': row.recommendation_count
+            }
+
+            # 전일 대비 변화
+            mention_change = 0
+            sentiment_change = None
+            if row.prev_id is not None:
+                mention_change = stats['mention_count'] - (row.prev_mention_count or 0)
+                if row.prev_avg_sentiment_score is not None and stats['avg_sentiment_score'] is not None:
+                    sentiment_change = stats['avg_sentiment_score'] - row.prev_avg_sentiment_score
+
+            # 키워드 (등장 멘션 수 내림차순, 동률은 후보 목록 순)
+            keyword_counts = [
+                (keyword, getattr(row, f'kw_{idx}'))
+                for idx, keyword in enumerate(self.KEYWORD_CANDIDATES)
+            ]
+            keyword_counts.sort(key=lambda x: x[1], reverse=True)
+            top_keywords = [keyword for keyword, count in keyword_counts if count > 0][:5]
+
+            values.append({
+                'teacher_id': row.teacher_id,
+                'report_date': report_date,
+                **stats,
+                'mention_change': mention_change,
+                'sentiment_change': sentiment_change,
+                'summary': self._build_summary(row.teacher_name, stats),
+                'top_keywords': top_keywords
+            })
+
+        stmt = pg_insert(DailyReport).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['report_date', 'teacher_id'],
+            set_={
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in ('teacher_id', 'report_date', 'created_at')
+            }
+        )
+        self.db.execute(stmt)
+
+        logger.info(f"Upserted {len(values)} teacher reports")
+
+        return len(values)
+
     def _calculate_stats(self, mentions: List[TeacherMention]) -> Dict[str, Any]:
         """멘션 통계 계산"""
         stats = {
@@ -306,20 +447,11 @@ class ReportGenerator:
         # 간단한 키워드 추출 (context에서 명사 추출)
         # 실제 구현에서는 형태소 분석기 사용 권장
 
-        # 주요 키워드 목록 (수동 정의)
-        keyword_candidates = [
-            '추천', '강추', '비추', '합격', '불합격',
-            '기초', '심화', '개념', '문풀', '기출',
-            '쉬움', '어려움', '명강의', '꿀강', '노잼',
-            '인강', '현강', '독학', '학원', '교재',
-            '국어', '영어', '한국사', '행정법', '행정학'
-        ]
-
         word_counts = Counter()
 
         for m in mentions:
             context = (m.context or '').lower()
-            for keyword in keyword_candidates:
+            for keyword in self.KEYWORD_CANDIDATES:
                 if keyword in context:
                     word_counts[keyword] += 1
 
@@ -337,10 +469,14 @@ class ReportGenerator:
         if not teacher:
             return ""
 
+        return self._build_summary(teacher.name, stats)
+
+    def _build_summary(self, teacher_name: str, stats: Dict[str, Any]) -> str:
+        """통계 기반 요약 문장 생성"""
         # 감성 비율
         total = stats['positive_count'] + stats['negative_count'] + stats['neutral_count']
         if total == 0:
-            return f"{teacher.name} 강사 관련 언급이 없습니다."
+            return f"{teacher_name} 강사 관련 언급이 없습니다."
 
         positive_ratio = stats['positive_count'] / total * 100
         negative_ratio = stats['negative_count'] / total * 100
@@ -375,7 +511,7 @@ class ReportGenerator:
         if stats['recommendation_count'] > 0:
             parts.append(f"추천 언급 {stats['recommendation_count']}회")
 
-        return f"{teacher.name} 강사: " + ", ".join(parts)
+        return f"{teacher_name} 강사: " + ", ".join(parts)
 
     def get_report_summary(self, report_date: date = None) -> Dict[str, Any]:
         """날짜별 전체 리포트 요약"""
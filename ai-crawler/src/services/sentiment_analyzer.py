@@ -2,13 +2,91 @@
 Sentiment Analyzer Service
 감성/난이도/추천 분석 서비스
 """
+import hashlib
 import logging
+import re
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
 
+class KeywordScanner:
+    """
+    다중 키워드 스캐너
+
+    모든 카테고리의 키워드를 하나의 정규식(긴 키워드 우선 alternation)으로 컴파일해
+    텍스트를 1회 탐색하고, 카테고리별 점수를 한 번에 계산한다.
+    각 출현 위치에서는 가장 긴 키워드만 매칭되므로, 그 키워드의 접두사인
+    키워드들은 미리 계산한 접두사 표로 함께 집계한다.
+    """
+
+    # 키워드당 최대 반영 횟수
+    MAX_COUNT = 3
+
+    def __init__(self, keywords: Dict[str, List[tuple]]):
+        """
+        Args:
+            keywords: 카테고리 -> [(키워드, 가중치), ...]
+        """
+        unique = sorted(
+            {kw for entries in keywords.values() for kw, _ in entries if kw},
+            key=len, reverse=True
+        )
+        ids = {kw: idx for idx, kw in enumerate(unique)}
+
+        self.keywords: List[str] = unique  # 인덱스가 키워드 ID
+        self._lengths = [len(kw) for kw in unique]
+        self._prefixes = {
+            kw: [ids[p] for p in unique if kw.startswith(p)]
+            for kw in unique
+        }
+        self.entries = {  # 카테고리 -> [(키워드 ID, 가중치), ...]
+            category: [(ids[kw], weight) for kw, weight in entries if kw]
+            for category, entries in keywords.items()
+        }
+        self._pattern = re.compile('|'.join(map(re.escape, unique))) if unique else None
+
+    def scan(self, text: str) -> Dict[int, int]:
+        """등장한 키워드 ID -> 등장 횟수 (str.count 와 동일한 비중첩 기준)"""
+        counts: Dict[int, int] = {}
+        if self._pattern is None:
+            return counts
+
+        lengths = self._lengths
+        prefixes = self._prefixes
+        next_free: Dict[int, int] = {}  # 키워드별 다음 매칭 허용 위치
+        search = self._pattern.search
+
+        match = search(text)
+        while match:
+            start = match.start()
+            for key_id in prefixes[match.group()]:
+                if start >= next_free.get(key_id, 0):
+                    counts[key_id] = counts.get(key_id, 0) + 1
+                    next_free[key_id] = start + lengths[key_id]
+            match = search(text, start + 1)
+
+        return counts
+
+    def count(self, text: str) -> List[int]:
+        """키워드 ID별 등장 횟수"""
+        counts = [0] * len(self.keywords)
+        for key_id, count in self.scan(text).items():
+            counts[key_id] = count
+        return counts
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """카테고리별 점수 (등장 횟수는 키워드당 최대 MAX_COUNT 회 반영)"""
+        counts = self.count(text)
+        max_count = self.MAX_COUNT
+        return {
+            category: sum(weight * min(counts[key_id], max_count) for key_id, weight in entries)
+            for category, entries in self.entries.items()
+        }
+
+
 class SentimentAnalyzer:
     """감성 분석 서비스"""
 
@@ -45,21 +123,33 @@ class SentimentAnalyzer:
         ]
     }
 
+    # 판정 기준 (감성 점수 절댓값 / 추천 점수)
+    SENTIMENT_THRESHOLD = 0.2
+    RECOMMEND_THRESHOLD = 0.5
+
+    # 텍스트 해시별 분석 결과 캐시 크기
+    CACHE_SIZE = 4096
+
     def __init__(self, db: Session = None):
         self.db = db
         self.keywords: Dict[str, List[tuple]] = {}
         self._initialized = False
+        self._scanner: Optional[KeywordScanner] = None
+        self._cache: OrderedDict = OrderedDict()
 
-    def load_keywords(self, from_db: bool = True):
-        """키워드 로드"""
+    def load_keywords(self, from_db: bool = True, keywords: Dict[str, List[tuple]] = None):
+        """키워드 로드 (keywords 지정 시 해당 키워드 표 사용)"""
         if self._initialized:
             return
 
-        if from_db and self.db:
+        if keywords is not None:
+            self.keywords = {category: list(entries) for category, entries in keywords.items()}
+        elif from_db and self.db:
             self._load_from_db()
         else:
             self.keywords = self.DEFAULT_KEYWORDS.copy()
 
+        self._compile()
         self._initialized = True
         logger.info(f"Loaded keywords: {sum(len(v) for v in self.keywords.values())} total")
 
@@ -81,6 +171,20 @@ class SentimentAnalyzer:
             logger.error(f"Failed to load keywords from DB: {e}")
             self.keywords = self.DEFAULT_KEYWORDS.copy()
 
+    def _compile(self):
+        """키워드 표를 스캐너로 컴파일 (분석 캐시 초기화)"""
+        self._scanner = KeywordScanner(self.keywords)
+        self._cache.clear()
+
+    @property
+    def scanner(self) -> KeywordScanner:
+        """컴파일된 키워드 스캐너"""
+        if not self._initialized:
+            self.load_keywords(from_db=False)
+        if self._scanner is None:
+            self._compile()
+        return self._scanner
+
     def analyze(self, text: str) -> Dict[str, Any]:
         """
         텍스트 분석
@@ -93,9 +197,6 @@ class SentimentAnalyzer:
                 'is_recommended': bool
             }
         """
-        if not self._initialized:
-            self.load_keywords(from_db=False)
-
         if not text:
             return {
                 'sentiment': 'NEUTRAL',
@@ -104,11 +205,28 @@ class SentimentAnalyzer:
                 'is_recommended': False
             }
 
-        text_lower = text.lower()
+        scanner = self.scanner
+
+        # 같은 텍스트(여러 강사가 언급된 게시글 등)는 1회만 분석
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            return dict(result)
+
+        result = self._classify(scanner.scores(text.lower()))
+
+        self._cache[key] = result
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
 
+        return dict(result)
+
+    def _classify(self, scores: Dict[str, float]) -> Dict[str, Any]:
+        """카테고리별 점수로 감성/난이도/추천 판정"""
         # 감성 점수 계산
-        positive_score = self._calculate_score(text_lower, 'sentiment_positive')
-        negative_score = self._calculate_score(text_lower, 'sentiment_negative')
+        positive_score = scores.get('sentiment_positive', 0.0)
+        negative_score = scores.get('sentiment_negative', 0.0)
 
         # 정규화된 감성 점수 (-1.0 ~ 1.0)
         total = positive_score + negative_score
@@ -118,16 +236,16 @@ class SentimentAnalyzer:
             sentiment_score = 0.0
 
         # 감성 레이블
-        if sentiment_score > 0.2:
+        if sentiment_score > self.SENTIMENT_THRESHOLD:
             sentiment = 'POSITIVE'
-        elif sentiment_score < -0.2:
+        elif sentiment_score < -self.SENTIMENT_THRESHOLD:
             sentiment = 'NEGATIVE'
         else:
             sentiment = 'NEUTRAL'
 
         # 난이도 분석
-        easy_score = self._calculate_score(text_lower, 'difficulty_easy')
-        hard_score = self._calculate_score(text_lower, 'difficulty_hard')
+        easy_score = scores.get('difficulty_easy', 0.0)
+        hard_score = scores.get('difficulty_hard', 0.0)
 
         difficulty = None
         if easy_score > hard_score and easy_score > 0:
@@ -138,8 +256,8 @@ class SentimentAnalyzer:
             difficulty = 'MEDIUM'
 
         # 추천 여부
-        recommend_score = self._calculate_score(text_lower, 'recommendation')
-        is_recommended = recommend_score > 0.5
+        recommend_score = scores.get('recommendation', 0.0)
+        is_recommended = recommend_score > self.RECOMMEND_THRESHOLD
 
         return {
             'sentiment': sentiment,
@@ -149,21 +267,14 @@ class SentimentAnalyzer:
         }
 
     def _calculate_score(self, text: str, category: str) -> float:
-        """카테고리별 점수 계산"""
-        keywords = self.keywords.get(category, [])
-        score = 0.0
-
-        for keyword, weight in keywords:
-            if keyword in text:
-                # 등장 횟수에 따른 가중치 (최대 3회까지)
-                count = min(text.count(keyword), 3)
-                score += weight * count
-
-        return score
+        """카테고리별 점수 계산 (등장 횟수는 키워드당 최대 3회까지 반영)"""
+        return self.scanner.scores(text).get(category, 0.0)
 
     def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
-        """여러 텍스트 일괄 분석"""
-        return [self.analyze(text) for text in texts]
+        """여러 텍스트 일괄 분석 (키워드 행렬 기반 벡터 연산)"""
+        from .sentiment_batch import BatchSentimentScorer
+
+        return BatchSentimentScorer(self).analyze(texts)
 
     def get_keywords_by_category(self, category: str) -> List[tuple]:
         """카테고리별 키워드 반환"""
@@ -174,3 +285,5 @@ class SentimentAnalyzer:
         if category not in self.keywords:
             self.keywords[category] = []
         self.keywords[category].append((keyword, weight))
+        self._scanner = None
+        self._cache.clear()
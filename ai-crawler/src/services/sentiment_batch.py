@@ -0,0 +1,240 @@
+"""
+Batch Sentiment Scorer
+키워드 행렬 기반 일괄 감성 분석 서비스 (재분석/백필용)
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, and_, case, column, update, values
+from sqlalchemy.orm import Session
+
+from ..models import TeacherMention, Post, Comment
+from .sentiment_analyzer import KeywordScanner, SentimentAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# 난이도 코드 -> 레이블
+DIFFICULTY_LABELS = (None, 'EASY', 'HARD', 'MEDIUM')
+
+
+class BatchSentimentScorer:
+    """
+    일괄 감성 분석기
+
+    텍스트 묶음을 (텍스트 x 키워드) 희소 등장 횟수 행렬로 만든 뒤 카테고리별
+    가중치를 적용해 감성/난이도/추천 판정을 한 번에 계산한다.
+    판정 규칙과 점수 누적 순서는 SentimentAnalyzer.analyze 와 동일하다.
+    """
+
+    DEFAULT_CHUNK_SIZE = 2000
+
+    def __init__(self, analyzer: SentimentAnalyzer = None):
+        """
+        Args:
+            analyzer: 키워드가 로드된 분석기 (기본: 기본 키워드 분석기)
+        """
+        self.analyzer = analyzer or SentimentAnalyzer()
+
+    @property
+    def scanner(self) -> KeywordScanner:
+        """분석기의 현재 키워드 스캐너 (add_keyword 로 다시 컴파일되면 함께 바뀜)"""
+        return self.analyzer.scanner
+
+    def count_matrix(self, texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        키워드 등장 횟수 희소 행렬 (COO)
+
+        Returns:
+            (행 인덱스, 키워드 ID, 등장 횟수) 배열
+        """
+        rows, cols, counts = [], [], []
+        scan = self.scanner.scan
+
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            for key_id, count in scan(text.lower()).items():
+                rows.append(row)
+                cols.append(key_id)
+                counts.append(count)
+
+        return (
+            np.array(rows, dtype=np.intp),
+            np.array(cols, dtype=np.intp),
+            np.array(counts, dtype=np.float64)
+        )
+
+    def score(self, texts: Sequence[str]) -> Dict[str, List[Any]]:
+        """
+        텍스트 묶음 분석
+
+        Returns:
+            {'sentiment', 'sentiment_score', 'difficulty', 'is_recommended'} 별 결과 리스트
+        """
+        # 같은 텍스트는 한 행으로 계산 후 펼침
+        unique_index: Dict[str, int] = {}
+        inverse = np.fromiter(
+            (unique_index.setdefault(text or '', len(unique_index)) for text in texts),
+            dtype=np.intp,
+            count=len(texts)
+        )
+        size = len(unique_index)
+
+        scanner = self.scanner
+        rows, cols, counts = self.count_matrix(list(unique_index))
+        capped = np.minimum(counts, scanner.MAX_COUNT)
+
+        # 키워드 ID 순 정렬 (키워드별 등장 행 구간)
+        order = np.argsort(cols, kind='stable')
+        rows_by_key, capped_by_key = rows[order], capped[order]
+        bounds = np.searchsorted(cols[order], np.arange(len(scanner.keywords) + 1))
+
+        def category_scores(category: str) -> np.ndarray:
+            # analyze 와 같은 순서(키워드 표 순서)로 누적해야 부동소수점 합이 같아
+            # 동점 판정(난이도 EASY/HARD 등)이 어긋나지 않음
+            scores = np.zeros(size)
+            for key_id, weight in scanner.entries.get(category, ()):
+                start, end = bounds[key_id], bounds[key_id + 1]
+                if start < end:
+                    scores[rows_by_key[start:end]] += weight * capped_by_key[start:end]
+            return scores
+
+        # 감성 점수 (-1.0 ~ 1.0)
+        positive = category_scores('sentiment_positive')
+        negative = category_scores('sentiment_negative')
+        total = positive + negative
+        sentiment_score = np.where(total > 0, (positive - negative) / (total + 1), 0.0)
+
+        threshold = self.analyzer.SENTIMENT_THRESHOLD
+        sentiment = np.where(
+            sentiment_score > threshold, 'POSITIVE',
+            np.where(sentiment_score < -threshold, 'NEGATIVE', 'NEUTRAL')
+        )
+
+        # 난이도
+        easy = category_scores('difficulty_easy')
+        hard = category_scores('difficulty_hard')
+        difficulty = np.select(
+            [(easy > hard) & (easy > 0), (hard > easy) & (hard > 0), (easy > 0) | (hard > 0)],
+            [1, 2, 3],
+            default=0
+        )
+
+        # 추천 여부
+        is_recommended = category_scores('recommendation') > self.analyzer.RECOMMEND_THRESHOLD
+
+        return {
+            'sentiment': sentiment[inverse].tolist(),
+            # 반올림은 analyze 와 같은 Python round 사용
+            'sentiment_score': [round(value, 3) for value in sentiment_score[inverse].tolist()],
+            'difficulty': [DIFFICULTY_LABELS[code] for code in difficulty[inverse].tolist()],
+            'is_recommended': is_recommended[inverse].tolist()
+        }
+
+    def analyze(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """텍스트별 분석 결과 (SentimentAnalyzer.analyze 와 같은 형식)"""
+        result = self.score(texts)
+        return [
+            {
+                'sentiment': sentiment,
+                'sentiment_score': sentiment_score,
+                'difficulty': difficulty,
+                'is_recommended': is_recommended
+            }
+            for sentiment, sentiment_score, difficulty, is_recommended in zip(
+                result['sentiment'], result['sentiment_score'],
+                result['difficulty'], result['is_recommended']
+            )
+        ]
+
+    def rescore_mentions(
+        self,
+        db: Session,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        only_unanalyzed: bool = False
+    ) -> int:
+        """
+        teacher_mentions 감성/난이도/추천 재분석
+
+        멘션 ID 순으로 청크를 읽어(키셋 페이지네이션) 원문(제목/본문/댓글)을
+        일괄 분석하고, 청크당 UPDATE ... FROM (VALUES ...) 1회로 반영한다.
+
+        Args:
+            db: DB 세션
+            chunk_size: 청크당 멘션 수
+            only_unanalyzed: True면 감성 미분석(sentiment IS NULL) 멘션만
+
+        Returns:
+            재분석된 멘션 수
+        """
+        # 멘션 추출 시 분석한 원문
+        source_text = case(
+            (TeacherMention.mention_type == 'title', Post.title),
+            (TeacherMention.mention_type == 'comment', Comment.content),
+            else_=Post.content
+        )
+
+        last_id = 0
+        total = 0
+
+        while True:
+            query = db.query(
+                TeacherMention.id, TeacherMention.post_date, source_text.label('text')
+            ).join(
+                Post, and_(Post.id == TeacherMention.post_id, Post.post_date == TeacherMention.post_date)
+            ).outerjoin(
+                Comment, and_(Comment.id == TeacherMention.comment_id, Comment.post_date == TeacherMention.post_date)
+            ).filter(TeacherMention.id > last_id)
+
+            if only_unanalyzed:
+                query = query.filter(TeacherMention.sentiment.is_(None))
+
+            rows = query.order_by(TeacherMention.id).limit(chunk_size).all()
+            if not rows:
+                break
+
+            keys = [(row.id, row.post_date) for row in rows]
+            result = self.score([row.text for row in rows])
+            self._bulk_update(db, keys, result)
+            db.commit()
+
+            total += len(keys)
+            last_id = keys[-1][0]
+            logger.info(f"Rescored {total} mentions (last id: {last_id})")
+
+        return total
+
+    @staticmethod
+    def _bulk_update(db: Session, keys: List[Tuple[int, datetime]], result: Dict[str, List[Any]]):
+        """분석 결과를 UPDATE 1회로 반영 (keys: 멘션 (id, post_date) 목록)"""
+        scored = values(
+            column('id', Integer),
+            column('post_date', DateTime),
+            column('sentiment', String),
+            column('sentiment_score', Float),
+            column('difficulty', String),
+            column('is_recommended', Boolean),
+            name='scored'
+        ).data(list(zip(
+            [key[0] for key in keys],
+            [key[1] for key in keys],
+            result['sentiment'],
+            result['sentiment_score'],
+            result['difficulty'],
+            result['is_recommended']
+        )))
+
+        db.execute(
+            update(TeacherMention)
+            .where(TeacherMention.id == scored.c.id, TeacherMention.post_date == scored.c.post_date)
+            .values(
+                sentiment=scored.c.sentiment,
+                sentiment_score=scored.c.sentiment_score,
+                difficulty=scored.c.difficulty,
+                is_recommended=scored.c.is_recommended,
+                analyzed_at=datetime.utcnow()
+            ),
+            execution_options={'synchronize_session': False}
+        )
@@ -3,9 +3,15 @@ Teacher Name Matcher Service
 강사명 매칭 서비스
 """
 import logging
+import os
 import re
+import threading
+import time
+from collections import deque
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -22,6 +28,97 @@ class MatchResult:
     context: str  # 주변 문맥 (앞뒤 100자)
 
 
+# 이름 경계 판정용 문자 집합: 정규식 [가-힣a-zA-Z0-9] (IGNORECASE) 과 동일
+# (IGNORECASE 시 'İ', 'ı', 'ſ', 'K'(Kelvin) 도 영문자로 취급됨)
+_WORD_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+    '\u0130\u0131\u017f\u212a'
+)
+
+
+def _is_word_char(ch: str) -> bool:
+    """한글 음절/영문/숫자 여부"""
+    return ch in _WORD_CHARS or '가' <= ch <= '힣'
+
+
+def _fold(ch: str) -> str:
+    """대소문자 무시 비교용 문자 정규화 (위치 보존을 위해 1:1 변환만 허용)"""
+    lowered = ch.lower()
+    return lowered if len(lowered) == 1 else ch
+
+
+class NameAutomaton:
+    """
+    Aho-Corasick 다중 패턴 매칭 오토마톤
+
+    모든 강사명/별명을 하나의 트라이로 묶어 텍스트를 1회 순회하며
+    모든 출현 위치를 찾는다. (이름 수와 무관하게 O(텍스트 길이 + 출현 수))
+    """
+
+    def __init__(self, keys: List[str]):
+        """
+        Args:
+            keys: 패턴 문자열 목록 (인덱스가 패턴 ID)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._lengths: List[int] = []
+
+        for key_id, key in enumerate(keys):
+            self._lengths.append(len(key))
+            node = 0
+            for ch in key:
+                ch = _fold(ch)
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = nxt
+            self._output[node].append(key_id)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크 구성 및 출력 병합"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text: str):
+        """
+        텍스트의 모든 패턴 출현 위치 반환
+
+        Yields:
+            (key_id, start) - 끝 위치 오름차순
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        lengths = self._lengths
+        node = 0
+
+        for idx, ch in enumerate(text):
+            ch = _fold(ch)
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for key_id in output[node]:
+                yield key_id, idx + 1 - lengths[key_id]
+
+
 class TeacherMatcher:
     """강사명 매칭 서비스"""
 
@@ -36,7 +133,10 @@ class TeacherMatcher:
         self.db = db
         self._name_map: Dict[str, int] = {}  # name/alias -> teacher_id
         self._teacher_info: Dict[int, Dict] = {}  # teacher_id -> info
-        self._patterns: List[Tuple[re.Pattern, int]] = []  # (compiled pattern, teacher_id)
+        self._patterns: List[Tuple[re.Pattern, int, str]] = []  # (compiled pattern, teacher_id, name)
+        self._automaton: Optional[NameAutomaton] = None  # 전체 이름 대상 다중 패턴 오토마톤
+        self._suffixes: Tuple[str, ...] = self._parse_suffixes(self.SUFFIX_PATTERN)
+        self._version: Optional[str] = None  # 공유 강사 사전 버전 (DB 로드 시)
 
     def load_teachers(self, teachers: List[Dict[str, Any]] = None):
         """
@@ -44,18 +144,22 @@ class TeacherMatcher:
 
         Args:
             teachers: List of dict with keys: id, name, aliases, academy_name, subject_name
-                     If None, load from database
+                     If None, load from database (프로세스 공유 강사 사전 사용)
         """
         if teachers is None and self.db:
-            teachers = self._load_from_db()
+            self._adopt(TeacherDictionary.shared().matcher(self.db))
+            return
 
         if not teachers:
             logger.warning("No teachers to load")
             return
 
-        self._name_map.clear()
-        self._teacher_info.clear()
-        self._patterns.clear()
+        # 공유 중인 인덱스를 변경하지 않도록 새 컨테이너로 교체
+        self._name_map = {}
+        self._teacher_info = {}
+        self._patterns = []
+        self._automaton = None
+        self._version = None
 
         all_names = []
 
@@ -93,25 +197,39 @@ class TeacherMatcher:
             except re.error as e:
                 logger.error(f"Regex error for '{name}': {e}")
 
+        # 오토마톤 키 ID는 self._patterns 인덱스와 동일 (매칭 우선순위 유지)
+        self._automaton = NameAutomaton([name for _, _, name in self._patterns])
+
         logger.info(f"Loaded {len(self._teacher_info)} teachers, {len(self._name_map)} names/aliases")
 
-    def _load_from_db(self) -> List[Dict[str, Any]]:
-        """데이터베이스에서 강사 정보 로드"""
-        from ..models import Teacher, Academy, Subject
+    def refresh(self) -> bool:
+        """
+        공유 강사 사전이 바뀌었으면 다시 로드
 
-        teachers = []
-        query = self.db.query(Teacher).filter(Teacher.is_active == True)
+        Returns:
+            재로드 여부
+        """
+        if self.db is None or self._version is None:
+            return False
+
+        shared = TeacherDictionary.shared().matcher(self.db)
+        if shared._version == self._version:
+            return False
 
-        for t in query.all():
-            teachers.append({
-                'id': t.id,
-                'name': t.name,
-                'aliases': t.aliases or [],
-                'academy_name': t.academy.name if t.academy else '',
-                'subject_name': t.subject.name if t.subject else ''
-            })
+        self._adopt(shared)
+        return True
 
-        return teachers
+    def _adopt(self, other: 'TeacherMatcher'):
+        """다른 매처의 (읽기 전용) 인덱스 공유"""
+        self._name_map = other._name_map
+        self._teacher_info = other._teacher_info
+        self._patterns = other._patterns
+        self._automaton = other._automaton
+        self._version = other._version
+
+    def _load_from_db(self) -> List[Dict[str, Any]]:
+        """데이터베이스에서 강사 정보 로드 (학원/과목 조인 1회 조회)"""
+        return TeacherDictionary.fetch_teachers(self.db)
 
     # 이름 뒤에 붙을 수 있는 한글 접미사 (호칭 + 과목명)
     SUFFIX_PATTERN = r'(?:쌤|강사|선생님?|교수님?|국어|영어|수학|한국사|행정법|헌법|행정학|경제학|세법|회계|사회|과학)?'
@@ -128,6 +246,93 @@ class TeacherMatcher:
 
         return pattern
 
+    @staticmethod
+    def _parse_suffixes(suffix_pattern: str) -> Tuple[str, ...]:
+        """SUFFIX_PATTERN 에서 허용 접미사 목록 추출 ('님?' 같은 선택 글자 전개)"""
+        body = suffix_pattern[len('(?:'):-len(')?')]
+        suffixes = []
+        for alt in body.split('|'):
+            if alt.endswith('?'):
+                suffixes.append(alt[:-2] + alt[-2])
+                suffixes.append(alt[:-2])
+            else:
+                suffixes.append(alt)
+        return tuple(suffixes)
+
+    def _match_end(self, text: str, name_end: int) -> Optional[int]:
+        """
+        이름 뒤 접미사/경계 검사
+
+        Returns:
+            경계 문자까지 포함한 매칭 끝 위치 (정규식 match.end() 와 동일), 실패 시 None
+        """
+        text_len = len(text)
+
+        # 접미사 없이 바로 경계
+        if name_end == text_len:
+            return name_end
+        if not _is_word_char(text[name_end]):
+            return name_end + 1
+
+        # 접미사 + 경계 (접미사는 모두 한글이므로 성공 가능한 후보는 최대 1개)
+        for suffix in self._suffixes:
+            suffix_end = name_end + len(suffix)
+            if text.startswith(suffix, name_end):
+                if suffix_end == text_len:
+                    return suffix_end
+                if not _is_word_char(text[suffix_end]):
+                    return suffix_end + 1
+
+        return None
+
+    def _scan_spans(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        오토마톤 1회 순회로 패턴별 매칭 구간 계산
+
+        패턴별 re.finditer 결과(경계 문자 포함, 비중첩)와 동일한 구간을
+        self._patterns 순서대로 반환한다.
+
+        Returns:
+            List of (pattern_index, start, end)
+        """
+        occurrences: Dict[int, List[int]] = {}
+        for key_id, name_start in self._automaton.iter_matches(text):
+            occurrences.setdefault(key_id, []).append(name_start)
+
+        spans = []
+        for key_id in sorted(occurrences):
+            name_len = len(self._patterns[key_id][2])
+            search_pos = 0  # finditer 다음 탐색 시작 위치
+
+            for name_start in occurrences[key_id]:
+                # 이름 앞: 문장 시작 또는 경계 문자 (경계 문자도 매칭에 포함됨)
+                if name_start == 0:
+                    span_start = 0
+                elif not _is_word_char(text[name_start - 1]):
+                    span_start = name_start - 1
+                else:
+                    continue
+
+                if span_start < search_pos:
+                    continue
+
+                span_end = self._match_end(text, name_start + name_len)
+                if span_end is None:
+                    continue
+
+                spans.append((key_id, span_start, span_end))
+                search_pos = span_end
+
+        return spans
+
+    def _scan_spans_regex(self, text: str) -> List[Tuple[int, int, int]]:
+        """이름별 정규식으로 매칭 구간 계산 (오토마톤 결과 검증용 기준 구현)"""
+        spans = []
+        for key_id, (pattern, _, _) in enumerate(self._patterns):
+            for match in pattern.finditer(text):
+                spans.append((key_id, match.start(), match.end()))
+        return spans
+
     def find_mentions(self, text: str, context_size: int = 100) -> List[MatchResult]:
         """
         텍스트에서 강사 멘션 찾기
@@ -142,45 +347,44 @@ class TeacherMatcher:
         if not text or not self._patterns:
             return []
 
+        spans = self._scan_spans(text)
+
         results = []
         found_positions = set()  # 중복 방지
 
-        for pattern, teacher_id, original_name in self._patterns:
-            for match in pattern.finditer(text):
-                # 실제 매칭된 위치 조정 (패턴에 앞뒤 문자가 포함되어 있으므로)
-                start = match.start()
-                end = match.end()
-
-                # 앞뒤 경계 문자 제거
-                matched_text = match.group()
-                if matched_text and not matched_text[0].isalnum() and matched_text[0] not in '가힣':
-                    start += 1
-                    matched_text = matched_text[1:]
-                if matched_text and not matched_text[-1].isalnum() and matched_text[-1] not in '가힣':
-                    end -= 1
-                    matched_text = matched_text[:-1]
-
-                # 위치 중복 체크
-                pos_key = (start, end)
-                if pos_key in found_positions:
-                    continue
-                found_positions.add(pos_key)
-
-                # 문맥 추출
-                context_start = max(0, start - context_size)
-                context_end = min(len(text), end + context_size)
-                context = text[context_start:context_end]
-
-                teacher_info = self._teacher_info.get(teacher_id, {})
-
-                results.append(MatchResult(
-                    teacher_id=teacher_id,
-                    teacher_name=teacher_info.get('name', original_name),
-                    matched_text=matched_text.strip(),
-                    start_pos=start,
-                    end_pos=end,
-                    context=context
-                ))
+        for key_id, start, end in spans:
+            _, teacher_id, original_name = self._patterns[key_id]
+
+            # 앞뒤 경계 문자 제거 (패턴에 앞뒤 문자가 포함되어 있으므로)
+            matched_text = text[start:end]
+            if matched_text and not matched_text[0].isalnum() and matched_text[0] not in '가힣':
+                start += 1
+                matched_text = matched_text[1:]
+            if matched_text and not matched_text[-1].isalnum() and matched_text[-1] not in '가힣':
+                end -= 1
+                matched_text = matched_text[:-1]
+
+            # 위치 중복 체크
+            pos_key = (start, end)
+            if pos_key in found_positions:
+                continue
+            found_positions.add(pos_key)
+
+            # 문맥 추출
+            context_start = max(0, start - context_size)
+            context_end = min(len(text), end + context_size)
+            context = text[context_start:context_end]
+
+            teacher_info = self._teacher_info.get(teacher_id, {})
+
+            results.append(MatchResult(
+                teacher_id=teacher_id,
+                teacher_name=teacher_info.get('name', original_name),
+                matched_text=matched_text.strip(),
+                start_pos=start,
+                end_pos=end,
+                context=context
+            ))
 
         # 위치순 정렬
         results.sort(key=lambda x: x.start_pos)
@@ -221,3 +425,131 @@ class TeacherMatcher:
     def get_all_teacher_ids(self) -> List[int]:
         """모든 강사 ID 반환"""
         return list(self._teacher_info.keys())
+
+
+class TeacherDictionary:
+    """
+    프로세스 공유 강사 사전
+
+    활성 강사 목록과 이를 컴파일한 매처 인덱스(정규식, 오토마톤)를 버전별로 1회만
+    구성해 모든 TeacherMatcher 가 공유한다. 버전은 매칭에 쓰이는 컬럼(이름, 별명,
+    학원/과목명)의 체크섬이라 teachers 테이블이 바뀔 때만 다시 구성된다.
+    버전 확인 쿼리는 CHECK_INTERVAL_SEC 간격으로만 실행한다.
+    """
+
+    CHECK_INTERVAL_SEC = float(os.getenv("TEACHER_DICT_CHECK_SEC", "30"))
+
+    _shared: Optional['TeacherDictionary'] = None
+
+    @classmethod
+    def shared(cls) -> 'TeacherDictionary':
+        """프로세스 전역 인스턴스"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._teachers: List[Dict[str, Any]] = []
+        self._matcher: Optional[TeacherMatcher] = None
+        self._checked_at = 0.0
+
+    def teachers(self, db: Session) -> List[Dict[str, Any]]:
+        """활성 강사 목록 (id, name, aliases, academy_name, subject_name)"""
+        self._ensure(db)
+        return self._teachers
+
+    def matcher(self, db: Session) -> TeacherMatcher:
+        """현재 버전 강사 사전으로 구성된 매처 (공유 인스턴스, 읽기 전용)"""
+        self._ensure(db)
+        return self._matcher
+
+    @property
+    def version(self) -> Optional[str]:
+        """현재 로드된 사전 버전"""
+        return self._version
+
+    def invalidate(self):
+        """다음 조회 시 버전 재확인 (강사 정보 직접 수정 직후 등)"""
+        with self._lock:
+            self._checked_at = 0.0
+
+    def _ensure(self, db: Session):
+        """버전 확인 후 변경 시 재구성"""
+        with self._lock:
+            now = time.monotonic()
+            if self._matcher is not None and now - self._checked_at < self.CHECK_INTERVAL_SEC:
+                return
+
+            version = self.fetch_version(db)
+            self._checked_at = now
+            if self._matcher is not None and version == self._version:
+                return
+
+            teachers = self.fetch_teachers(db)
+            matcher = TeacherMatcher()
+            matcher.load_teachers(teachers)
+            matcher._version = version
+
+            if self._version is not None:
+                logger.info(f"Teacher dictionary changed ({self._version[:8]} -> {version[:8]}), reloaded")
+
+            self._teachers = teachers
+            self._matcher = matcher
+            self._version = version
+
+    @staticmethod
+    def fetch_version(db: Session) -> str:
+        """매칭 관련 컬럼 체크섬 (1행 집계 쿼리)"""
+        from ..models import Teacher, Academy, Subject
+
+        row_text = func.concat_ws(
+            ':',
+            Teacher.id,
+            Teacher.name,
+            func.array_to_string(Teacher.aliases, ','),
+            Academy.name,
+            Subject.name
+        )
+
+        checksum = db.query(
+            func.md5(func.coalesce(
+                func.string_agg(row_text, aggregate_order_by(literal('|'), Teacher.id)),
+                ''
+            ))
+        ).select_from(Teacher).outerjoin(
+            Academy, Teacher.academy_id == Academy.id
+        ).outerjoin(
+            Subject, Teacher.subject_id == Subject.id
+        ).filter(Teacher.is_active == True).scalar()
+
+        return checksum
+
+    @staticmethod
+    def fetch_teachers(db: Session) -> List[Dict[str, Any]]:
+        """활성 강사 목록 조회 (학원/과목 조인 1회)"""
+        from ..models import Teacher, Academy, Subject
+
+        rows = db.query(
+            Teacher.id,
+            Teacher.name,
+            Teacher.aliases,
+            Academy.name.label('academy_name'),
+            Subject.name.label('subject_name')
+        ).outerjoin(
+            Academy, Teacher.academy_id == Academy.id
+        ).outerjoin(
+            Subject, Teacher.subject_id == Subject.id
+        ).filter(Teacher.is_active == True).order_by(Teacher.id).all()
+
+        return [
+            {
+                'id': row.id,
+                'name': row.name,
+                'aliases': row.aliases or [],
+                'academy_name': row.academy_name or '',
+                'subject_name': row.subject_name or ''
+            }
+            for row in rows
+        ]
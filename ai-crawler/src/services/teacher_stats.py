@@ -0,0 +1,152 @@
+"""
+Teacher Stats Service
+강사 x 일자 멘션 집계 조회 및 통계 구체화 뷰 갱신
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict
+from sqlalchemy import case, delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from ..models import TeacherMention, TeacherMentionDaily
+
+logger = logging.getLogger(__name__)
+
+
+class TeacherStatsService:
+    """
+    강사 통계 집계 서비스
+
+    teacher_mention_daily 는 teacher_mentions 의 INSERT/UPDATE/DELETE 문장 트리거가
+    변경분만큼 증감시키므로(V2_4 마이그레이션) 요약 조회는 멘션 테이블을 스캔하지 않는다.
+    """
+
+    # REFRESH MATERIALIZED VIEW 대상 (모두 CONCURRENTLY 용 유니크 인덱스 보유)
+    MATERIALIZED_VIEWS = ('mv_teacher_latest_stats', 'mv_academy_teacher_ranking')
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_mentions_summary(self, teacher_id: int, days: int = 7) -> Dict[str, Any]:
+        """
+        강사별 멘션 요약 (일자 집계 합산)
+
+        Args:
+            teacher_id: 강사 ID
+            days: 조회 기간 (오늘 포함 이전 N일, 일 단위)
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=days)).date()
+        d = TeacherMentionDaily
+
+        row = self.db.query(
+            func.coalesce(func.sum(d.mention_count), 0).label('total_mentions'),
+            func.coalesce(func.sum(d.title_count), 0).label('title_mentions'),
+            func.coalesce(func.sum(d.content_count), 0).label('content_mentions'),
+            func.coalesce(func.sum(d.comment_count), 0).label('comment_mentions'),
+            func.coalesce(func.sum(d.positive_count), 0).label('positive'),
+            func.coalesce(func.sum(d.negative_count), 0).label('negative'),
+            func.coalesce(func.sum(d.neutral_count), 0).label('neutral'),
+            func.coalesce(func.sum(d.recommendation_count), 0).label('recommendations'),
+            func.coalesce(func.sum(d.difficulty_easy_count), 0).label('difficulty_easy'),
+            func.coalesce(func.sum(d.difficulty_medium_count), 0).label('difficulty_medium'),
+            func.coalesce(func.sum(d.difficulty_hard_count), 0).label('difficulty_hard'),
+            func.sum(d.sentiment_score_sum).label('score_sum'),
+            func.sum(d.sentiment_score_count).label('score_count')
+        ).filter(
+            d.teacher_id == teacher_id,
+            d.stat_date >= cutoff
+        ).one()
+
+        summary = {
+            key: int(getattr(row, key))
+            for key in (
+                'total_mentions', 'title_mentions', 'content_mentions', 'comment_mentions',
+                'positive', 'negative', 'neutral', 'recommendations',
+                'difficulty_easy', 'difficulty_medium', 'difficulty_hard'
+            )
+        }
+
+        # 평균 감성 점수
+        summary['avg_sentiment_score'] = (
+            row.score_sum / row.score_count if row.score_count else None
+        )
+
+        return summary
+
+    def refresh_views(self, concurrently: bool = True) -> int:
+        """
+        통계 구체화 뷰 갱신
+
+        Args:
+            concurrently: True면 조회를 막지 않는 CONCURRENTLY 갱신
+
+        Returns:
+            갱신한 뷰 수
+        """
+        option = ' CONCURRENTLY' if concurrently else ''
+
+        for view in self.MATERIALIZED_VIEWS:
+            self.db.execute(text(f'REFRESH MATERIALIZED VIEW{option} {view}'))
+            self.db.commit()
+            logger.debug(f"Refreshed {view}")
+
+        return len(self.MATERIALIZED_VIEWS)
+
+    def rebuild_daily_rollup(self, since: date = None) -> int:
+        """
+        teacher_mentions 에서 일자 집계 재계산
+
+        트리거를 거치지 않은 변경(파티션 직접 조작, 트리거 비활성화 중 적재 등) 후
+        정합성 복구용으로 사용한다. 보관(DETACH)된 월은 멘션이 없어 전체 재계산 시 집계가 사라지므로
+        파티션 보관 이후에는 since 를 지정한다.
+
+        Args:
+            since: 이 날짜 이후만 재계산 (None이면 전체)
+
+        Returns:
+            재계산된 (강사, 일자) 행 수
+        """
+        m = TeacherMention
+        stat_date = func.date(m.post_date)
+
+        def count_if(condition):
+            return func.count(case((condition, 1)))
+
+        query = select(
+            m.teacher_id,
+            stat_date,
+            func.count(),
+            count_if(m.mention_type == 'title'),
+            count_if(m.mention_type == 'content'),
+            count_if(m.mention_type == 'comment'),
+            count_if(m.sentiment == 'POSITIVE'),
+            count_if(m.sentiment == 'NEGATIVE'),
+            count_if(m.sentiment == 'NEUTRAL'),
+            count_if(m.is_recommended.is_(True)),
+            count_if(m.difficulty == 'EASY'),
+            count_if(m.difficulty == 'MEDIUM'),
+            count_if(m.difficulty == 'HARD'),
+            func.coalesce(func.sum(m.sentiment_score), 0),
+            func.count(m.sentiment_score)
+        ).where(
+            m.teacher_id.isnot(None)
+        ).group_by(m.teacher_id, stat_date)
+
+        cleanup = delete(TeacherMentionDaily)
+        if since is not None:
+            query = query.where(m.post_date >= since)
+            cleanup = cleanup.where(TeacherMentionDaily.stat_date >= since)
+
+        d = TeacherMentionDaily
+        self.db.execute(cleanup)
+        result = self.db.execute(insert(d).from_select([
+            d.teacher_id, d.stat_date, d.mention_count,
+            d.title_count, d.content_count, d.comment_count,
+            d.positive_count, d.negative_count, d.neutral_count, d.recommendation_count,
+            d.difficulty_easy_count, d.difficulty_medium_count, d.difficulty_hard_count,
+            d.sentiment_score_sum, d.sentiment_score_count
+        ], query))
+        self.db.commit()
+
+        logger.info(f"Rebuilt teacher_mention_daily: {result.rowcount} rows")
+        return result.rowcount
@@ -10,9 +10,10 @@ Weekly Aggregator Service
 import logging
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple
-from sqlalchemy import text, func
-from sqlalchemy.orm import Session
+from typing import Iterable, List, Dict, Optional, Tuple
+from sqlalchemy import text, func, and_, case, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert, aggregate_order_by
+from sqlalchemy.orm import Session, aliased
 
 from ..models import (
     Teacher, Academy, DailyReport, WeeklyReport,
@@ -73,12 +74,14 @@ class WeeklyAggregator:
         previous_week_date = target_date - timedelta(days=7)
         return WeeklyAggregator.get_week_range(previous_week_date)
 
-    def aggregate_weekly_reports(self, target_date: date = None) -> int:
+    def aggregate_weekly_reports(self, target_date: date = None, set_based: bool = True) -> int:
         """
         주간 리포트 집계 실행
 
         Args:
             target_date: 집계 대상 날짜 (None이면 전주)
+            set_based: True면 집계 쿼리 + 윈도 함수 순위 + 일괄 upsert,
+                       False면 강사/학원별 반복 집계
 
         Returns:
             집계된 리포트 수
@@ -104,25 +107,35 @@ class WeeklyAggregator:
         self.session.flush()
 
         try:
-            # 1. 활성 강사 목록 조회
-            teachers = self.session.query(Teacher).filter(
-                Teacher.is_active == True
-            ).all()
+            if set_based:
+                # 1. 강사별 주간 리포트 일괄 upsert
+                processed_count = self._upsert_teacher_weekly(week_start, week_end, year, week_number)
 
-            processed_count = 0
+                # 2. 순위 계산 (RANK() OVER)
+                self._update_weekly_ranks(year, week_number)
 
-            for teacher in teachers:
-                report = self._aggregate_teacher_weekly(
-                    teacher, week_start, week_end, year, week_number
-                )
-                if report:
-                    processed_count += 1
+                # 3. 학원별 통계 일괄 upsert
+                self._upsert_academy_stats(week_start, week_end, year, week_number)
+            else:
+                # 1. 활성 강사 목록 조회
+                teachers = self.session.query(Teacher).filter(
+                    Teacher.is_active == True
+                ).all()
+
+                processed_count = 0
 
-            # 2. 순위 계산
-            self._calculate_weekly_ranks(year, week_number)
+                for teacher in teachers:
+                    report = self._aggregate_teacher_weekly(
+                        teacher, week_start, week_end, year, week_number
+                    )
+                    if report:
+                        processed_count += 1
 
-            # 3. 학원별 통계 집계
-            self._aggregate_academy_stats(week_start, week_end, year, week_number)
+                # 2. 순위 계산
+                self._calculate_weekly_ranks(year, week_number)
+
+                # 3. 학원별 통계 집계
+                self._aggregate_academy_stats(week_start, week_end, year, week_number)
 
             # 4. 집계 완료 표시
             self.session.query(WeeklyReport).filter(
@@ -224,13 +237,7 @@ class WeeklyAggregator:
                 report.sentiment_trend = report.avg_sentiment_score - prev_report.avg_sentiment_score
 
         # 키워드 집계
-        all_keywords = {}
-        for dr in daily_reports:
-            if dr.top_keywords:
-                for kw in dr.top_keywords:
-                    all_keywords[kw] = all_keywords.get(kw, 0) + 1
-
-        report.top_keywords = sorted(all_keywords.keys(), key=lambda k: all_keywords[k], reverse=True)[:10]
+        report.top_keywords = self._rank_keywords(dr.top_keywords for dr in daily_reports)
 
         # 요일별 분포
         daily_dist = {}
@@ -323,15 +330,234 @@ class WeeklyAggregator:
                 stats.top_teacher_mentions = top_report.mention_count
 
             # 키워드 집계
-            all_keywords = {}
-            for r in reports:
-                if r.top_keywords:
-                    for kw in r.top_keywords:
-                        all_keywords[kw] = all_keywords.get(kw, 0) + 1
-
-            stats.top_keywords = sorted(all_keywords.keys(), key=lambda k: all_keywords[k], reverse=True)[:10]
+            stats.top_keywords = self._rank_keywords(r.top_keywords for r in reports)
             stats.aggregated_at = datetime.now()
 
+    def _upsert_teacher_weekly(
+        self,
+        week_start: date,
+        week_end: date,
+        year: int,
+        week_number: int
+    ) -> int:
+        """
+        강사별 주간 집계 (일괄)
+
+        일별 리포트를 teacher_id 별 GROUP BY 1회로 집계하고 전주 리포트를
+        조인한 뒤 weekly_reports 에 INSERT ... ON CONFLICT 1회로 저장
+
+        Returns:
+            저장된 리포트 수
+        """
+        _, _, prev_year, prev_week_num = self.get_previous_week_range(week_start)
+
+        def total(column):
+            return func.sum(func.coalesce(column, 0))
+
+        agg = self.session.query(
+            DailyReport.teacher_id.label('teacher_id'),
+            total(DailyReport.mention_count).label('mention_count'),
+            total(DailyReport.positive_count).label('positive_count'),
+            total(DailyReport.negative_count).label('negative_count'),
+            total(DailyReport.neutral_count).label('neutral_count'),
+            total(DailyReport.recommendation_count).label('recommendation_count'),
+            total(DailyReport.difficulty_easy_count).label('difficulty_easy_count'),
+            total(DailyReport.difficulty_medium_count).label('difficulty_medium_count'),
+            total(DailyReport.difficulty_hard_count).label('difficulty_hard_count'),
+            # 0점은 제외 (건별 집계의 truthy 필터와 동일)
+            func.avg(func.nullif(DailyReport.avg_sentiment_score, 0)).label('avg_sentiment_score'),
+            func.jsonb_agg(
+                aggregate_order_by(func.to_jsonb(DailyReport.top_keywords), DailyReport.report_date)
+            ).label('keyword_lists'),
+            func.jsonb_object_agg(
+                func.to_char(DailyReport.report_date, 'FMDay'),
+                func.coalesce(DailyReport.mention_count, 0)
+            ).label('daily_distribution')
+        ).join(
+            Teacher, Teacher.id == DailyReport.teacher_id
+        ).filter(
+            Teacher.is_active == True,
+            DailyReport.report_date >= week_start,
+            DailyReport.report_date <= week_end
+        ).group_by(DailyReport.teacher_id).subquery()
+
+        prev = aliased(WeeklyReport)
+        rows = self.session.query(
+            agg,
+            Teacher.academy_id.label('academy_id'),
+            prev.mention_count.label('prev_mention_count'),
+            prev.avg_sentiment_score.label('prev_avg_sentiment_score')
+        ).join(
+            Teacher, Teacher.id == agg.c.teacher_id
+        ).outerjoin(
+            prev, and_(
+                prev.teacher_id == agg.c.teacher_id,
+                prev.year == prev_year,
+                prev.week_number == prev_week_num
+            )
+        ).all()
+
+        if not rows:
+            return 0
+
+        now = datetime.now()
+        values = []
+        for row in rows:
+            # 전주 대비 변화율
+            mention_change_rate = None
+            sentiment_trend = None
+            if row.prev_mention_count:
+                change = ((row.mention_count - row.prev_mention_count) / row.prev_mention_count) * 100
+                mention_change_rate = round(change, 2)
+
+                if row.prev_avg_sentiment_score and row.avg_sentiment_score is not None:
+                    sentiment_trend = row.avg_sentiment_score - row.prev_avg_sentiment_score
+
+            values.append({
+                'teacher_id': row.teacher_id,
+                'academy_id': row.academy_id,
+                'year': year,
+                'week_number': week_number,
+                'week_start_date': week_start,
+                'week_end_date': week_end,
+                'mention_count': row.mention_count,
+                'positive_count': row.positive_count,
+                'negative_count': row.negative_count,
+                'neutral_count': row.neutral_count,
+                'recommendation_count': row.recommendation_count,
+                'difficulty_easy_count': row.difficulty_easy_count,
+                'difficulty_medium_count': row.difficulty_medium_count,
+                'difficulty_hard_count': row.difficulty_hard_count,
+                'avg_sentiment_score': row.avg_sentiment_score,
+                'mention_change_rate': mention_change_rate,
+                'sentiment_trend': sentiment_trend,
+                'top_keywords': self._rank_keywords(row.keyword_lists),
+                'daily_distribution': row.daily_distribution,
+                'aggregated_at': now,
+                'updated_at': datetime.utcnow()
+            })
+
+        stmt = pg_insert(WeeklyReport).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint='uk_weekly_teacher_year_week',
+            set_={
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in ('teacher_id', 'year', 'week_number')
+            }
+        )
+        self.session.execute(stmt)
+
+        return len(values)
+
+    def _update_weekly_ranks(self, year: int, week_number: int):
+        """주간 순위 계산 (전체/학원별 RANK() 를 UPDATE 1회로 반영)"""
+        mentions = func.coalesce(WeeklyReport.mention_count, 0)
+
+        ranked = select(
+            WeeklyReport.id.label('id'),
+            func.rank().over(order_by=mentions.desc()).label('weekly_rank'),
+            func.rank().over(
+                partition_by=WeeklyReport.academy_id,
+                order_by=mentions.desc()
+            ).label('academy_rank')
+        ).where(
+            WeeklyReport.year == year,
+            WeeklyReport.week_number == week_number
+        ).subquery()
+
+        self.session.execute(
+            update(WeeklyReport)
+            .where(
+                WeeklyReport.id == ranked.c.id,
+                # 대상도 같은 주차로 한정 (주차 인덱스로 갱신 대상 탐색)
+                WeeklyReport.year == year,
+                WeeklyReport.week_number == week_number
+            )
+            .values(weekly_rank=ranked.c.weekly_rank, academy_rank=ranked.c.academy_rank),
+            execution_options={'synchronize_session': False}
+        )
+
+    def _upsert_academy_stats(
+        self,
+        week_start: date,
+        week_end: date,
+        year: int,
+        week_number: int
+    ):
+        """학원별 주간 통계 집계 (academy_id 별 GROUP BY 1회 + 일괄 upsert)"""
+        mentions = func.coalesce(WeeklyReport.mention_count, 0)
+
+        rows = self.session.query(
+            WeeklyReport.academy_id.label('academy_id'),
+            func.sum(mentions).label('total_mentions'),
+            func.count(case((WeeklyReport.mention_count > 0, 1))).label('total_teachers_mentioned'),
+            func.sum(func.coalesce(WeeklyReport.positive_count, 0)).label('total_positive'),
+            func.sum(func.coalesce(WeeklyReport.negative_count, 0)).label('total_negative'),
+            func.sum(func.coalesce(WeeklyReport.recommendation_count, 0)).label('total_recommendations'),
+            func.avg(func.nullif(WeeklyReport.avg_sentiment_score, 0)).label('avg_sentiment_score'),
+            func.max(mentions).label('top_teacher_mentions'),
+            func.array_agg(
+                aggregate_order_by(WeeklyReport.teacher_id, mentions.desc(), WeeklyReport.teacher_id)
+            ).label('teacher_ids'),
+            func.jsonb_agg(
+                aggregate_order_by(WeeklyReport.top_keywords, WeeklyReport.teacher_id)
+            ).label('keyword_lists')
+        ).join(
+            Academy, Academy.id == WeeklyReport.academy_id
+        ).filter(
+            Academy.is_active == True,
+            WeeklyReport.year == year,
+            WeeklyReport.week_number == week_number
+        ).group_by(WeeklyReport.academy_id).all()
+
+        if not rows:
+            return
+
+        now = datetime.now()
+        values = []
+        for row in rows:
+            has_top = row.top_teacher_mentions > 0
+            values.append({
+                'academy_id': row.academy_id,
+                'year': year,
+                'week_number': week_number,
+                'week_start_date': week_start,
+                'week_end_date': week_end,
+                'total_mentions': row.total_mentions,
+                'total_teachers_mentioned': row.total_teachers_mentioned,
+                'total_positive': row.total_positive,
+                'total_negative': row.total_negative,
+                'total_recommendations': row.total_recommendations,
+                'avg_sentiment_score': row.avg_sentiment_score,
+                'top_teacher_id': row.teacher_ids[0] if has_top else None,
+                'top_teacher_mentions': row.top_teacher_mentions if has_top else 0,
+                'top_keywords': self._rank_keywords(row.keyword_lists),
+                'aggregated_at': now
+            })
+
+        stmt = pg_insert(AcademyWeeklyStats).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint='uk_academy_weekly_year_week',
+            set_={
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in ('academy_id', 'year', 'week_number')
+            }
+        )
+        self.session.execute(stmt)
+
+    @staticmethod
+    def _rank_keywords(keyword_lists: Iterable[Optional[List[str]]], limit: int = 10) -> List[str]:
+        """키워드 목록들에서 등장 횟수 순 상위 키워드 (동률은 먼저 나온 순)"""
+        all_keywords = {}
+        for keywords in keyword_lists or []:
+            if keywords:
+                for kw in keywords:
+                    all_keywords[kw] = all_keywords.get(kw, 0) + 1
+
+        return sorted(all_keywords.keys(), key=lambda k: all_keywords[k], reverse=True)[:limit]
+
     def get_weekly_report(
         self,
         teacher_id: int,
@@ -0,0 +1,26 @@
+"""
+테스트 공통 설정
+"""
+import os
+import sys
+
+import pytest
+
+# src 패키지 import 경로 / DB 접속 없이 모듈 로드 (엔진은 생성만 하고 연결하지 않음)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DB_PASSWORD", "test")
+
+# DB 테스트용 PostgreSQL 서버 (설정되지 않으면 DB 테스트는 건너뜀)
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def scratch_engine():
+    """TEST_DATABASE_URL 서버에 만든 임시 데이터베이스 엔진 (테스트 세션 종료 시 삭제)"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+
+    from src.database import scratch_database
+
+    with scratch_database(TEST_DATABASE_URL, prefix="test") as engine:
+        yield engine
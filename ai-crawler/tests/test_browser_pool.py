@@ -0,0 +1,39 @@
+"""
+공유 브라우저 풀 교체 판정 테스트 (브라우저 없이 가짜 핸들 사용)
+"""
+import asyncio
+
+from src.crawlers import browser_pool
+from src.crawlers.browser_pool import BrowserPool, _BrowserHandle
+
+
+class FakeBrowser:
+    def is_connected(self):
+        return True
+
+
+def test_memory_check_is_rate_limited(monkeypatch):
+    calls = []
+
+    def rss_mb():
+        calls.append(1)
+        return BrowserPool.MAX_MEMORY_MB + 1.0
+
+    monkeypatch.setattr(browser_pool, '_child_processes_rss_mb', rss_mb)
+    pool = BrowserPool()
+    handle = _BrowserHandle(FakeBrowser(), headless=True)
+
+    async def run():
+        # 실행 직후 및 점검 간격 안에서는 /proc 을 읽지 않음
+        reasons = [await pool._recycle_reason(handle) for _ in range(50)]
+        handle.memory_checked_at -= pool.MEMORY_CHECK_INTERVAL_SEC
+        reasons.append(await pool._recycle_reason(handle))
+        reasons.append(await pool._recycle_reason(handle))
+        return reasons
+
+    reasons = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert reasons[:50] == [None] * 50
+    assert reasons[50].startswith('memory')
+    assert reasons[51] is None
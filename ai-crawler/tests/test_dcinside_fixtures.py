@@ -0,0 +1,123 @@
+"""
+DCInside HTTP 모드 오프라인 테스트 (저장된 목록/상세 페이지, 댓글 JSON 을 스텁 서버로 응답)
+"""
+import asyncio
+import json
+import os
+
+import httpx
+import pytest
+
+from src.benchmark.stub_site import FIXTURES_DIR, StubSite
+from src.crawlers.dcinside import DCInsideCrawler
+from src.crawlers.http_fetcher import BlockedError, HttpFetcher
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, 'dcinside', name), encoding='utf-8') as f:
+        return f.read()
+
+
+def _crawler(host: str = None) -> DCInsideCrawler:
+    crawler = DCInsideCrawler('gongmuwon', 'test_dcinside', fetch_mode='http', host=host)
+    crawler.HOST_RATE_PER_SEC = 1000.0
+    crawler.HOST_BURST = 1000
+    return crawler
+
+
+def _fetcher() -> HttpFetcher:
+    return HttpFetcher(block_titles=DCInsideCrawler.BLOCK_TITLES, block_selectors=DCInsideCrawler.BLOCK_SELECTORS)
+
+
+@pytest.fixture
+def site():
+    with StubSite() as stub:
+        yield stub
+
+
+def test_parse_list_page():
+    crawler = _crawler()
+    soup = crawler.parser.parse(_fixture('list.html'), crawler.LIST_TARGETS)
+    articles = crawler._parse_list_page(soup, limit=100)
+
+    assert articles
+    for article in articles:
+        assert article['external_id'].isdigit()
+        assert article['title']
+        assert article['url'].startswith(f"{crawler.host}/mgallery/board/view/")
+        assert article['post_date'] is not None
+
+    # 공지(us-post) 행은 제외
+    assert len(articles) < len(soup.select('tr.ub-content'))
+
+
+def test_parse_view_page():
+    crawler = _crawler()
+    soup = crawler.parser.parse(_fixture('view.html'), crawler.DETAIL_TARGETS)
+    result = crawler._parse_detail(soup)
+
+    assert '김철수' in result['content']
+    assert soup.select_one('input#e_s_n_o')['value'] == '3eabc219ebdd65fe3eef'
+
+
+def test_crawl_detail_http_fetches_comment_json(site):
+    crawler = _crawler(site.url)
+    expected = [item for item in json.loads(_fixture('comments.json'))['comments'] if item.get('memo')]
+
+    async def run():
+        async with _fetcher() as fetcher:
+            return await crawler._crawl_detail_http(
+                fetcher, f"{site.url}/mgallery/board/view/?id=gongmuwon&no=4812350"
+            )
+
+    result = asyncio.run(run())
+
+    assert '김철수' in result['content']
+    assert [c['author'] for c in result['comments']] == [item['name'] for item in expected]
+    assert result['comments'][0]['content'] == expected[0]['memo']
+
+
+def test_stream_http_mode(site):
+    crawler = _crawler(site.url)
+
+    async def run():
+        return await crawler.crawl_latest(limit=5)
+
+    posts = asyncio.run(run())
+
+    # limit 은 공지 행을 포함한 목록 행 수 기준
+    listed = crawler._parse_list_page(crawler.parser.parse(_fixture('list.html'), crawler.LIST_TARGETS), 5)
+    assert [post['external_id'] for post in posts] == [article['external_id'] for article in listed]
+    assert all(post['content'] for post in posts)
+    assert site.snapshot()['not_found'] == 0
+
+
+def _response(body: str, status: int = 200) -> httpx.Response:
+    return httpx.Response(
+        status, text=body, headers={'Content-Type': 'text/html; charset=UTF-8'},
+        request=httpx.Request('GET', 'https://gall.dcinside.com/board/view/')
+    )
+
+
+def test_block_phrases_in_post_body_are_not_blocks():
+    # 게시글/댓글 본문의 차단 문구, 캡차 위젯은 정상 페이지로 취급
+    body = _fixture('view.html').replace(
+        '</div>', '<p>IP 접근이 차단됐다는 글 봤음, 비정상적인 접근이라던데</p><div class="g-recaptcha"></div></div>', 1
+    )
+    _fetcher()._check_blocked('https://gall.dcinside.com/board/view/', _response(body))
+
+
+@pytest.mark.parametrize('body,status', [
+    ('<html><head><title>Just a moment...</title></head><body><form id="challenge-form"></form></body></html>', 200),
+    ('<html><head><title>디시인사이드 - 비정상적인 접근</title></head><body></body></html>', 200),
+    ('<html><body><div id="challenge-running"></div></body></html>', 200),
+    ('rate limited', 429),
+])
+def test_challenge_pages_are_blocks(body, status):
+    with pytest.raises(BlockedError):
+        _fetcher()._check_blocked('https://gall.dcinside.com/board/view/', _response(body, status))
+
+
+def test_large_pages_skip_marker_check():
+    body = '<html><head><title>비정상적인 접근</title></head><body>' + 'x' * HttpFetcher.BLOCK_PAGE_MAX_BYTES + '</body></html>'
+    _fetcher()._check_blocked('https://gall.dcinside.com/board/view/', _response(body))
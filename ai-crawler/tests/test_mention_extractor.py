@@ -0,0 +1,83 @@
+"""
+게시글 저장 테스트 (TEST_DATABASE_URL 서버의 임시 데이터베이스 사용, 설정되지 않으면 건너뜀)
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.models import CollectionSource, Post
+from src.services.mention_extractor import MentionExtractor
+
+
+@pytest.fixture
+def db(scratch_engine):
+    session = Session(bind=scratch_engine)
+    yield session
+    session.rollback()
+    session.execute(text(
+        "TRUNCATE teacher_mentions, comments, posts, collection_sources, teacher_mention_daily CASCADE"
+    ))
+    session.commit()
+    session.close()
+
+
+def _post(post_date: datetime, content: str) -> dict:
+    return {
+        'external_id': '100',
+        'title': '국어 강의 후기',
+        'content': content,
+        'url': 'https://example.com/100',
+        'post_date': post_date,
+        'comments': [{'external_id': '0', 'content': '동의합니다'}]
+    }
+
+
+@pytest.mark.parametrize('bulk', [True, False])
+def test_recrawl_with_shifted_post_date_updates_same_row(db, bulk):
+    # 유니크 키에 파티션 키(post_date)가 포함되어 DB 가 게시글 1건을 보장하지 못하므로
+    # 재수집 시 게시일이 달라져도 저장된 post_date 로 같은 행을 갱신해야 한다
+    source = CollectionSource(name='test', code='test')
+    db.add(source)
+    db.commit()
+
+    posted = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+    extractor = MentionExtractor(db, bulk=bulk)
+
+    extractor.process_crawled_data(source, [_post(posted, '첫 수집')])
+    # 상대 날짜 표기 등으로 게시일이 다르게 파싱된 재수집 (내용 변경 / 변경 없음)
+    stats = extractor.process_crawled_data(source, [_post(posted - timedelta(days=1), '본문 수정')])
+    extractor.process_crawled_data(source, [_post(posted + timedelta(minutes=5), '본문 수정')])
+
+    rows = db.query(Post).filter(Post.source_id == source.id, Post.external_id == '100').all()
+    assert len(rows) == 1
+    assert rows[0].post_date == posted
+    assert rows[0].content == '본문 수정'
+    assert stats['posts_created'] == 0
+
+
+def test_row_stats_exclude_rolled_back_posts(db, monkeypatch):
+    source = CollectionSource(name='test', code='test')
+    db.add(source)
+    db.commit()
+
+    extractor = MentionExtractor(db, bulk=False)
+    save_comment = extractor._save_comment
+
+    def failing_save_comment(post, data):
+        if post.external_id == '2':
+            raise ValueError('broken comment')
+        return save_comment(post, data)
+
+    monkeypatch.setattr(extractor, '_save_comment', failing_save_comment)
+
+    posted = datetime.now().replace(microsecond=0)
+    posts = [dict(_post(posted, f'본문 {i}'), external_id=str(i)) for i in (1, 2, 3)]
+    stats = extractor.process_crawled_data(source, posts)
+
+    # 2번 게시글 오류의 롤백으로 1번도 취소되어 3번만 저장됨
+    saved = db.query(Post.external_id).filter(Post.source_id == source.id).all()
+    assert [row.external_id for row in saved] == ['3']
+    assert stats['posts_created'] == 1
+    assert stats['comments_created'] == 1
@@ -0,0 +1,117 @@
+"""
+네이버 카페 API 모드 오프라인 테스트 (저장된 목록/게시글/댓글 JSON 을 스텁 서버로 응답)
+"""
+import asyncio
+import json
+import os
+import shutil
+from contextlib import aclosing
+from datetime import datetime
+
+import pytest
+
+from src.benchmark.stub_site import FIXTURES_DIR, StubSite
+from src.crawlers.http_fetcher import BlockedError
+from src.crawlers.naver_cafe import KST, NaverCafeCrawler
+
+
+def _fixture(name: str):
+    with open(os.path.join(FIXTURES_DIR, 'naver_cafe', name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _crawler(host: str, cafe_id: str = 'stubcafe', club_id: str = None) -> NaverCafeCrawler:
+    crawler = NaverCafeCrawler(cafe_id, 'test_naver', host=host, api_host=host, fetch_mode='api', club_id=club_id)
+    crawler.HOST_RATE_PER_SEC = 1000.0
+    crawler.HOST_BURST = 1000
+    return crawler
+
+
+def _collect(stream) -> list:
+    async def run():
+        async with aclosing(stream) as posts:
+            return [post async for post in posts]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def site():
+    with StubSite() as stub:
+        yield stub
+
+
+def test_stream_api_latest(site):
+    crawler = _crawler(site.url)
+    posts = _collect(crawler._stream_api(None, 5))
+
+    listed = _fixture('api_article_list.json')['message']['result']['articleList'][:5]
+    assert [post['external_id'] for post in posts] == [str(item['articleId']) for item in listed]
+    assert [post['title'] for post in posts] == [item['subject'] for item in listed]
+    assert posts[0]['post_date'] == datetime.fromtimestamp(
+        listed[0]['writeDateTimestamp'] / 1000, KST
+    ).replace(tzinfo=None)
+    assert site.snapshot()['not_found'] == 0
+
+
+def test_stream_api_detail_and_comments(site):
+    crawler = _crawler(site.url)
+    post = _collect(crawler._stream_api('국어', 1))[0]
+
+    article = _fixture('api_article.json')['result']
+    first_page = [item for item in article['comments']['items'] if not item['isDeleted'] and item['content']]
+    second_page = _fixture('api_comments.json')['result']['comments']['items']
+
+    assert '이영희' in post['content']
+    assert post['author'] == article['article']['writer']['nick']
+    assert post['view_count'] == article['article']['readCount']
+
+    # 첫 댓글 페이지(게시글 응답) + 추가 페이지, 삭제 댓글 제외
+    assert [c['author'] for c in post['comments']] == [
+        item['writer']['nick'] for item in first_page + second_page
+    ]
+    assert post['comments'][-1]['content'] == second_page[-1]['content']
+    assert post['comment_count'] == article['article']['commentCount']
+
+
+def test_stream_api_resolves_club_id(site):
+    crawler = _crawler(site.url)
+    assert crawler.club_id is None
+
+    posts = _collect(crawler._stream_api(None, 2))
+
+    club_id = str(_fixture('api_cafe_info.json')['message']['result']['cafeInfoView']['cafeId'])
+    assert crawler.club_id == club_id
+    assert all(f"clubid={club_id}&" in post['url'] for post in posts)
+
+
+def test_stream_api_uses_known_club_id(site):
+    crawler = _crawler(site.url, club_id='12345')
+    posts = _collect(crawler._stream_api(None, 2))
+
+    assert crawler.club_id == '12345'
+    assert all('clubid=12345&' in post['url'] for post in posts)
+
+
+def test_stream_api_unresolved_club_id_raises(tmp_path):
+    fixtures = tmp_path / 'fixtures'
+    shutil.copytree(FIXTURES_DIR, fixtures)
+    (fixtures / 'naver_cafe' / 'api_cafe_info.json').write_text('{"message": {"result": {}}}', encoding='utf-8')
+
+    with StubSite(fixtures_dir=str(fixtures)) as site:
+        crawler = _crawler(site.url)
+        with pytest.raises(BlockedError):
+            _collect(crawler._stream_api(None, 2))
+
+
+def test_stream_defaults_to_api(site, monkeypatch):
+    monkeypatch.delenv('NAVER_FETCH_MODE', raising=False)
+    crawler = NaverCafeCrawler('stubcafe', 'test_naver', host=site.url, api_host=site.url)
+    crawler.HOST_RATE_PER_SEC = 1000.0
+    crawler.HOST_BURST = 1000
+
+    posts = _collect(crawler.stream(limit=3))
+
+    assert crawler.fetch_mode == 'api'
+    assert len(posts) == 3
+    assert all(post['content'] for post in posts)
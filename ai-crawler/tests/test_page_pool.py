@@ -0,0 +1,49 @@
+"""
+상세 페이지 탭 풀 테스트 (브라우저 없이 가짜 컨텍스트/페이지 사용)
+"""
+import asyncio
+
+from src.crawlers.dcinside import DCInsideCrawler
+
+
+class FakeContext:
+    """new_page 호출마다 이벤트 루프에 양보하는 가짜 BrowserContext"""
+
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        await asyncio.sleep(0)
+        page = object()
+        self.pages.append(page)
+        return page
+
+
+class PoolCrawler(DCInsideCrawler):
+    """탭 동시 사용 여부를 기록하는 크롤러"""
+
+    def __init__(self):
+        super().__init__('gongmuwon', 'test_dcinside')
+        self.context = FakeContext()
+        self.page = object()
+        self.in_use = set()
+        self.overlaps = 0
+
+    async def _crawl_detail(self, url, page=None):
+        if page in self.in_use:
+            self.overlaps += 1
+        self.in_use.add(page)
+        await asyncio.sleep(0.001)
+        self.in_use.discard(page)
+        return {'content': url}
+
+
+def test_page_pool_created_once_under_concurrent_fetches():
+    crawler = PoolCrawler()
+    articles = [{'url': f"https://example.com/{i}"} for i in range(20)]
+
+    details = asyncio.run(crawler.fetch_details(articles))
+
+    assert [d['content'] for d in details] == [a['url'] for a in articles]
+    assert len(crawler.context.pages) == crawler.DETAIL_CONCURRENCY - 1
+    assert crawler.overlaps == 0
@@ -0,0 +1,14 @@
+"""
+리포트 쿼리 실행 계획 회귀 테스트 (순차 스캔 금지)
+
+TEST_DATABASE_URL 서버의 임시 데이터베이스에서 점검한다. 설정되지 않으면 건너뛴다.
+"""
+from src.services.query_plan_checker import QueryPlanChecker
+
+
+def test_report_queries_avoid_seq_scans(scratch_engine):
+    violations = QueryPlanChecker(scratch_engine).run()
+
+    assert violations == [], "\n".join(
+        f"{v['query']}: Seq Scan on {v['table']}" for v in violations
+    )
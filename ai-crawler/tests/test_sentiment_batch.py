@@ -0,0 +1,47 @@
+"""
+BatchSentimentScorer / SentimentAnalyzer.analyze 결과 일치 테스트
+"""
+import random
+
+import pytest
+
+from src.services.sentiment_analyzer import SentimentAnalyzer
+from src.services.sentiment_batch import BatchSentimentScorer
+
+FILLERS = ['', ' ', '강의', '쌤', '진짜', '.', 'ㅋㅋ', '어', '쉬', '추']
+
+
+@pytest.fixture
+def analyzer():
+    a = SentimentAnalyzer()
+    a.load_keywords(from_db=False)
+    return a
+
+
+def _random_texts(analyzer: SentimentAnalyzer, count: int, seed: int):
+    rng = random.Random(seed)
+    fragments = [kw for entries in analyzer.keywords.values() for kw, _ in entries] + FILLERS
+    return [''.join(rng.choice(fragments) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+def test_tied_difficulty_matches_analyze(analyzer):
+    # 카테고리 점수 합산 순서가 다르면 easy == hard 동점이 깨져 HARD 로 판정되던 사례
+    text = '강추추천아쉽고급멘붕대박듣자쉬워요기초지루듣자답답꼼꼼쉬움명강의추천강추좋아요심화초보추천어려움감사'
+    assert analyzer.analyze(text)['difficulty'] == 'MEDIUM'
+    assert analyzer.analyze_batch([text]) == [analyzer.analyze(text)]
+
+
+def test_score_matches_analyze(analyzer):
+    texts = _random_texts(analyzer, 20000, seed=42) + [None, '']
+    expected = [analyzer.analyze(text) for text in texts]
+    assert BatchSentimentScorer(analyzer).analyze(texts) == expected
+
+
+def test_scorer_follows_added_keywords(analyzer):
+    scorer = BatchSentimentScorer(analyzer)
+    assert scorer.analyze(['킹갓 강의'])[0]['sentiment'] == 'NEUTRAL'
+
+    analyzer.add_keyword('sentiment_positive', '킹갓', 2.0)
+
+    assert scorer.analyze(['킹갓 강의']) == [analyzer.analyze('킹갓 강의')]
+    assert scorer.analyze(['킹갓 강의'])[0]['sentiment'] == 'POSITIVE'
@@ -0,0 +1,66 @@
+"""
+TeacherMatcher 오토마톤 경로 / 이름별 정규식 경로 결과 일치 테스트
+"""
+import random
+
+import pytest
+
+from src.services.teacher_matcher import TeacherMatcher
+
+TEACHERS = [
+    {'id': 1, 'name': '이선재', 'aliases': ['선재', '이선재T'], 'academy_name': '공단기', 'subject_name': '국어'},
+    {'id': 2, 'name': '전한길', 'aliases': ['한길', '한길쌤'], 'academy_name': '공단기', 'subject_name': '한국사'},
+    {'id': 3, 'name': '손진숙', 'aliases': ['Son', 'son진숙'], 'academy_name': '해커스', 'subject_name': '영어'},
+    {'id': 4, 'name': '이선', 'aliases': ['선'], 'academy_name': '윌비스', 'subject_name': '행정법'},
+    {'id': 5, 'name': 'KIM', 'aliases': ['K-김', 'kim.t'], 'academy_name': '에듀윌', 'subject_name': '수학'},
+]
+
+# 경계/접미사 조합이 자주 나오도록 이름 조각, 접미사, 경계 문자를 섞어 생성
+FRAGMENTS = [
+    '이선재', '선재', '이선', '전한길', '한길', '한길쌤', '손진숙', 'Son', 'SON', 'son진숙', 'KIM', 'kim',
+    'K-김', 'kim.t', '쌤', '강사', '선생', '선생님', '교수님', '국어', '영어', '행정법', '헌법',
+    '강의', '좋아요', '가', 'a', '1', ' ', '  ', '\n', '[', ']', '(', ')', '.', ',', '!', '~', '-', 'İ', 'ſ', 'K',
+]
+
+
+def _regex_mentions(matcher: TeacherMatcher, text: str, monkeypatch):
+    """이름별 정규식 경로로 계산한 find_mentions 결과"""
+    with monkeypatch.context() as m:
+        m.setattr(matcher, '_scan_spans', matcher._scan_spans_regex)
+        return matcher.find_mentions(text)
+
+
+@pytest.fixture
+def matcher():
+    m = TeacherMatcher()
+    m.load_teachers(TEACHERS)
+    return m
+
+
+@pytest.mark.parametrize('text', [
+    '이선재 강의 좋아요',
+    '이선재국어 vs 전한길한국사',
+    '[이선재]쌤 말고 이선재쌤',
+    '한길쌤쌤 한길쌤 한길쌤!',
+    '이선재이선재 이선 선 선재',
+    'son진숙영어, SON 선생님, Son.',
+    'K-김 kim.t KIM수학 kimchi',
+    '',
+    '이선',
+])
+def test_find_mentions_matches_regex_path(matcher, text, monkeypatch):
+    assert matcher.find_mentions(text) == _regex_mentions(matcher, text, monkeypatch)
+
+
+def test_find_mentions_matches_regex_path_random(matcher, monkeypatch):
+    rng = random.Random(1234)
+    for _ in range(2000):
+        text = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+        assert matcher.find_mentions(text) == _regex_mentions(matcher, text, monkeypatch), text
+
+
+def test_scan_spans_matches_regex_spans(matcher):
+    rng = random.Random(5678)
+    for _ in range(2000):
+        text = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+        assert sorted(matcher._scan_spans(text)) == sorted(matcher._scan_spans_regex(text)), text
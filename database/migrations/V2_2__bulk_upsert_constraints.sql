@@ -0,0 +1,39 @@
+-- ============================================
+-- TeacherHub V2.2 - Bulk Upsert Constraints
+-- 배치 upsert (INSERT ... ON CONFLICT) 용 유니크 인덱스
+-- ============================================
+
+-- 댓글 중복 정리 (post_id + external_id 기준, 가장 먼저 저장된 행 유지)
+DELETE FROM comments c
+USING comments d
+WHERE c.post_id = d.post_id
+  AND c.external_id = d.external_id
+  AND c.id > d.id;
+
+-- 파티션 테이블(V2.6 이후)은 V2.6 이 post_date 를 포함한 인덱스를 만든다
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'comments'::regclass) = 'r' THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_comments_post_external
+            ON comments(post_id, external_id);
+    END IF;
+END $$;
+
+-- 게시글 단위 멘션 중복 정리 (comment_id IS NULL 은 기존 UNIQUE 로 걸러지지 않음)
+DELETE FROM teacher_mentions m
+USING teacher_mentions d
+WHERE m.comment_id IS NULL
+  AND d.comment_id IS NULL
+  AND m.teacher_id = d.teacher_id
+  AND m.post_id = d.post_id
+  AND m.mention_type = d.mention_type
+  AND m.id > d.id;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'teacher_mentions'::regclass) = 'r' THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_mentions_post_level
+            ON teacher_mentions(teacher_id, post_id, mention_type)
+            WHERE comment_id IS NULL;
+    END IF;
+END $$;
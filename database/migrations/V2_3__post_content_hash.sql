@@ -0,0 +1,7 @@
+-- ============================================
+-- TeacherHub V2.3 - Post Content Hash
+-- 재수집 게시글 변경 여부 판정용 내용 해시 (제목 + 본문 + 댓글 ID)
+-- ============================================
+
+-- 기존 게시글은 NULL 로 두고, 다음 수집 시 해시가 채워진다 (1회 재추출)
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
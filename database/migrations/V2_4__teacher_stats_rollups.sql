@@ -0,0 +1,226 @@
+-- ============================================
+-- TeacherHub V2.4 - Teacher Stats Rollups
+-- 강사 x 일자 멘션 집계 테이블 (트리거로 증분 유지) 및 통계 뷰 구체화
+-- ============================================
+
+-- 강사 x 일자(게시일) 멘션 집계
+CREATE TABLE IF NOT EXISTS teacher_mention_daily (
+    teacher_id INTEGER NOT NULL REFERENCES teachers(id) ON DELETE CASCADE,
+    stat_date DATE NOT NULL,  -- 게시글 작성일 (없으면 수집일)
+
+    mention_count INTEGER NOT NULL DEFAULT 0,
+    title_count INTEGER NOT NULL DEFAULT 0,
+    content_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    positive_count INTEGER NOT NULL DEFAULT 0,
+    negative_count INTEGER NOT NULL DEFAULT 0,
+    neutral_count INTEGER NOT NULL DEFAULT 0,
+    recommendation_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_easy_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_medium_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_hard_count INTEGER NOT NULL DEFAULT 0,
+    sentiment_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    sentiment_score_count INTEGER NOT NULL DEFAULT 0,  -- 평균 = sum / count
+
+    PRIMARY KEY (teacher_id, stat_date)
+);
+
+COMMENT ON TABLE teacher_mention_daily IS '강사 x 일자 멘션 집계 (teacher_mentions 트리거로 증분 유지)';
+
+CREATE INDEX IF NOT EXISTS idx_mention_daily_date ON teacher_mention_daily(stat_date);
+
+-- 멘션 변경분(전이 테이블)을 일자별로 묶어 집계에 더하거나 뺀다
+CREATE OR REPLACE FUNCTION fn_teacher_mention_daily_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            COALESCE(p.post_date, p.collected_at)::date,
+            -COUNT(*),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            -COUNT(*) FILTER (WHERE m.is_recommended),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            -COALESCE(SUM(m.sentiment_score), 0),
+            -COUNT(m.sentiment_score)
+        FROM old_mentions m
+        JOIN posts p ON p.id = m.post_id
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            COALESCE(p.post_date, p.collected_at)::date,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            COUNT(*) FILTER (WHERE m.is_recommended),
+            COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            COALESCE(SUM(m.sentiment_score), 0),
+            COUNT(m.sentiment_score)
+        FROM new_mentions m
+        JOIN posts p ON p.id = m.post_id
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 전이 테이블은 이벤트별 트리거로만 선언 가능 (문장 단위 1회 실행)
+DROP TRIGGER IF EXISTS trg_mention_daily_insert ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_insert
+    AFTER INSERT ON teacher_mentions
+    REFERENCING NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_update ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_update
+    AFTER UPDATE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_delete ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_delete
+    AFTER DELETE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+-- 기존 멘션으로 집계 초기화 (최초 1회, 재실행 시 보관(V2.6)된 월의 집계를 지우지 않도록
+-- 이미 집계가 있으면 건너뜀. 전체 재계산은 'refresh-stats --rebuild')
+INSERT INTO teacher_mention_daily (
+    teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+    positive_count, negative_count, neutral_count, recommendation_count,
+    difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+    sentiment_score_sum, sentiment_score_count
+)
+SELECT
+    m.teacher_id,
+    COALESCE(p.post_date, p.collected_at)::date,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+    COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+    COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+    COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+    COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+    COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+    COUNT(*) FILTER (WHERE m.is_recommended),
+    COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+    COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+    COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+    COALESCE(SUM(m.sentiment_score), 0),
+    COUNT(m.sentiment_score)
+FROM teacher_mentions m
+JOIN posts p ON p.id = m.post_id
+WHERE m.teacher_id IS NOT NULL
+  AND NOT EXISTS (SELECT 1 FROM teacher_mention_daily)
+GROUP BY 1, 2;
+
+-- ============================================
+-- 구체화 뷰: 강사별 최신 통계 / 학원별 강사 랭킹
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY 용 유니크 인덱스 포함
+-- ============================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_teacher_latest_stats AS
+SELECT DISTINCT ON (t.id)
+    t.id AS teacher_id,
+    t.name AS teacher_name,
+    a.name AS academy_name,
+    s.name AS subject_name,
+    dr.report_date,
+    dr.mention_count,
+    dr.positive_count,
+    dr.negative_count,
+    dr.neutral_count,
+    dr.avg_sentiment_score,
+    dr.recommendation_count,
+    dr.mention_change
+FROM teachers t
+LEFT JOIN academies a ON t.academy_id = a.id
+LEFT JOIN subjects s ON t.subject_id = s.id
+JOIN daily_reports dr ON t.id = dr.teacher_id
+ORDER BY t.id, dr.report_date DESC;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_teacher_latest_stats ON mv_teacher_latest_stats(teacher_id);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_academy_teacher_ranking AS
+SELECT
+    a.id AS academy_id,
+    a.name AS academy_name,
+    t.id AS teacher_id,
+    t.name AS teacher_name,
+    s.name AS subject_name,
+    COALESCE(SUM(dr.mention_count), 0) AS total_mentions,
+    COALESCE(AVG(dr.avg_sentiment_score), 0) AS avg_sentiment,
+    RANK() OVER (PARTITION BY a.id ORDER BY SUM(dr.mention_count) DESC NULLS LAST) AS mention_rank
+FROM academies a
+JOIN teachers t ON a.id = t.academy_id
+LEFT JOIN subjects s ON t.subject_id = s.id
+LEFT JOIN daily_reports dr ON t.id = dr.teacher_id
+WHERE dr.report_date >= CURRENT_DATE - INTERVAL '30 days'
+GROUP BY a.id, a.name, t.id, t.name, s.name;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_academy_teacher_ranking ON mv_academy_teacher_ranking(academy_id, teacher_id);
+
+-- 기존 뷰 이름은 구체화 뷰 조회로 유지
+CREATE OR REPLACE VIEW v_teacher_latest_stats AS
+SELECT * FROM mv_teacher_latest_stats
+ORDER BY mention_count DESC NULLS LAST;
+
+CREATE OR REPLACE VIEW v_academy_teacher_ranking AS
+SELECT * FROM mv_academy_teacher_ranking
+ORDER BY academy_name, mention_rank;
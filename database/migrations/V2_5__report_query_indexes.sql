@@ -0,0 +1,34 @@
+-- ============================================
+-- TeacherHub V2.5 - Report Query Indexes
+-- 리포트/집계 조회 패턴용 복합/커버링/부분 인덱스
+-- ============================================
+
+-- 강사별 데일리 리포트: teacher_id 로 멘션을 찾고 post_id 로 게시일 조인
+CREATE INDEX IF NOT EXISTS idx_mentions_teacher_post
+    ON teacher_mentions(teacher_id, post_id);
+
+-- teacher_id 단일 인덱스는 idx_mentions_teacher_post 의 선행 컬럼과 같아 중복 (쓰기 비용만 증가)
+DROP INDEX IF EXISTS idx_mentions_teacher;
+
+-- 전체 데일리 리포트/학원 통계: 게시일 범위 -> 게시글 ID (힙 접근 없이 조인)
+CREATE INDEX IF NOT EXISTS idx_posts_date_covering
+    ON posts(post_date) INCLUDE (id);
+
+-- 미분석 멘션 재분석 (rescore --only-unanalyzed) 키셋 스캔
+CREATE INDEX IF NOT EXISTS idx_mentions_unanalyzed
+    ON teacher_mentions(id)
+    WHERE sentiment IS NULL;
+
+-- 강사별 기간 리포트 (실시간 주간 통계, 전일 리포트 조회)
+CREATE INDEX IF NOT EXISTS idx_reports_teacher_date
+    ON daily_reports(teacher_id, report_date);
+
+-- idx_reports_teacher_date 가 teacher_id 단독 조회도 처리
+DROP INDEX IF EXISTS idx_reports_teacher;
+
+-- 주간 랭킹: 주차별 언급 수 내림차순 상위 N
+CREATE INDEX IF NOT EXISTS idx_weekly_reports_year_week_mentions
+    ON weekly_reports(year, week_number, mention_count DESC);
+
+-- 참고: weekly_reports(teacher_id, year, week_number) 는 uk_weekly_teacher_year_week,
+--       comments(post_id, external_id) 는 uq_comments_post_external (V2.2) 가 처리
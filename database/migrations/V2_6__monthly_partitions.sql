@@ -0,0 +1,348 @@
+-- ============================================
+-- TeacherHub V2.6 - Monthly Partitions
+-- posts / comments / teacher_mentions 를 게시일(post_date) 기준 월별 RANGE 파티션으로 전환
+-- ============================================
+--
+-- - 파티션 키는 세 테이블 모두 게시글의 post_date 이다. comments/teacher_mentions 는
+--   post_date 를 함께 저장하므로 같은 달의 게시글/댓글/멘션이 같은 월 파티션에 모인다.
+-- - 파티션 테이블의 PK/UNIQUE 는 파티션 키를 포함해야 하므로 post_date 가 추가된다.
+--   post_date 는 post_id 에 종속된 값이라 중복 판정 의미는 바뀌지 않는다.
+-- - 단, posts 의 (source_id, external_id) 유니크 키도 post_date 를 포함하게 되어 DB 는 더 이상
+--   원본 게시글 1건 = 1행을 보장하지 않는다. 재수집 시 게시일이 다르게 파싱되면(상대 날짜 표기 등)
+--   중복 행이 생길 수 있으므로, MentionExtractor 가 기존 행의 post_date 를 조회해 그대로 사용한다.
+-- - 월 파티션 이름은 <테이블>_pYYYYMM, 범위 밖 행은 <테이블>_default 에 저장된다.
+--   이후 파티션 생성/보관은 PartitionManager (스케줄러 partition 작업) 가 담당한다.
+-- - 기존 테이블을 새 파티션 테이블로 복사 후 교체하므로 크롤러/스케줄러를 멈추고 실행한다.
+
+DO $$
+DECLARE
+    first_month DATE;
+    last_month DATE;
+    month_start DATE;
+    parent TEXT;
+    orphan_comments BIGINT;
+    orphan_mentions BIGINT;
+BEGIN
+    -- 이미 파티션 테이블(relkind 'p')이면 전환 완료
+    IF (SELECT relkind FROM pg_class WHERE oid = 'posts'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    -- 파티션 키는 NULL 불가: 게시일이 없으면 수집일 (일자 집계의 기존 기준과 동일)
+    UPDATE posts SET post_date = COALESCE(collected_at, CURRENT_TIMESTAMP) WHERE post_date IS NULL;
+
+    ALTER TABLE teacher_mentions RENAME TO teacher_mentions_unpartitioned;
+    ALTER TABLE comments RENAME TO comments_unpartitioned;
+    ALTER TABLE posts RENAME TO posts_unpartitioned;
+
+    -- 시퀀스는 기존 것을 이어서 사용 (ID 유지)
+    CREATE TABLE posts (
+        id INTEGER NOT NULL DEFAULT nextval('posts_id_seq'),
+        source_id INTEGER,
+        external_id VARCHAR(100),
+        title VARCHAR(500) NOT NULL,
+        content TEXT,
+        url VARCHAR(500),
+        author VARCHAR(100),
+        post_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        view_count INTEGER DEFAULT 0,
+        like_count INTEGER DEFAULT 0,
+        comment_count INTEGER DEFAULT 0,
+        content_hash VARCHAR(32),
+        collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) PARTITION BY RANGE (post_date);
+
+    CREATE TABLE comments (
+        id INTEGER NOT NULL DEFAULT nextval('comments_id_seq'),
+        post_id INTEGER,
+        post_date TIMESTAMP NOT NULL,
+        external_id VARCHAR(100),
+        content TEXT,
+        author VARCHAR(100),
+        comment_date TIMESTAMP,
+        like_count INTEGER DEFAULT 0,
+        collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) PARTITION BY RANGE (post_date);
+
+    CREATE TABLE teacher_mentions (
+        id INTEGER NOT NULL DEFAULT nextval('teacher_mentions_id_seq'),
+        teacher_id INTEGER,
+        post_id INTEGER,
+        comment_id INTEGER,
+        post_date TIMESTAMP NOT NULL,
+        mention_type VARCHAR(20) NOT NULL,
+        matched_text VARCHAR(200),
+        context TEXT,
+        sentiment VARCHAR(20),
+        sentiment_score DOUBLE PRECISION,
+        difficulty VARCHAR(20),
+        is_recommended BOOLEAN,
+        analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) PARTITION BY RANGE (post_date);
+
+    -- 기존 데이터 범위 ~ 3개월 뒤까지 월 파티션 + 범위 밖 행용 DEFAULT 파티션
+    SELECT date_trunc('month', LEAST(MIN(post_date), CURRENT_TIMESTAMP))::date
+    INTO first_month FROM posts_unpartitioned;
+    last_month := (date_trunc('month', CURRENT_DATE) + INTERVAL '3 months')::date;
+
+    FOREACH parent IN ARRAY ARRAY['posts', 'comments', 'teacher_mentions'] LOOP
+        month_start := first_month;
+        WHILE month_start <= last_month LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_p' || to_char(month_start, 'YYYYMM'), parent,
+                month_start, (month_start + INTERVAL '1 month')::date
+            );
+            month_start := (month_start + INTERVAL '1 month')::date;
+        END LOOP;
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+    END LOOP;
+
+    -- 데이터 복사. 게시글이 없는 댓글/멘션(post_id NULL)은 버리지 않고 파티션 키를
+    -- 댓글 작성일/수집일(멘션은 댓글의 파티션 키/분석일)로 대신 정한다.
+    SELECT COUNT(*) INTO orphan_comments FROM comments_unpartitioned c
+    WHERE NOT EXISTS (SELECT 1 FROM posts_unpartitioned p WHERE p.id = c.post_id);
+    SELECT COUNT(*) INTO orphan_mentions FROM teacher_mentions_unpartitioned m
+    WHERE NOT EXISTS (SELECT 1 FROM posts_unpartitioned p WHERE p.id = m.post_id);
+
+    INSERT INTO posts (id, source_id, external_id, title, content, url, author, post_date,
+                       view_count, like_count, comment_count, content_hash, collected_at)
+    SELECT id, source_id, external_id, title, content, url, author, post_date,
+           view_count, like_count, comment_count, content_hash, collected_at
+    FROM posts_unpartitioned;
+
+    INSERT INTO comments (id, post_id, post_date, external_id, content, author,
+                          comment_date, like_count, collected_at)
+    SELECT c.id, c.post_id, COALESCE(p.post_date, c.comment_date, c.collected_at, CURRENT_TIMESTAMP),
+           c.external_id, c.content, c.author, c.comment_date, c.like_count, c.collected_at
+    FROM comments_unpartitioned c
+    LEFT JOIN posts_unpartitioned p ON p.id = c.post_id;
+
+    -- 집계(teacher_mention_daily)는 이미 반영된 행이므로 트리거 생성 전에 복사
+    INSERT INTO teacher_mentions (id, teacher_id, post_id, comment_id, post_date, mention_type,
+                                  matched_text, context, sentiment, sentiment_score,
+                                  difficulty, is_recommended, analyzed_at)
+    SELECT m.id, m.teacher_id, m.post_id, m.comment_id,
+           COALESCE(p.post_date, c.post_date, m.analyzed_at, CURRENT_TIMESTAMP), m.mention_type,
+           m.matched_text, m.context, m.sentiment, m.sentiment_score,
+           m.difficulty, m.is_recommended, m.analyzed_at
+    FROM teacher_mentions_unpartitioned m
+    LEFT JOIN posts_unpartitioned p ON p.id = m.post_id
+    LEFT JOIN comments c ON c.id = m.comment_id;
+
+    -- 게시글 없는 멘션은 기존 집계(V2.4, 게시일 기준)에서 빠져 있었으므로 여기서 더한다
+    -- (이후 트리거가 삭제/수정 시 빼는 값과 맞춤)
+    INSERT INTO teacher_mention_daily AS d (
+        teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+        positive_count, negative_count, neutral_count, recommendation_count,
+        difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+        sentiment_score_sum, sentiment_score_count
+    )
+    SELECT
+        m.teacher_id,
+        m.post_date::date,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+        COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+        COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+        COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+        COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+        COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+        COUNT(*) FILTER (WHERE m.is_recommended),
+        COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+        COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+        COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+        COALESCE(SUM(m.sentiment_score), 0),
+        COUNT(m.sentiment_score)
+    FROM teacher_mentions m
+    WHERE m.teacher_id IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM posts_unpartitioned p WHERE p.id = m.post_id)
+    GROUP BY 1, 2
+    ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+        mention_count = d.mention_count + EXCLUDED.mention_count,
+        title_count = d.title_count + EXCLUDED.title_count,
+        content_count = d.content_count + EXCLUDED.content_count,
+        comment_count = d.comment_count + EXCLUDED.comment_count,
+        positive_count = d.positive_count + EXCLUDED.positive_count,
+        negative_count = d.negative_count + EXCLUDED.negative_count,
+        neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+        recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+        difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+        difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+        difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+        sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+        sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+
+    IF orphan_comments > 0 OR orphan_mentions > 0 THEN
+        RAISE NOTICE 'Copied % comments and % mentions without a post (partition key from comment/analysis date)',
+            orphan_comments, orphan_mentions;
+    END IF;
+
+    ALTER SEQUENCE posts_id_seq OWNED BY posts.id;
+    ALTER SEQUENCE comments_id_seq OWNED BY comments.id;
+    ALTER SEQUENCE teacher_mentions_id_seq OWNED BY teacher_mentions.id;
+
+    DROP TABLE teacher_mentions_unpartitioned;
+    DROP TABLE comments_unpartitioned;
+    DROP TABLE posts_unpartitioned;
+
+    -- 제약조건 (파티션 키 포함)
+    ALTER TABLE posts
+        ADD CONSTRAINT posts_pkey PRIMARY KEY (id, post_date),
+        ADD CONSTRAINT uq_posts_source_external UNIQUE (source_id, external_id, post_date),
+        ADD CONSTRAINT posts_source_id_fkey FOREIGN KEY (source_id) REFERENCES collection_sources(id);
+
+    ALTER TABLE comments
+        ADD CONSTRAINT comments_pkey PRIMARY KEY (id, post_date),
+        ADD CONSTRAINT comments_post_id_fkey FOREIGN KEY (post_id, post_date)
+            REFERENCES posts(id, post_date) ON DELETE CASCADE;
+
+    ALTER TABLE teacher_mentions
+        ADD CONSTRAINT teacher_mentions_pkey PRIMARY KEY (id, post_date),
+        ADD CONSTRAINT uq_mentions_teacher_post_comment_type
+            UNIQUE (teacher_id, post_id, comment_id, mention_type, post_date),
+        ADD CONSTRAINT teacher_mentions_teacher_id_fkey FOREIGN KEY (teacher_id)
+            REFERENCES teachers(id) ON DELETE CASCADE,
+        ADD CONSTRAINT teacher_mentions_post_id_fkey FOREIGN KEY (post_id, post_date)
+            REFERENCES posts(id, post_date) ON DELETE CASCADE,
+        ADD CONSTRAINT teacher_mentions_comment_id_fkey FOREIGN KEY (comment_id, post_date)
+            REFERENCES comments(id, post_date) ON DELETE CASCADE;
+
+    -- 인덱스 (부모에 만들면 모든 파티션에 생성됨)
+    CREATE INDEX idx_posts_source ON posts(source_id);
+    CREATE INDEX idx_posts_date ON posts(post_date);
+    CREATE INDEX idx_posts_date_covering ON posts(post_date) INCLUDE (id);
+    CREATE INDEX idx_posts_collected ON posts(collected_at);
+
+    CREATE INDEX idx_comments_post ON comments(post_id);
+    CREATE UNIQUE INDEX uq_comments_post_external ON comments(post_id, external_id, post_date);
+
+    CREATE INDEX idx_mentions_teacher_post ON teacher_mentions(teacher_id, post_id);
+    CREATE INDEX idx_mentions_teacher_date ON teacher_mentions(teacher_id, post_date);
+    CREATE INDEX idx_mentions_post_date ON teacher_mentions(post_date);
+    CREATE INDEX idx_mentions_post ON teacher_mentions(post_id);
+    CREATE INDEX idx_mentions_analyzed ON teacher_mentions(analyzed_at);
+    CREATE UNIQUE INDEX uq_mentions_post_level ON teacher_mentions(teacher_id, post_id, mention_type, post_date)
+        WHERE comment_id IS NULL;
+    CREATE INDEX idx_mentions_unanalyzed ON teacher_mentions(id) WHERE sentiment IS NULL;
+
+    COMMENT ON TABLE posts IS '수집된 게시글 (post_date 월별 파티션)';
+    COMMENT ON TABLE comments IS '게시글 댓글 (게시글 post_date 월별 파티션)';
+    COMMENT ON TABLE teacher_mentions IS '강사 멘션 및 분석 결과 (게시글 post_date 월별 파티션)';
+    COMMENT ON COLUMN teacher_mentions.mention_type IS 'title(제목), content(본문), comment(댓글)';
+    COMMENT ON COLUMN teacher_mentions.sentiment IS 'POSITIVE(긍정), NEGATIVE(부정), NEUTRAL(중립)';
+    COMMENT ON COLUMN teacher_mentions.difficulty IS 'EASY(쉬움), MEDIUM(보통), HARD(어려움)';
+END $$;
+
+-- 멘션 변경분(전이 테이블)을 일자별로 묶어 집계에 더하거나 뺀다 (멘션의 post_date 사용)
+CREATE OR REPLACE FUNCTION fn_teacher_mention_daily_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            m.post_date::date,
+            -COUNT(*),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            -COUNT(*) FILTER (WHERE m.is_recommended),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            -COALESCE(SUM(m.sentiment_score), 0),
+            -COUNT(m.sentiment_score)
+        FROM old_mentions m
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            m.post_date::date,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            COUNT(*) FILTER (WHERE m.is_recommended),
+            COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            COALESCE(SUM(m.sentiment_score), 0),
+            COUNT(m.sentiment_score)
+        FROM new_mentions m
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 일자 집계 트리거 (파티션 테이블의 문장 트리거는 모든 파티션의 변경분을 전이 테이블로 받음)
+DROP TRIGGER IF EXISTS trg_mention_daily_insert ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_insert
+    AFTER INSERT ON teacher_mentions
+    REFERENCING NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_update ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_update
+    AFTER UPDATE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_delete ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_delete
+    AFTER DELETE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+-- 보관(detach)된 파티션을 옮겨 두는 스키마
+CREATE SCHEMA IF NOT EXISTS archive;
@@ -0,0 +1,13 @@
+-- ============================================
+-- TeacherHub V2.7 - Crawl Log Timing
+-- 크롤링 1회의 대기/작업 시간 (요청별 경과 시간 합, 초)
+-- ============================================
+
+-- 대기: 호스트별 속도 제한, 재시도 백오프, 페이지 내용 준비 대기
+ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS wait_seconds DOUBLE PRECISION;
+
+-- 작업: 요청 처리 시간 중 대기를 뺀 나머지 (이동/전송/파싱)
+ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS work_seconds DOUBLE PRECISION;
+
+COMMENT ON COLUMN crawl_logs.wait_seconds IS '속도 제한/백오프/내용 준비 대기 시간 합 (초, 동시 요청은 각각 합산)';
+COMMENT ON COLUMN crawl_logs.work_seconds IS '요청 처리 시간 중 대기를 제외한 시간 합 (초, 동시 요청은 각각 합산)';
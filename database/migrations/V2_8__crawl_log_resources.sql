@@ -0,0 +1,13 @@
+-- ============================================
+-- TeacherHub V2.8 - Crawl Log Resource Blocking
+-- 크롤링 1회의 브라우저 리소스 차단 집계
+-- ============================================
+
+-- 차단한 요청 수 (이미지/폰트/미디어, 광고/분석 호스트)
+ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS requests_blocked INTEGER;
+
+-- 차단으로 절감한 전송량 (리소스 유형별 평균 크기로 추정)
+ALTER TABLE crawl_logs ADD COLUMN IF NOT EXISTS blocked_bytes_est BIGINT;
+
+COMMENT ON COLUMN crawl_logs.requests_blocked IS '브라우저에서 차단한 요청 수 (HTTP 모드 크롤링은 0)';
+COMMENT ON COLUMN crawl_logs.blocked_bytes_est IS '차단으로 절감한 전송량 추정치 (바이트, 유형별 평균 크기 기준)';
@@ -78,56 +78,67 @@ COMMENT ON TABLE collection_sources IS '데이터 수집 소스 정보';
 
 -- ============================================
 -- 5. 게시글 테이블
+-- posts / comments / teacher_mentions 는 게시글 post_date 기준 월별 RANGE 파티션
+-- (PK/UNIQUE 에 파티션 키 포함, 파티션 생성/보관은 PartitionManager)
 -- ============================================
 CREATE TABLE IF NOT EXISTS posts (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     source_id INTEGER REFERENCES collection_sources(id),
     external_id VARCHAR(100),  -- 원본 게시글 ID
     title VARCHAR(500) NOT NULL,
     content TEXT,
     url VARCHAR(500),
     author VARCHAR(100),
-    post_date TIMESTAMP,
+    post_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- 파티션 키 (없으면 수집 시각)
     view_count INTEGER DEFAULT 0,
     like_count INTEGER DEFAULT 0,
     comment_count INTEGER DEFAULT 0,
+    content_hash VARCHAR(32),  -- 제목+본문+댓글 ID 해시 (재수집 시 변경 여부 판정)
     collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
-    UNIQUE(source_id, external_id)
-);
+    PRIMARY KEY (id, post_date),
+    CONSTRAINT uq_posts_source_external UNIQUE (source_id, external_id, post_date)
+) PARTITION BY RANGE (post_date);
 
-COMMENT ON TABLE posts IS '수집된 게시글';
+COMMENT ON TABLE posts IS '수집된 게시글 (post_date 월별 파티션)';
 
 CREATE INDEX IF NOT EXISTS idx_posts_source ON posts(source_id);
 CREATE INDEX IF NOT EXISTS idx_posts_date ON posts(post_date);
+CREATE INDEX IF NOT EXISTS idx_posts_date_covering ON posts(post_date) INCLUDE (id);
 CREATE INDEX IF NOT EXISTS idx_posts_collected ON posts(collected_at);
 
 -- ============================================
 -- 6. 댓글 테이블
 -- ============================================
 CREATE TABLE IF NOT EXISTS comments (
-    id SERIAL PRIMARY KEY,
-    post_id INTEGER REFERENCES posts(id) ON DELETE CASCADE,
+    id SERIAL,
+    post_id INTEGER,
+    post_date TIMESTAMP NOT NULL,  -- 파티션 키 (게시글 post_date)
     external_id VARCHAR(100),
     content TEXT,
     author VARCHAR(100),
     comment_date TIMESTAMP,
     like_count INTEGER DEFAULT 0,
-    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (id, post_date),
+    FOREIGN KEY (post_id, post_date) REFERENCES posts(id, post_date) ON DELETE CASCADE
+) PARTITION BY RANGE (post_date);
 
-COMMENT ON TABLE comments IS '게시글 댓글';
+COMMENT ON TABLE comments IS '게시글 댓글 (게시글 post_date 월별 파티션)';
 
 CREATE INDEX IF NOT EXISTS idx_comments_post ON comments(post_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_comments_post_external ON comments(post_id, external_id, post_date);
 
 -- ============================================
 -- 7. 강사 멘션 테이블
 -- ============================================
 CREATE TABLE IF NOT EXISTS teacher_mentions (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     teacher_id INTEGER REFERENCES teachers(id) ON DELETE CASCADE,
-    post_id INTEGER REFERENCES posts(id) ON DELETE CASCADE,
-    comment_id INTEGER REFERENCES comments(id) ON DELETE CASCADE,
+    post_id INTEGER,
+    comment_id INTEGER,
+    post_date TIMESTAMP NOT NULL,  -- 파티션 키 (게시글 post_date)
 
     mention_type VARCHAR(20) NOT NULL,  -- title, content, comment
     matched_text VARCHAR(200),  -- 매칭된 텍스트
@@ -141,17 +152,50 @@ CREATE TABLE IF NOT EXISTS teacher_mentions (
 
     analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
-    UNIQUE(teacher_id, post_id, comment_id, mention_type)
-);
+    PRIMARY KEY (id, post_date),
+    FOREIGN KEY (post_id, post_date) REFERENCES posts(id, post_date) ON DELETE CASCADE,
+    FOREIGN KEY (comment_id, post_date) REFERENCES comments(id, post_date) ON DELETE CASCADE,
+    CONSTRAINT uq_mentions_teacher_post_comment_type UNIQUE (teacher_id, post_id, comment_id, mention_type, post_date)
+) PARTITION BY RANGE (post_date);
 
-COMMENT ON TABLE teacher_mentions IS '강사 멘션 및 분석 결과';
+COMMENT ON TABLE teacher_mentions IS '강사 멘션 및 분석 결과 (게시글 post_date 월별 파티션)';
 COMMENT ON COLUMN teacher_mentions.mention_type IS 'title(제목), content(본문), comment(댓글)';
 COMMENT ON COLUMN teacher_mentions.sentiment IS 'POSITIVE(긍정), NEGATIVE(부정), NEUTRAL(중립)';
 COMMENT ON COLUMN teacher_mentions.difficulty IS 'EASY(쉬움), MEDIUM(보통), HARD(어려움)';
 
-CREATE INDEX IF NOT EXISTS idx_mentions_teacher ON teacher_mentions(teacher_id);
+CREATE INDEX IF NOT EXISTS idx_mentions_teacher_post ON teacher_mentions(teacher_id, post_id);
+CREATE INDEX IF NOT EXISTS idx_mentions_teacher_date ON teacher_mentions(teacher_id, post_date);
+CREATE INDEX IF NOT EXISTS idx_mentions_post_date ON teacher_mentions(post_date);
 CREATE INDEX IF NOT EXISTS idx_mentions_post ON teacher_mentions(post_id);
 CREATE INDEX IF NOT EXISTS idx_mentions_analyzed ON teacher_mentions(analyzed_at);
+-- comment_id 가 NULL 인 게시글 단위 멘션은 위 UNIQUE 로 중복이 걸러지지 않으므로 부분 인덱스 추가
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mentions_post_level ON teacher_mentions(teacher_id, post_id, mention_type, post_date)
+    WHERE comment_id IS NULL;
+-- 미분석 멘션 재분석 키셋 스캔
+CREATE INDEX IF NOT EXISTS idx_mentions_unanalyzed ON teacher_mentions(id) WHERE sentiment IS NULL;
+
+-- 이번 달 ~ 3개월 뒤 월 파티션(<테이블>_pYYYYMM) + 범위 밖 행용 DEFAULT 파티션
+DO $$
+DECLARE
+    month_start DATE;
+    parent TEXT;
+BEGIN
+    FOREACH parent IN ARRAY ARRAY['posts', 'comments', 'teacher_mentions'] LOOP
+        month_start := date_trunc('month', CURRENT_DATE)::date;
+        WHILE month_start <= (date_trunc('month', CURRENT_DATE) + INTERVAL '3 months')::date LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                parent || '_p' || to_char(month_start, 'YYYYMM'), parent,
+                month_start, (month_start + INTERVAL '1 month')::date
+            );
+            month_start := (month_start + INTERVAL '1 month')::date;
+        END LOOP;
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+    END LOOP;
+END $$;
+
+-- 보관(detach)된 파티션을 옮겨 두는 스키마
+CREATE SCHEMA IF NOT EXISTS archive;
 
 -- ============================================
 -- 8. 데일리 리포트 테이블
@@ -196,7 +240,7 @@ CREATE TABLE IF NOT EXISTS daily_reports (
 COMMENT ON TABLE daily_reports IS '강사별 데일리 리포트';
 
 CREATE INDEX IF NOT EXISTS idx_reports_date ON daily_reports(report_date);
-CREATE INDEX IF NOT EXISTS idx_reports_teacher ON daily_reports(teacher_id);
+CREATE INDEX IF NOT EXISTS idx_reports_teacher_date ON daily_reports(teacher_id, report_date);
 
 -- ============================================
 -- 9. 학원별 데일리 집계 테이블
@@ -231,6 +275,10 @@ CREATE TABLE IF NOT EXISTS crawl_logs (
     comments_collected INTEGER DEFAULT 0,
     mentions_found INTEGER DEFAULT 0,
     error_message TEXT,
+    wait_seconds DOUBLE PRECISION,  -- 속도 제한/백오프/내용 준비 대기 합
+    work_seconds DOUBLE PRECISION,  -- 요청 처리 시간 중 대기 제외 합
+    requests_blocked INTEGER,  -- 브라우저에서 차단한 요청 수
+    blocked_bytes_est BIGINT,  -- 차단으로 절감한 전송량 추정치 (바이트)
 
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -309,10 +357,149 @@ INSERT INTO analysis_keywords (category, keyword, weight) VALUES
 ON CONFLICT (category, keyword) DO NOTHING;
 
 -- ============================================
--- 뷰: 강사별 최신 통계
+-- 12. 강사 x 일자 멘션 집계 테이블
 -- ============================================
-CREATE OR REPLACE VIEW v_teacher_latest_stats AS
-SELECT
+CREATE TABLE IF NOT EXISTS teacher_mention_daily (
+    teacher_id INTEGER NOT NULL REFERENCES teachers(id) ON DELETE CASCADE,
+    stat_date DATE NOT NULL,  -- 게시글 작성일 (없으면 수집일)
+
+    mention_count INTEGER NOT NULL DEFAULT 0,
+    title_count INTEGER NOT NULL DEFAULT 0,
+    content_count INTEGER NOT NULL DEFAULT 0,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    positive_count INTEGER NOT NULL DEFAULT 0,
+    negative_count INTEGER NOT NULL DEFAULT 0,
+    neutral_count INTEGER NOT NULL DEFAULT 0,
+    recommendation_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_easy_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_medium_count INTEGER NOT NULL DEFAULT 0,
+    difficulty_hard_count INTEGER NOT NULL DEFAULT 0,
+    sentiment_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    sentiment_score_count INTEGER NOT NULL DEFAULT 0,  -- 평균 = sum / count
+
+    PRIMARY KEY (teacher_id, stat_date)
+);
+
+COMMENT ON TABLE teacher_mention_daily IS '강사 x 일자 멘션 집계 (teacher_mentions 트리거로 증분 유지)';
+
+CREATE INDEX IF NOT EXISTS idx_mention_daily_date ON teacher_mention_daily(stat_date);
+
+-- 멘션 변경분(전이 테이블)을 일자별로 묶어 집계에 더하거나 뺀다 (멘션의 post_date 사용)
+CREATE OR REPLACE FUNCTION fn_teacher_mention_daily_sync() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            m.post_date::date,
+            -COUNT(*),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            -COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            -COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            -COUNT(*) FILTER (WHERE m.is_recommended),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            -COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            -COALESCE(SUM(m.sentiment_score), 0),
+            -COUNT(m.sentiment_score)
+        FROM old_mentions m
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO teacher_mention_daily AS d (
+            teacher_id, stat_date, mention_count, title_count, content_count, comment_count,
+            positive_count, negative_count, neutral_count, recommendation_count,
+            difficulty_easy_count, difficulty_medium_count, difficulty_hard_count,
+            sentiment_score_sum, sentiment_score_count
+        )
+        SELECT
+            m.teacher_id,
+            m.post_date::date,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE m.mention_type = 'title'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'content'),
+            COUNT(*) FILTER (WHERE m.mention_type = 'comment'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'POSITIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEGATIVE'),
+            COUNT(*) FILTER (WHERE m.sentiment = 'NEUTRAL'),
+            COUNT(*) FILTER (WHERE m.is_recommended),
+            COUNT(*) FILTER (WHERE m.difficulty = 'EASY'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'MEDIUM'),
+            COUNT(*) FILTER (WHERE m.difficulty = 'HARD'),
+            COALESCE(SUM(m.sentiment_score), 0),
+            COUNT(m.sentiment_score)
+        FROM new_mentions m
+        WHERE m.teacher_id IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (teacher_id, stat_date) DO UPDATE SET
+            mention_count = d.mention_count + EXCLUDED.mention_count,
+            title_count = d.title_count + EXCLUDED.title_count,
+            content_count = d.content_count + EXCLUDED.content_count,
+            comment_count = d.comment_count + EXCLUDED.comment_count,
+            positive_count = d.positive_count + EXCLUDED.positive_count,
+            negative_count = d.negative_count + EXCLUDED.negative_count,
+            neutral_count = d.neutral_count + EXCLUDED.neutral_count,
+            recommendation_count = d.recommendation_count + EXCLUDED.recommendation_count,
+            difficulty_easy_count = d.difficulty_easy_count + EXCLUDED.difficulty_easy_count,
+            difficulty_medium_count = d.difficulty_medium_count + EXCLUDED.difficulty_medium_count,
+            difficulty_hard_count = d.difficulty_hard_count + EXCLUDED.difficulty_hard_count,
+            sentiment_score_sum = d.sentiment_score_sum + EXCLUDED.sentiment_score_sum,
+            sentiment_score_count = d.sentiment_score_count + EXCLUDED.sentiment_score_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 전이 테이블은 이벤트별 트리거로만 선언 가능 (문장 단위 1회 실행)
+DROP TRIGGER IF EXISTS trg_mention_daily_insert ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_insert
+    AFTER INSERT ON teacher_mentions
+    REFERENCING NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_update ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_update
+    AFTER UPDATE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions NEW TABLE AS new_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+DROP TRIGGER IF EXISTS trg_mention_daily_delete ON teacher_mentions;
+CREATE TRIGGER trg_mention_daily_delete
+    AFTER DELETE ON teacher_mentions
+    REFERENCING OLD TABLE AS old_mentions
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_teacher_mention_daily_sync();
+
+-- ============================================
+-- 구체화 뷰: 강사별 최신 통계 / 학원별 강사 랭킹
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY 용 유니크 인덱스 포함
+-- ============================================
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_teacher_latest_stats AS
+SELECT DISTINCT ON (t.id)
     t.id AS teacher_id,
     t.name AS teacher_name,
     a.name AS academy_name,
@@ -328,14 +515,12 @@ SELECT
 FROM teachers t
 LEFT JOIN academies a ON t.academy_id = a.id
 LEFT JOIN subjects s ON t.subject_id = s.id
-LEFT JOIN daily_reports dr ON t.id = dr.teacher_id
-WHERE dr.report_date = (SELECT MAX(report_date) FROM daily_reports WHERE teacher_id = t.id)
-ORDER BY dr.mention_count DESC NULLS LAST;
+JOIN daily_reports dr ON t.id = dr.teacher_id
+ORDER BY t.id, dr.report_date DESC;
 
--- ============================================
--- 뷰: 학원별 강사 랭킹
--- ============================================
-CREATE OR REPLACE VIEW v_academy_teacher_ranking AS
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_teacher_latest_stats ON mv_teacher_latest_stats(teacher_id);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_academy_teacher_ranking AS
 SELECT
     a.id AS academy_id,
     a.name AS academy_name,
@@ -350,5 +535,15 @@ JOIN teachers t ON a.id = t.academy_id
 LEFT JOIN subjects s ON t.subject_id = s.id
 LEFT JOIN daily_reports dr ON t.id = dr.teacher_id
 WHERE dr.report_date >= CURRENT_DATE - INTERVAL '30 days'
-GROUP BY a.id, a.name, t.id, t.name, s.name
-ORDER BY a.name, mention_rank;
+GROUP BY a.id, a.name, t.id, t.name, s.name;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_academy_teacher_ranking ON mv_academy_teacher_ranking(academy_id, teacher_id);
+
+-- 기존 뷰 이름은 구체화 뷰 조회로 유지
+CREATE OR REPLACE VIEW v_teacher_latest_stats AS
+SELECT * FROM mv_teacher_latest_stats
+ORDER BY mention_count DESC NULLS LAST;
+
+CREATE OR REPLACE VIEW v_academy_teacher_ranking AS
+SELECT * FROM mv_academy_teacher_ranking
+ORDER BY academy_name, mention_rank;